@@ -1,6 +1,12 @@
+# Internal
+import typing as T
+
+
 class Base:
     """Defines default string representation for objects"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return f"{type(self).__qualname__}"
 
@@ -11,10 +17,23 @@ class Base:
                 ", ".join(
                     [
                         f"{key}={repr(val)}"
-                        for key, val in vars(self).items()
+                        for key, val in _attributes(self)
                         if not key.startswith("_")
                     ]
                 )
             )
             + ">"
         )
+
+
+def _attributes(obj: object) -> T.Iterator[T.Tuple[str, T.Any]]:
+    """Iterate over object attributes, stored in slots or in the instance dict."""
+    for cls in reversed(type(obj).__mro__):
+        slots = cls.__dict__.get("__slots__", ())
+        for key in (slots,) if isinstance(slots, str) else slots:
+            try:
+                yield key, getattr(obj, key)
+            except AttributeError:
+                pass  # Slot not assigned
+
+    yield from getattr(obj, "__dict__", {}).items()
@@ -14,14 +14,18 @@ class Loopable(object):
         """Loopable constructor.
 
         Arguments:
-            loop: Existing asyncio loop to be used.
+            loop: Existing asyncio loop to be used. Defaults to the current
+                event loop, retrieved when first needed.
             kwargs: Keyword parameters for super.
         """
         super().__init__(**kwargs)  # type: ignore
 
-        self._loop = get_event_loop() if loop is None else loop
+        self._loop = loop
 
     @property
     def loop(self) -> AbstractEventLoop:
         """Public access to loop."""
+        if self._loop is None:
+            self._loop = get_event_loop()
+
         return self._loop
@@ -32,7 +32,10 @@ class Observable(T.Generic[K], Base, metaclass=ABCMeta):
         super().__init__(**kwargs)  # type: ignore
 
     def __or__(self, other: T.Callable[["Observable[K]"], "Observable[J]"]) -> "Observable[J]":
-        return other(self)
+        from ..operator.fused import fuse
+
+        # Adjacent synchronous operators are merged into a single step
+        return fuse(other(self))
 
     def __gt__(self, observer: Observer[K, T.Any]) -> Disposable:
         return observe(self, observer)
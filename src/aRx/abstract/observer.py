@@ -30,7 +30,15 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
 
     """
 
-    __slots__ = ("keep_alive", "_close_guard", "_close_promise")
+    __slots__ = (
+        "keep_alive",
+        "_demand",
+        "_close_guard",
+        "_demand_waiter",
+        "_close_listeners",
+        "_propagation_count",
+        "_propagation_guard",
+    )
 
     def __init__(self, *, keep_alive: bool = False, **kwargs: T.Any) -> None:
         """Observer constructor.
@@ -43,11 +51,21 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
         self.keep_alive = keep_alive
 
         # Internal
+        self._demand: T.Optional[int] = None
         self._close_guard = False
-        self._close_promise = self.lastly(self.aclose)
+        self._demand_waiter: T.Optional["Future[None]"] = None
+        self._close_listeners: T.Optional[T.List[T.Callable[[], T.Any]]] = None
         self._propagation_count = 0
         self._propagation_guard: T.Optional[Future[None]] = None
 
+    def __init_subclass__(cls, **kwargs: T.Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore
+
+        # Subclasses that customize data processing without knowing about
+        # batches must receive batches value by value.
+        if "__asend__" in cls.__dict__ and "__asend_batch__" not in cls.__dict__:
+            cls.__asend_batch__ = Observer.__asend_batch__  # type: ignore
+
     @abstractmethod
     async def __asend__(self, value: K) -> None:
         """Processing of input data.
@@ -61,6 +79,19 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
         """
         raise NotImplemented()
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        """Processing of a batch of input data.
+
+        Default implementation processes each value with :meth:`__asend__`.
+        Observers can override it to process the whole batch at once, as long
+        as the outcome is the same as processing each value individually.
+
+        Arguments:
+            values: Received data.
+
+        """
+        await self._asend_each(values)
+
     @abstractmethod
     async def __araise__(self, ex: Exception) -> bool:
         """Processing of input exceptions.
@@ -88,6 +119,18 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
         """Close stream when disposed"""
         await self.aclose()
 
+    def _sync_sender(self) -> T.Optional[T.Callable[[K], None]]:
+        """Function that processes input data synchronously, if available.
+
+        Sources that know the whole pipeline is synchronous use it to deliver
+        data without going through :meth:`asend`.
+
+        Returns:
+            Function with the same effect as :meth:`__asend__`, or None.
+
+        """
+        return None
+
     @contextmanager
     def _propagating(self) -> T.Generator[None, None, None]:
         self._propagation_count += 1
@@ -96,13 +139,83 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
             yield
         finally:
             self._propagation_count -= 1
-            if self._propagation_guard and self._propagation_count == 0:
-                self._propagation_guard.set_result(None)
+            guard = self._propagation_guard
+            if guard and not guard.done() and self._propagation_count == 0:
+                guard.set_result(None)
+
+    @property
+    def _fut(self) -> "Future[J]":
+        future = self._future
+        if future is None:
+            future = super()._fut
+
+            # Close once settled, even when the future is cancelled directly, like by wait_for
+            future.add_done_callback(self._on_settled)
+
+        return future
+
+    def _on_settled(self, _: "Future[J]") -> None:
+        self._close_soon()
 
     @property
     def closed(self) -> bool:
-        """Property that indicates if this observer is closed or not."""
-        return self.done() or self._close_promise.done() or self._close_guard
+        """Property that indicates if this observer is closed or not.
+
+        Observer is closed as soon as its future is settled or cancelled, even
+        before the close procedure runs.
+        """
+        return self._close_guard or self.done()
+
+    @property
+    def demand(self) -> T.Optional[int]:
+        """Amount of data this observer still requested, None if it isn't limited.
+
+        See: :meth:`request`
+        """
+        return self._demand
+
+    def request(self, n: T.Optional[int]) -> None:
+        """Signal upstream that this observer wants more data.
+
+        Observers start accepting any amount of data. Once this is called,
+        sources that honour demand, and the streams and operators in between,
+        only deliver as much data as requested, pausing upstream work
+        meanwhile. Call it before subscribing to limit data from the start.
+
+        Arguments:
+            n: Amount of additional data requested. Zero pauses delivery, and
+                None removes any limit.
+
+        Raises:
+            ValueError: If n is negative.
+
+        """
+        if n is None:
+            self._demand = None
+        elif n < 0:
+            raise ValueError("Requested amount must not be negative")
+        else:
+            self._demand = n if self._demand is None else self._demand + n
+
+        if self._demand != 0:
+            self._wake_demand()
+
+    def _demanded(self) -> "Future[None]":
+        """Future resolved as soon as demand increases or observer starts closing."""
+        if self._demand_waiter is None or self._demand_waiter.done():
+            self._demand_waiter = self.loop.create_future()
+
+        return self._demand_waiter
+
+    def _wake_demand(self) -> None:
+        waiter, self._demand_waiter = self._demand_waiter, None
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+    def _consume(self, amount: int) -> None:
+        """Discount delivered data from demand."""
+        if self._demand:
+            self._demand = max(self._demand - amount, 0)
 
     async def asend(self, data: K) -> None:
         """Interface thought which data is inputted.
@@ -117,6 +230,9 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
         if self.closed:
             raise ObserverClosedError(self)
 
+        if self._demand:
+            self._demand -= 1
+
         with self._propagating():
             awaitable = self.__asend__(data)
 
@@ -128,10 +244,62 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
             except CancelledError:
                 raise  # Cancelled errors are not redirected
             except Exception as ex:
-                if not self.closed:
-                    await self.araise(ex)
-                else:
-                    raise RuntimeError(f"{self} closed with a pending Exception") from ex
+                await self._redirect(ex)
+
+    async def asend_batch(self, values: T.Sequence[K]) -> None:
+        """Interface thought which multiple data are inputted at once.
+
+        Arguments:
+            values: Data to be inputted, in order.
+
+        Raises:
+            ObserverClosedError: If observer is closed.
+
+        """
+        if not values:
+            return
+
+        if self.closed:
+            raise ObserverClosedError(self)
+
+        if self._demand:
+            self._consume(len(values))
+
+        with self._propagating():
+            awaitable = self.__asend_batch__(values)
+
+            # Remove reference early to avoid keeping large objects in memory
+            del values
+
+            try:
+                await awaitable
+            except CancelledError:
+                raise  # Cancelled errors are not redirected
+            except Exception as ex:
+                await self._redirect(ex)
+
+    async def _asend_each(self, values: T.Sequence[K]) -> None:
+        """Process a batch value by value, as if each one was sent individually."""
+        for value in values:
+            if self.closed:
+                break
+
+            try:
+                await self.__asend__(value)
+            except CancelledError:
+                raise  # Cancelled errors are not redirected
+            except Exception as ex:
+                if self.closed:
+                    raise
+
+                await self.araise(ex)
+
+    async def _redirect(self, ex: Exception) -> None:
+        """Redirect an exception raised while processing data to :meth:`araise`."""
+        if not self.closed:
+            await self.araise(ex)
+        else:
+            raise RuntimeError(f"{self} closed with a pending Exception") from ex
 
     async def araise(self, main_exc: Exception) -> None:
         """Interface thought which exceptions are inputted.
@@ -165,10 +333,36 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
                     self.reject(main_exc)
                 except InvalidStateError as exc:
                     raise RuntimeError(f"{self} closed with a pending Exception") from exc
-                else:
-                    # Wait till aclose starts executing
-                    with suppress(CancelledError):
-                        await self._close_promise
+
+    def resolve(self, result: J) -> None:
+        """See: :meth:`~aRx.abstract.promise.Promise.resolve` for more information.
+
+        Observer closes once resolved.
+
+        """
+        super().resolve(result)
+        self._close_soon()
+
+    def reject(self, error: Exception) -> None:
+        """See: :meth:`~aRx.abstract.promise.Promise.reject` for more information.
+
+        Observer closes once rejected.
+
+        """
+        super().reject(error)
+        self._close_soon()
+
+    def cancel(self) -> bool:
+        """See: :meth:`~aRx.abstract.promise.Promise.cancel` for more information.
+
+        Observer closes once cancelled.
+
+        """
+        cancelled = super().cancel()
+        if cancelled:
+            self._close_soon()
+
+        return cancelled
 
     async def aclose(self) -> bool:
         """Close observer.
@@ -177,16 +371,80 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
             Boolean indicating if close executed or if it wasn't necessary.
 
         """
+        if not self._start_close():
+            return False
+
+        await self._finish_close()
+
+        return True
+
+    def _close_soon(self) -> bool:
+        """Close observer from inside its own data processing.
+
+        Awaiting :meth:`aclose` while propagating data would wait forever for
+        that same propagation to end. Instead, the observer is marked as closed
+        right away and the rest of the close procedure runs as soon as all
+        propagations are over.
+
+        Returns:
+            Boolean indicating if close was scheduled or if it wasn't necessary.
+
+        """
+        if not self._start_close():
+            return False
+
+        self.loop.create_task(self._finish_close())
+
+        return True
+
+    def _add_close_listener(self, listener: T.Callable[[], T.Any]) -> None:
+        """Register a callback to be called as soon as this observer starts closing.
+
+        Unlike :meth:`lastly`, listeners are called synchronously, before the
+        close procedure finishes. If the observer is already closed, the
+        listener is called right away.
+
+        Arguments:
+            listener: Callback, no argument is passed to it.
+
+        """
+        if self._close_guard:
+            listener()
+        elif self._close_listeners is None:
+            self._close_listeners = [listener]
+        else:
+            self._close_listeners.append(listener)
+
+    def _remove_close_listener(self, listener: T.Callable[[], T.Any]) -> None:
+        """Unregister a callback added by :meth:`_add_close_listener`, if still registered.
+
+        Arguments:
+            listener: Callback to be removed.
+
+        """
+        if self._close_listeners:
+            with suppress(ValueError):
+                self._close_listeners.remove(listener)
+
+    def _start_close(self) -> bool:
         # Guard against repeated calls
         if self._close_guard:
             return False
 
-        # This is necessary due to the uncertain timing of promise cancellation
         self._close_guard = True
 
-        # Cancel close promise
-        self._close_promise.cancel()
+        # Push close state to listeners, like upstream streams
+        listeners, self._close_listeners = self._close_listeners, None
+        if listeners:
+            for listener in listeners:
+                listener()
 
+        # Release sources waiting for demand
+        self._wake_demand()
+
+        return True
+
+    async def _finish_close(self) -> None:
         # Wait remaining propagations
         if self._propagation_count > 0:
             self._propagation_guard = self.loop.create_future()
@@ -201,5 +459,3 @@ class Observer(T.Generic[K, J], Promise[J], Disposable, metaclass=ABCMeta):
                 self.loop.call_exception_handler(
                     {"message": f"{self}: Failed to finalized correctly and had to be cancelled"}
                 )
-
-        return True
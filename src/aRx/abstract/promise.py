@@ -23,7 +23,7 @@ class Promise(T.Awaitable[K], Base, Loopable, metaclass=ABCMeta):
         maintained.
     """
 
-    __slots__ = ("_fut",)
+    __slots__ = ("_future",)
 
     def __init__(
         self,
@@ -38,21 +38,30 @@ class Promise(T.Awaitable[K], Base, Loopable, metaclass=ABCMeta):
 
         """
         # Retrieve loop from awaitable if available
-        if kwargs.get("loop", None) is None and (
-            isfuture(awaitable) or isinstance(awaitable, Loopable)
-        ):
-            kwargs["loop"] = getattr(awaitable, "_loop", None)
+        if kwargs.get("loop", None) is None:
+            if isinstance(awaitable, Loopable):
+                kwargs["loop"] = awaitable.loop
+            elif isfuture(awaitable):
+                kwargs["loop"] = getattr(awaitable, "_loop", None)
 
         super().__init__(**kwargs)
 
         # Internal
-        self._fut: "Future[K]" = ensure_future(
+        self._future: T.Optional["Future[K]"] = ensure_future(
             awaitable, loop=self.loop
-        ) if awaitable else self.loop.create_future()
+        ) if awaitable else None
 
     def __await__(self) -> T.Generator[T.Any, None, K]:
         return self._fut.__await__()
 
+    @property
+    def _fut(self) -> "Future[K]":
+        """Underlining future, only allocated when first needed."""
+        if self._future is None:
+            self._future = self.loop.create_future()
+
+        return self._future
+
     def done(self) -> bool:
         """Check if promise is done.
 
@@ -60,7 +69,7 @@ class Promise(T.Awaitable[K], Base, Loopable, metaclass=ABCMeta):
             Boolean indicating if promise is done or not.
 
         """
-        return self._fut.done()
+        return self._future is not None and self._future.done()
 
     def cancel(self) -> bool:
         """Cancel the promise and the underlining future.
@@ -78,7 +87,7 @@ class Promise(T.Awaitable[K], Base, Loopable, metaclass=ABCMeta):
             Boolean indicating if promise is cancelled or not.
 
         """
-        return self._fut.cancelled()
+        return self._future is not None and self._future.cancelled()
 
     def resolve(self, result: K) -> None:
         """Resolve Promise with given value.
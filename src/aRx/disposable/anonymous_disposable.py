@@ -19,6 +19,8 @@ class AnonymousDisposable(Disposable):
     optional and anonymous function.
     """
 
+    __slots__ = ("_adispose",)
+
     def __init__(self, dispose: T.Optional[T.Callable[[], T.Any]] = None, **kwargs: T.Any) -> None:
         """AnonymousDisposable constructor.
 
@@ -10,6 +10,8 @@ from ..abstract.disposable import Disposable, adispose
 class CompositeDisposable(Disposable):
     """A disposable that is a composition of various disposable."""
 
+    __slots__ = ("_disposables",)
+
     @staticmethod
     def _validate_mapper(disposable: Disposable) -> bool:
         return isinstance(disposable, Disposable)
@@ -4,6 +4,8 @@ __all__ = (
     "ObserverClosedError",
     "SingleStreamError",
     "MultiStreamError",
+    "ShardWorkerError",
+    "BufferOverflowError",
 )
 
 
@@ -44,3 +46,15 @@ class MultiStreamError(ARxError):
     """aRx error exclusive to :class:`~aRx.stream.multi_stream.MultiStream`."""
 
     pass
+
+
+class BufferOverflowError(ARxError):
+    """aRx error for data that arrives at a full bounded queue with the raise policy."""
+
+    pass
+
+
+class ShardWorkerError(ARxError):
+    """aRx error for a :class:`~aRx.operator.shard.Shard` worker that stopped unexpectedly."""
+
+    pass
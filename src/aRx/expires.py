@@ -25,6 +25,8 @@ Number = T.Union[int, float]
 
 # noinspection PyPep8Naming
 class auto_timeout:
+    __slots__ = ("min", "max", "step", "timeout", "threshold")
+
     def __init__(
         self,
         min: float,
@@ -123,6 +125,8 @@ class expires(T.ContextManager["expires"], Loopable):
     ...         await r.text()
     """
 
+    __slots__ = ("_task", "_expired", "_timeout", "_suppress", "_expire_at", "_cancel_handler")
+
     def __init__(
         self,
         timeout: T.Optional[T.Union[float, auto_timeout]],
@@ -0,0 +1,27 @@
+__all__ = ("wait_demand",)
+
+# Internal
+import typing as T
+from asyncio import FIRST_COMPLETED, Future, wait
+
+# Project
+from ..abstract.observer import Observer
+
+
+async def wait_demand(
+    observer: Observer[T.Any, T.Any], stop: T.Optional["Future[T.Any]"] = None
+) -> None:
+    """Wait until observer requests data, closes or stop is resolved.
+
+    Arguments:
+        observer: Observer whose demand is awaited.
+        stop: Future that interrupts the wait once resolved.
+
+    """
+    while observer.demand == 0 and not observer.closed:
+        if stop is None:
+            await observer._demanded()
+        elif stop.done():
+            break
+        else:
+            await wait((observer._demanded(), stop), return_when=FIRST_COMPLETED)
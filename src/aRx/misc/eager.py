@@ -0,0 +1,58 @@
+__all__ = ("eager",)
+
+# Internal
+import typing as T
+from types import coroutine
+from asyncio import Future, AbstractEventLoop
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+@coroutine
+def _resume(coro: T.Coroutine[T.Any, T.Any, K], yielded: T.Any) -> T.Generator[T.Any, T.Any, K]:
+    """Resume a coroutine already executed until its first suspension.
+
+    Same as ``yield from coro``, but starting from an already yielded value.
+    """
+    while True:
+        try:
+            value = yield yielded
+        except GeneratorExit:
+            coro.close()
+            raise
+        except BaseException as exc:
+            try:
+                yielded = coro.throw(exc)
+            except StopIteration as stop:
+                return T.cast(K, stop.value)
+        else:
+            try:
+                yielded = coro.send(value)
+            except StopIteration as stop:
+                return T.cast(K, stop.value)
+
+
+def eager(
+    coro: T.Coroutine[T.Any, T.Any, K], loop: AbstractEventLoop
+) -> T.Optional["Future[K]"]:
+    """Execute coroutine synchronously until it finishes or suspends for the first time.
+
+    Arguments:
+        coro: Coroutine to be executed.
+        loop: Loop where the remaining of the coroutine is scheduled, if it suspends.
+
+    Raises:
+        Exception: Any exception raised by the coroutine before suspending.
+
+    Returns:
+        None if the coroutine finished synchronously, its result is discarded. Otherwise a
+        :class:`~asyncio.Task` executing the remaining of the coroutine.
+
+    """
+    try:
+        yielded = coro.send(None)
+    except StopIteration:
+        return None
+
+    return loop.create_task(_resume(coro, yielded))
@@ -0,0 +1,254 @@
+__all__ = ("Mailbox",)
+
+# Internal
+import typing as T
+from asyncio import FIRST_COMPLETED, Task, Future, CancelledError, wait
+from collections import deque
+
+# Project
+from ..error import BufferOverflowError, ObserverClosedError
+from ..overflow import Lag, Overflow
+from .current_task import current_task
+from ..abstract.observer import Observer
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Mailbox(T.Generic[K]):
+    """Bounded queue that delivers data to an observer from its own task.
+
+    Data queued while the observer is busy is delivered at once, as a batch.
+    """
+
+    __slots__ = (
+        "_task",
+        "_size",
+        "_queue",
+        "_space",
+        "_ready",
+        "_closing",
+        "_dropped",
+        "_maxsize",
+        "_stopped",
+        "_observer",
+        "_overflow",
+        "_disconnect",
+    )
+
+    def __init__(
+        self,
+        observer: Observer[K, T.Any],
+        maxsize: int,
+        overflow: Overflow,
+        disconnect: T.Callable[[], T.Any],
+    ) -> None:
+        """Mailbox constructor.
+
+        Arguments:
+            observer: Observer to deliver data to.
+            maxsize: Maximum amount of data waiting to be delivered.
+            overflow: Policy applied when data arrives and the queue is full.
+            disconnect: Callback for the :attr:`~.Overflow.DISCONNECT` policy.
+
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        self._size = 0
+        self._queue: T.Deque[T.Tuple[bool, T.Any]] = deque()
+        self._space: T.Optional["Future[None]"] = None
+        self._ready: T.Optional["Future[None]"] = None
+        self._closing = False
+        self._dropped = 0
+        self._maxsize = maxsize
+        self._stopped = False
+        self._observer = observer
+        self._overflow = overflow
+        self._disconnect = disconnect
+
+        self._task: "Task[None]" = observer.loop.create_task(self._drain())
+
+    def __len__(self) -> int:
+        # Queued errors don't take space from data
+        return self._size
+
+    @property
+    def lag(self) -> Lag:
+        """Current counters of this mailbox."""
+        return Lag(self._size, self._dropped)
+
+    def offer(self, value: K) -> bool:
+        """Enqueue value, applying the overflow policy if the queue is full.
+
+        Arguments:
+            value: Data to be delivered.
+
+        Raises:
+            BufferOverflowError: If the queue is full, with :attr:`~.Overflow.RAISE`.
+
+        Returns:
+            False if value must wait for space, only possible with :attr:`~.Overflow.BLOCK`.
+
+        """
+        if self._stopped:
+            return True
+
+        queue = self._queue
+        if self._size >= self._maxsize:
+            overflow = self._overflow
+            if overflow is Overflow.BLOCK:
+                return False
+
+            self._dropped += 1
+            if overflow is Overflow.RAISE:
+                raise BufferOverflowError(f"Queue is full, maxsize is {self._maxsize}")
+
+            if overflow is Overflow.DROP_NEWEST:
+                return True
+
+            if overflow is Overflow.DISCONNECT:
+                self.stop()
+                self._disconnect()
+                return True
+
+            if queue[0][0]:
+                # Errors are never discarded, the oldest data queued after them is instead
+                index = next(index for index, (is_error, _) in enumerate(queue) if not is_error)
+                del queue[index]
+            else:
+                queue.popleft()
+
+            self._size -= 1
+
+        queue.append((False, value))
+        self._size += 1
+        self._wake()
+
+        return True
+
+    async def put(self, value: K) -> None:
+        """Enqueue value, waiting for space if necessary.
+
+        Arguments:
+            value: Data to be delivered.
+
+        """
+        while not self.offer(value):
+            if self._space is None:
+                self._space = self._observer.loop.create_future()
+
+            await self._space
+
+    def put_error(self, exc: Exception) -> None:
+        """Enqueue exception, errors are never discarded due to overflow.
+
+        Consecutive :class:`~.BufferOverflowError` are coalesced into the one
+        already queued, so a consumer that can't keep up doesn't grow the
+        queue with them. :attr:`lag` still counts every discarded data.
+
+        Arguments:
+            exc: Exception to be delivered.
+
+        """
+        if self._stopped:
+            return
+
+        queue = self._queue
+        if isinstance(exc, BufferOverflowError) and queue:
+            is_error, last = queue[-1]
+            if is_error and isinstance(last, BufferOverflowError):
+                return
+
+        queue.append((True, exc))
+        self._wake()
+
+    def close(self) -> None:
+        """Deliver remaining data, then close observer.
+
+        See: :meth:`wait_closed`
+        """
+        self._closing = True
+        self._wake()
+
+    async def wait_closed(self) -> None:
+        """Wait until delivery ends, after :meth:`close` or :meth:`stop`."""
+        task = self._task
+        if task is not current_task(self._observer.loop):
+            await wait((task,))
+
+    def stop(self) -> None:
+        """Discard remaining data and stop delivering."""
+        self._stopped = True
+        self._queue.clear()
+        self._size = 0
+        self._wake()
+        self._release()
+
+        # Delivery in progress is interrupted, unless stop comes from inside it
+        if self._task is not current_task(self._observer.loop):
+            self._task.cancel()
+
+    def _wake(self) -> None:
+        if self._ready and not self._ready.done():
+            self._ready.set_result(None)
+
+    def _release(self) -> None:
+        space, self._space = self._space, None
+        if space and not space.done():
+            space.set_result(None)
+
+    async def _drain(self) -> None:
+        queue, observer = self._queue, self._observer
+
+        try:
+            while not (self._stopped or observer.closed):
+                if not queue:
+                    if self._closing:
+                        break
+
+                    self._ready = observer.loop.create_future()
+                    await self._ready
+                    self._ready = None
+                    continue
+
+                demand = observer.demand
+                if demand == 0 and not queue[0][0]:
+                    # Wait for observer to request data, or for the mailbox to change
+                    self._ready = observer.loop.create_future()
+                    await wait((self._ready, observer._demanded()), return_when=FIRST_COMPLETED)
+                    self._ready = None
+                    continue
+
+                is_error, data = queue.popleft()
+                if is_error:
+                    self._release()
+                    await observer.araise(data)
+                    continue
+
+                # Everything queued up to the next error is delivered at once, up to demand
+                values = [data]
+                while queue and not queue[0][0] and (demand is None or len(values) < demand):
+                    values.append(queue.popleft()[1])
+
+                self._size -= len(values)
+                self._release()
+                await observer.asend_batch(values)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del values, data
+        except ObserverClosedError:
+            return
+        except CancelledError:
+            raise
+        except Exception as exc:
+            # Delivery can't continue, the error is handed to observer instead of being lost
+            self.stop()
+            if not observer.closed:
+                await observer.araise(exc)
+            if not (observer.closed or observer.keep_alive):
+                await observer.aclose()
+            return
+
+        if not (self._stopped or observer.closed or observer.keep_alive):
+            await observer.aclose()
@@ -0,0 +1,14 @@
+__all__ = ("DROP", "STOP", "Stage", "StageFactory")
+
+# Internal
+import typing as T
+
+#: Function applied synchronously to each value flowing through a stream.
+Stage = T.Callable[[T.Any], T.Any]
+#: Function that creates a new stage, with its own state, for each subscription.
+StageFactory = T.Callable[[], Stage]
+
+#: Returned by a stage when the value must not proceed.
+DROP = object()
+#: Returned by a stage when the stream must be closed, without outputting the value.
+STOP = object()
@@ -12,6 +12,8 @@ from ..abstract.observable import Observable
 class Empty(Observable[None]):
     """Observable that doesn't output data and closes any observer as soon as possible."""
 
+    __slots__ = ()
+
     def __observe__(self, observer: Observer[T.Any, T.Any]) -> AnonymousDisposable:
         if not (observer.closed or observer.keep_alive):
             observer.loop.create_task(observer.aclose())
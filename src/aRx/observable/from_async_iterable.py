@@ -3,11 +3,13 @@ __all__ = ("FromAsyncIterable",)
 
 # Internal
 import typing as T
-from asyncio import FIRST_COMPLETED, Future, CancelledError, wait
+from asyncio import FIRST_COMPLETED, Queue, Future, CancelledError, InvalidStateError, wait
+from contextlib import suppress
 from collections.abc import AsyncGenerator
 
 # Project
 from ..disposable import AnonymousDisposable
+from ..misc.demand import wait_demand
 from ..abstract.observer import Observer
 from ..abstract.observable import Observable
 
@@ -18,33 +20,107 @@ K = T.TypeVar("K")
 class FromAsyncIterable(Observable[K]):
     """Observable that uses an async iterable as data source."""
 
+    __slots__ = ("_prefetch", "_async_iterator")
+
     @staticmethod
-    async def _worker(
-        async_iterator: T.AsyncIterator[K], observer: Observer[K, T.Any], stop: "Future[None]"
+    async def _fetch(
+        async_iterator: T.AsyncIterator[K],
+        observer: Observer[K, T.Any],
+        stop: "Future[None]",
+        queue: "Queue[T.Tuple[bool, T.Any]]",
     ) -> None:
-        pending = None
-
         try:
-            async for data in async_iterator:
-                if observer.closed:
+            while not (stop.done() or observer.closed):
+                # Don't read ahead of what observer requested
+                demand = observer.demand
+                if demand is not None and queue.qsize() >= demand:
+                    await wait((observer._demanded(), stop), return_when=FIRST_COMPLETED)
+                    continue
+
+                try:
+                    data = await async_iterator.__anext__()
+                except StopAsyncIteration:
                     break
 
-                pending = None
-                (done,), (pending,) = await wait(
-                    (observer.asend(data), stop), return_when=FIRST_COMPLETED
-                )
+                await queue.put((False, data))
 
-                if observer.closed or done is stop:
-                    break
+                # Remove reference early to avoid keeping large objects in memory
+                del data
+        except CancelledError:
+            raise
+        except Exception as exc:
+            await queue.put((True, exc))
+        else:
+            await queue.put((True, None))
+
+    @staticmethod
+    async def _deliver_prefetched(
+        async_iterator: T.AsyncIterator[K],
+        observer: Observer[K, T.Any],
+        stop: "Future[None]",
+        prefetch: int,
+    ) -> None:
+        queue: "Queue[T.Tuple[bool, T.Any]]" = Queue(prefetch)
+        fetcher = observer.loop.create_task(
+            FromAsyncIterable._fetch(async_iterator, observer, stop, queue)
+        )
+
+        try:
+            while not (stop.done() or observer.closed):
+                is_error, data = await queue.get()
+                if is_error:
+                    if data is None:
+                        break  # Async iterator is exhausted
+
+                    raise data
+
+                # Next data is read while this one is delivered
+                await observer.asend(data)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del data
+        finally:
+            if not fetcher.done():
+                fetcher.cancel()
+
+            # Async iterator must be idle before it can be closed
+            await wait((fetcher,))
+
+    @staticmethod
+    async def _worker(
+        async_iterator: T.AsyncIterator[K],
+        observer: Observer[K, T.Any],
+        stop: "Future[None]",
+        prefetch: int,
+    ) -> None:
+        try:
+            if prefetch > 0:
+                await FromAsyncIterable._deliver_prefetched(
+                    async_iterator, observer, stop, prefetch
+                )
+            else:
+                while not (stop.done() or observer.closed):
+                    # Async iterator is only read when observer wants data
+                    if observer.demand == 0:
+                        await wait_demand(observer, stop)
+                        continue
+
+                    try:
+                        data = await async_iterator.__anext__()
+                    except StopAsyncIteration:
+                        break
+
+                    if stop.done() or observer.closed:
+                        break
+
+                    # Data is delivered directly, stop is only checked in between sends
+                    await observer.asend(data)
         except CancelledError:
             raise
         except Exception as exc:
             if not observer.closed:
                 await observer.araise(exc)
 
-        if pending and pending is not stop:
-            await pending
-
         if isinstance(async_iterator, AsyncGenerator):
             # Ensure async_generator gets closed
             await async_iterator.aclose()
@@ -52,17 +128,29 @@ class FromAsyncIterable(Observable[K]):
         if not (observer.closed or observer.keep_alive):
             await observer.aclose()
 
-    def __init__(self, async_iterable: T.AsyncIterable[K], **kwargs: T.Any) -> None:
+    def __init__(
+        self, async_iterable: T.AsyncIterable[K], prefetch: int = 0, **kwargs: T.Any
+    ) -> None:
         """FromAsyncIterable constructor.
 
         Arguments:
             async_iterable: AsyncIterable to be iterated.
+            prefetch: Maximum amount of data read ahead, from a separate task,
+                while observer processes the current one. By default the async
+                iterable is only read once observer is done with the previous data.
             kwargs: Keyword parameters for super.
 
+        Raises:
+            ValueError: If prefetch is negative.
+
         """
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+
         super().__init__(**kwargs)
 
         # Internal
+        self._prefetch = prefetch
         self._async_iterator: T.Optional[T.AsyncIterator[K]] = async_iterable.__aiter__()
 
     def __observe__(self, observer: Observer[K, T.Any]) -> AnonymousDisposable:
@@ -70,15 +158,18 @@ class FromAsyncIterable(Observable[K]):
         stop_future: "Future[None]" = observer.loop.create_future()
 
         def stop() -> None:
-            stop_future.set_result(None)
+            with suppress(InvalidStateError):
+                stop_future.set_result(None)
 
         if self._async_iterator:
             observer.loop.create_task(
-                FromAsyncIterable._worker(self._async_iterator, observer, stop_future)
+                FromAsyncIterable._worker(
+                    self._async_iterator, observer, stop_future, self._prefetch
+                )
             )
 
-            # Cancel task when observer closes
-            observer.lastly(stop)
+            # Stop worker as soon as observer starts closing
+            observer._add_close_listener(stop)
 
             # Clear reference to prevent reiterations
             self._async_iterator = None
@@ -3,10 +3,15 @@ __all__ = ("FromIterable",)
 
 # Internal
 import typing as T
-from asyncio import FIRST_COMPLETED, Future, CancelledError, wait
+from asyncio import Future, CancelledError, InvalidStateError, sleep
+from itertools import islice
+from contextlib import suppress
+from concurrent.futures import Executor
 
 # Project
 from ..disposable import AnonymousDisposable
+from ..misc.stage import DROP, STOP, Stage
+from ..misc.demand import wait_demand
 from ..abstract.observer import Observer
 from ..abstract.observable import Observable
 
@@ -14,26 +19,73 @@ from ..abstract.observable import Observable
 K = T.TypeVar("K")
 
 
+def _read_chunk(
+    iterator: T.Iterator[K], size: int
+) -> T.Tuple[T.List[K], T.Optional[Exception]]:
+    """Read up to size data from iterator, returning data read before any failure."""
+    chunk: T.List[K] = []
+    try:
+        chunk.extend(islice(iterator, size))
+    except Exception as exc:
+        return chunk, exc
+
+    return chunk, None
+
+
 class FromIterable(Observable[K]):
     """Observable that uses an iterable as data source."""
 
+    __slots__ = ("_executor", "_iterator", "_batch_size", "_yield_every")
+
     @staticmethod
-    async def _worker(
-        iterator: T.Iterator[K], observer: Observer[K, T.Any], stop: "Future[None]"
+    async def _executor_worker(
+        iterator: T.Iterator[K],
+        observer: Observer[K, T.Any],
+        stop: "Future[None]",
+        batch_size: int,
+        executor: Executor,
     ) -> None:
-        pending = None
+        loop = observer.loop
+        size = batch_size
+        reading: T.Optional["Future[T.Tuple[T.List[K], T.Optional[Exception]]]"] = None
 
         try:
-            for data in iterator:
-                if observer.closed:
-                    break
+            while not (stop.done() or observer.closed):
+                if reading is None:
+                    # Iterator is only read when observer wants data
+                    demand = observer.demand
+                    if demand == 0:
+                        await wait_demand(observer, stop)
+                        continue
 
-                pending = None
-                (done,), (pending,) = await wait(
-                    (observer.asend(data), stop), return_when=FIRST_COMPLETED
-                )
+                    size = batch_size if demand is None else min(batch_size, demand)
+                    reading = loop.run_in_executor(executor, _read_chunk, iterator, size)
+
+                chunk, exc = await reading
+                reading = None
+
+                exhausted = exc is not None or len(chunk) < size
+                if not exhausted and observer.demand is None:
+                    # Next chunk is read while this one is delivered
+                    size = batch_size
+                    reading = loop.run_in_executor(executor, _read_chunk, iterator, size)
 
-                if observer.closed or done is stop:
+                if batch_size > 1:
+                    await observer.asend_batch(chunk)
+                else:
+                    for data in chunk:
+                        if stop.done() or observer.closed:
+                            break
+
+                        await observer.asend(data)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del chunk
+
+                if exc:
+                    raise exc
+
+                if exhausted:
                     break
         except CancelledError:
             raise
@@ -41,17 +93,138 @@ class FromIterable(Observable[K]):
             if not observer.closed:
                 await observer.araise(exc)
 
-        if pending and pending is not stop:
-            await pending
+        if not (observer.closed or observer.keep_alive):
+            await observer.aclose()
+
+    @staticmethod
+    async def _worker(
+        iterator: T.Iterator[K],
+        observer: Observer[K, T.Any],
+        stop: "Future[None]",
+        batch_size: int,
+    ) -> None:
+        try:
+            if batch_size > 1:
+                while not (stop.done() or observer.closed):
+                    # Iterator is only read when observer wants data
+                    demand = observer.demand
+                    if demand == 0:
+                        await wait_demand(observer, stop)
+                        continue
+
+                    batch = list(
+                        islice(iterator, batch_size if demand is None else min(batch_size, demand))
+                    )
+                    if not batch:
+                        break
+
+                    await observer.asend_batch(batch)
+            else:
+                if observer.demand == 0:
+                    await wait_demand(observer, stop)
+
+                for data in iterator:
+                    if stop.done() or observer.closed:
+                        break
+
+                    # Data is delivered directly, stop is only checked in between sends
+                    await observer.asend(data)
+
+                    if observer.demand == 0:
+                        await wait_demand(observer, stop)
+
+                    if stop.done() or observer.closed:
+                        break
+        except CancelledError:
+            raise
+        except Exception as exc:
+            if not observer.closed:
+                await observer.araise(exc)
 
         if not (observer.closed or observer.keep_alive):
             await observer.aclose()
 
-    def __init__(self, iterable: T.Iterable[K], **kwargs: T.Any) -> None:
+    @staticmethod
+    async def _pull_worker(
+        iterator: T.Iterator[K],
+        stages: T.Sequence[Stage],
+        send: T.Callable[[T.Any], None],
+        observer: Observer[T.Any, T.Any],
+        stop: "Future[None]",
+        yield_every: int,
+    ) -> None:
+        countdown = yield_every
+
+        try:
+            if observer.demand == 0:
+                await wait_demand(observer, stop)
+
+            for value in iterator:
+                if stop.done() or observer.closed:
+                    break
+
+                try:
+                    for stage in stages:
+                        value = stage(value)
+                        if value is DROP or value is STOP:
+                            break
+                    else:
+                        # Data passed through all stages
+                        send(value)
+
+                        if observer._demand:
+                            observer._demand -= 1
+                except Exception as exc:
+                    # Same handling a failed asend would have
+                    if observer.closed:
+                        break
+
+                    await observer.araise(exc)
+                else:
+                    if value is STOP:
+                        break
+
+                if observer._demand == 0:
+                    # Iterator is only read when observer wants data
+                    await wait_demand(observer, stop)
+                    if stop.done() or observer.closed:
+                        break
+
+                countdown -= 1
+                if countdown == 0:
+                    countdown = yield_every
+
+                    # Give other tasks a chance to run
+                    await sleep(0)
+        except CancelledError:
+            raise
+        except Exception as exc:
+            if not observer.closed:
+                await observer.araise(exc)
+
+        if not (observer.closed or observer.keep_alive):
+            await observer.aclose()
+
+    def __init__(
+        self,
+        iterable: T.Iterable[K],
+        batch_size: int = 1,
+        yield_every: int = 1024,
+        executor: T.Optional[Executor] = None,
+        **kwargs: T.Any,
+    ) -> None:
         """FromIterable constructor.
 
        Arguments:
            iterable: Iterable to be converted.
+           batch_size: Maximum quantity of data read from iterable and sent at
+               once, through :meth:`~.Observer.asend_batch`, when greater than 1.
+           yield_every: Quantity of data delivered in pull mode before
+               yielding control back to the event loop.
+           executor: Executor where the iterable is read, in chunks of
+               ``batch_size`` data, for iterables that block, like files,
+               database cursors or CPU bound generators. The next chunk is read
+               while the current one is delivered.
            kwargs: Keyword parameters for super.
 
        """
@@ -59,19 +232,68 @@ class FromIterable(Observable[K]):
 
         # Internal
         self._iterator: T.Optional[T.Iterator[K]] = iter(iterable)
+        self._executor = executor
+        self._batch_size = batch_size
+        self._yield_every = yield_every
 
     def __observe__(self, observer: Observer[K, T.Any]) -> AnonymousDisposable:
-        """Schedule iterator flush and register observer."""
+        """Schedule iterator flush and register observer.
+
+        .. Note::
+
+            Observers that can process data synchronously, like
+            :class:`~.Consumer`, :class:`~.IteratorObserver` and
+            :class:`~.AnonymousObserver` with a synchronous ``asend``, are fed
+            in pull mode: a single loop that reads the iterator and calls the
+            observer logic directly, yielding to the event loop every
+            ``yield_every`` values.
+
+        """
+        disposable = self._observe(observer, ())
+        assert disposable
+        return disposable
+
+    def _observe(
+        self, observer: Observer[T.Any, T.Any], stages: T.Sequence[Stage]
+    ) -> T.Optional[AnonymousDisposable]:
+        """Register observer, applying synchronous stages to the data beforehand.
+
+        Stages are only applied in pull mode, so nothing is done if they are
+        given but the observer can't process data synchronously.
+
+        Returns:
+            Disposable that undoes this subscription, or None.
+
+        """
+        # Blocking iterables are never read in the loop, so pull mode isn't available
+        send = None if self._executor else observer._sync_sender()
+        if stages and send is None:
+            return None
+
         stop_future: "Future[None]" = observer.loop.create_future()
 
         def stop() -> None:
-            stop_future.set_result(None)
+            with suppress(InvalidStateError):
+                stop_future.set_result(None)
 
         if self._iterator:
-            observer.loop.create_task(FromIterable._worker(self._iterator, observer, stop_future))
+            if self._executor:
+                worker = FromIterable._executor_worker(
+                    self._iterator, observer, stop_future, self._batch_size, self._executor
+                )
+            elif send is None:
+                worker = FromIterable._worker(
+                    self._iterator, observer, stop_future, self._batch_size
+                )
+            else:
+                worker = FromIterable._pull_worker(
+                    self._iterator, stages, send, observer, stop_future, self._yield_every
+                )
+
+            observer.loop.create_task(worker)
 
-            # Cancel task when observer closes
-            observer.lastly(stop)
+            # Stop worker as soon as observer starts closing
+            observer._add_close_listener(stop)
 
             # Clear reference to prevent reiterations
             self._iterator = None
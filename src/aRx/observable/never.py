@@ -12,6 +12,8 @@ from ..abstract.observable import Observable
 class Never(Observable[None]):
     """Observable that never outputs data, but stays open."""
 
+    __slots__ = ()
+
     def __observe__(self, _: Observer[T.Any, T.Any]) -> AnonymousDisposable:
         """Do nothing."""
         return AnonymousDisposable()
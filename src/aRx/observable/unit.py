@@ -18,6 +18,8 @@ K = T.TypeVar("K")
 class Unit(Observable[K], Loopable):
     """Observable that outputs a single value then closes."""
 
+    __slots__ = ("_value",)
+
     @staticmethod
     async def _worker(value: T.Union[K, T.Awaitable[K]], observer: Observer[K, T.Any]) -> None:
         if isfuture(value):
@@ -40,6 +40,8 @@ class AnonymousObserver(Observer[K, J]):
     listening to a source.
     """
 
+    __slots__ = ("_send", "_raise", "_close")
+
     def __init__(
         self,
         asend: T.Optional[T.Callable[[K], T.Any]] = None,
@@ -80,6 +82,32 @@ class AnonymousObserver(Observer[K, J]):
 
             await T.cast(T.Awaitable[T.Any], res)
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        if iscoroutinefunction(self._send):
+            return await self._asend_each(values)
+
+        for value in values:
+            try:
+                self._send(value)
+            except Exception as exc:
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    break
+
+    def _sync_sender(self) -> T.Optional[T.Callable[[K], None]]:
+        # Only available when asend is synchronous and wasn't overridden
+        if (
+            iscoroutinefunction(self._send)
+            or type(self).__asend__ is not AnonymousObserver.__asend__
+        ):
+            return None
+
+        return self._send
+
     async def __araise__(self, exc: Exception) -> bool:
         res = self._raise(exc)
 
@@ -14,9 +14,14 @@ K = T.TypeVar("K")
 
 
 class Consumer(Observer[K, K]):
+    __slots__ = ()
+
     async def __asend__(self, value: K) -> None:
         self.resolve(value)
 
+    def _sync_sender(self) -> T.Optional[T.Callable[[K], None]]:
+        return self.resolve if type(self).__asend__ is Consumer.__asend__ else None
+
     async def __araise__(self, exc: Exception) -> bool:
         return True
 
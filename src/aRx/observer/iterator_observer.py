@@ -17,6 +17,8 @@ K = T.TypeVar("K")
 class IteratorObserver(Observer[K, int], T.AsyncIterator[K]):
     """An async observer that can be iterated asynchronously."""
 
+    __slots__ = ("_queue", "_counter", "_control")
+
     def __init__(self, **kwargs: T.Any) -> None:
         """IteratorObserver constructor
 
@@ -45,10 +47,23 @@ class IteratorObserver(Observer[K, int], T.AsyncIterator[K]):
     def __aiter__(self) -> T.AsyncIterator[K]:
         return self
 
-    async def __asend__(self, value: K) -> None:
+    def _enqueue(self, value: K) -> None:
         self._counter += 1
         self._next_value = (False, value)
 
+    def _sync_sender(self) -> T.Optional[T.Callable[[K], None]]:
+        return self._enqueue if type(self).__asend__ is IteratorObserver.__asend__ else None
+
+    async def __asend__(self, value: K) -> None:
+        self._enqueue(value)
+
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        self._counter += len(values)
+        self._queue.extend((False, value) for value in values)
+
+        with suppress(InvalidStateError):
+            self._control.set_result(None)
+
     async def __araise__(self, err: Exception) -> bool:
         self._next_value = (True, err)
         return True
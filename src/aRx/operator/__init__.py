@@ -37,6 +37,16 @@ from .min import Min, min_op
 from .skip import Skip, skip_op
 from .stop import Stop, stop_op
 from .take import Take, take_op
+from .shard import Shard, shard_op
+from .fused import Fused, fuse
+from .merge import Merge, merge_op
+from .buffer import Buffer, buffer_op
 from .concat import Concat, concat_op
 from .filter import Filter, filter_op
+from .publish import Publish, publish_op
+from .conflate import Conflate, conflate_op
+from .flat_map import FlatMap, flat_map_op
 from .assertion import Assert, assert_op
+from .partition import Partition, partition_op
+from .ref_count import RefCount, share_op, ref_count_op
+from .map_in_executor import MapInExecutor, map_in_executor_op
@@ -8,6 +8,7 @@ from functools import partial
 
 # Project
 from ..disposable import CompositeDisposable
+from ..misc.stage import Stage, StageFactory
 from ..abstract.observer import Observer
 from ..misc.dispose_sink import dispose_sink
 from ..abstract.observable import Observable, observe
@@ -18,6 +19,8 @@ K = T.TypeVar("K")
 
 
 class _AssertSink(SingleStream[K]):
+    __slots__ = ("_exc", "_predicate")
+
     def __init__(
         self,
         predicate: T.Callable[[K], T.Union[T.Awaitable[bool], bool]],
@@ -45,10 +48,54 @@ class _AssertSink(SingleStream[K]):
 
         await res
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        if iscoroutinefunction(self._predicate):
+            # Asynchronous predicates are awaited one value at a time
+            return await self._asend_each(values)
+
+        valid: T.List[K] = []
+        for value in values:
+            try:
+                is_valid = self._predicate(value)
+                if not is_valid:
+                    raise self._exc
+            except Exception as exc:
+                # Forward what was valid so far, then handle the error in place
+                if valid:
+                    await super().__asend_batch__(valid)
+                    valid = []
+
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    return
+            else:
+                valid.append(value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del values
+
+        await super().__asend_batch__(valid)
+
+
+def _assert_stage(predicate: T.Callable[[K], bool], exc: Exception) -> Stage:
+    def stage(value: K) -> K:
+        if not predicate(value):
+            raise exc
+
+        return value
+
+    return stage
+
 
 class Assert(Observable[K]):
     """Observable that raises exception if predicate is false."""
 
+    __slots__ = ("_exc", "_source", "_predicate")
+
     def __init__(
         self,
         predicate: T.Callable[[K], T.Union[T.Awaitable[bool], bool]],
@@ -70,6 +117,12 @@ class Assert(Observable[K]):
         self._source = source
         self._predicate = predicate
 
+    def _stage_factory(self) -> T.Optional[StageFactory]:
+        if iscoroutinefunction(self._predicate):
+            return None
+
+        return partial(_assert_stage, self._predicate, self._exc)
+
     def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
         sink: _AssertSink[K] = _AssertSink(self._predicate, self._exc, loop=observer.loop)
         with dispose_sink(sink):
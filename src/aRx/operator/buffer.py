@@ -0,0 +1,188 @@
+__all__ = ("Buffer", "buffer_op")
+
+# Internal
+import typing as T
+from asyncio import Future, InvalidStateError
+from functools import partial
+from contextlib import suppress
+
+# Project
+from ..overflow import Lag, Overflow
+from ..misc.mailbox import Mailbox
+from ..abstract.observer import Observer
+from ..abstract.disposable import Disposable
+from ..misc.dispose_sink import dispose_sink
+from ..abstract.observable import Observable, observe
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class _BufferSink(Observer[K, None]):
+    __slots__ = ("_mailbox", "_observer", "_release")
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: Overflow,
+        observer: Observer[K, T.Any],
+        release: T.Callable[[], T.Any],
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._release = release
+        self._observer = observer
+        self._mailbox: Mailbox[K] = Mailbox(observer, maxsize, overflow, self._disconnect)
+
+        # Stop receiving data as soon as observer starts closing
+        observer._add_close_listener(self._close_soon)
+
+    @property
+    def lag(self) -> Lag:
+        return self._mailbox.lag
+
+    @property
+    def demand(self) -> T.Optional[int]:
+        # Data already buffered counts towards what observer requested
+        demand = self._observer.demand
+        return None if demand is None else max(demand - len(self._mailbox), 0)
+
+    def _demanded(self) -> "Future[None]":
+        return self._observer._demanded()
+
+    def _disconnect(self) -> None:
+        if not (self._observer.closed or self._observer.keep_alive):
+            self._observer._close_soon()
+
+        self._close_soon()
+
+    async def __asend__(self, value: K) -> None:
+        await self._mailbox.put(value)
+
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        mailbox = self._mailbox
+        for value in values:
+            if self.closed:
+                break
+
+            try:
+                await mailbox.put(value)
+            except Exception as exc:
+                await self.araise(exc)
+
+    async def __araise__(self, exc: Exception) -> bool:
+        self._mailbox.put_error(exc)
+        return False
+
+    async def __aclose__(self) -> None:
+        # Sink should resolve to None when no error is registered
+        with suppress(InvalidStateError):
+            self.resolve(None)
+
+        observer = self._observer
+        observer._remove_close_listener(self._close_soon)
+
+        # Counters remain available while observer receives the remaining buffered data
+        if observer.keep_alive:
+            self._release()
+        else:
+            observer._add_close_listener(self._release)
+
+        self._mailbox.close()
+        await self._mailbox.wait_closed()
+
+
+class Buffer(Observable[K]):
+    """Observable that puts a bounded queue between its source and each observer.
+
+    Each observer is fed from its own task, so source only waits for observers
+    when their queue is full and the overflow policy is
+    :attr:`~.Overflow.BLOCK`. Other policies discard data or notify the
+    observer, bounding memory without ever holding back the source.
+
+    .. Note::
+
+        With :attr:`~.Overflow.RAISE`, data that doesn't fit is replaced by a
+        :class:`~.BufferOverflowError` delivered to the observer, in order.
+        Consecutive discarded data is reported by a single error.
+        With :attr:`~.Overflow.DISCONNECT`, the observer is closed.
+
+        If the observer limits its demand, through :meth:`~.Observer.request`,
+        buffered data counts towards it, so source is paused instead of filling
+        the buffer ahead of what was requested.
+    """
+
+    __slots__ = ("_sinks", "_source", "_maxsize", "_overflow")
+
+    def __init__(
+        self,
+        maxsize: int,
+        source: Observable[K],
+        overflow: Overflow = Overflow.BLOCK,
+        **kwargs: T.Any,
+    ) -> None:
+        """Buffer constructor.
+
+        Arguments:
+            maxsize: Maximum amount of data queued for each observer.
+            source: Observable source.
+            overflow: Policy applied when data arrives and an observer queue is full.
+            kwargs: Keyword parameters for super.
+
+        Raises:
+            ValueError: If maxsize isn't positive.
+
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        super().__init__(**kwargs)
+
+        self._source = source
+        self._maxsize = maxsize
+        self._overflow = overflow
+
+        # Internal
+        self._sinks: T.Dict[Observer[K, T.Any], _BufferSink[K]] = {}
+
+    def lag(self, observer: Observer[K, T.Any]) -> T.Optional[Lag]:
+        """Counters of the queue in front of an observer.
+
+        Arguments:
+            observer: Subscribed observer.
+
+        Returns:
+            Queue counters, or None if observer isn't subscribed.
+
+        """
+        sink = self._sinks.get(observer, None)
+        return sink.lag if sink else None
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> Disposable:
+        sink: _BufferSink[K] = _BufferSink(
+            self._maxsize,
+            self._overflow,
+            observer,
+            partial(self._sinks.pop, observer, None),
+            loop=observer.loop,
+        )
+        with dispose_sink(sink):
+            disposable = observe(self._source, sink)
+
+        self._sinks[observer] = sink
+        return disposable
+
+
+def buffer_op(
+    maxsize: int, overflow: Overflow = Overflow.BLOCK
+) -> T.Callable[[Observable[K]], Buffer[K]]:
+    """Partial implementation of :class:`~.Buffer` to be used with operator semantics.
+
+    Returns:
+        Partial implementation of Buffer.
+
+    """
+    return T.cast(
+        T.Callable[[Observable[K]], Buffer[K]], partial(Buffer, maxsize, overflow=overflow)
+    )
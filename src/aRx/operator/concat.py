@@ -20,6 +20,8 @@ L = T.TypeVar("L")
 class Concat(Observable[J]):
     """Observable that is the concatenation of multiple observables sources"""
 
+    __slots__ = ("_sources",)
+
     def __init__(self, *observables: Observable[T.Any], **kwargs: T.Any) -> None:
         """Concat constructor.
 
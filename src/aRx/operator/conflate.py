@@ -0,0 +1,169 @@
+__all__ = ("Conflate", "conflate_op")
+
+# Internal
+import typing as T
+from asyncio import Future, CancelledError, wait
+from functools import partial
+from itertools import islice
+from contextlib import suppress
+
+# Project
+from ..error import ObserverClosedError
+from ..disposable import CompositeDisposable
+from ..misc.eager import eager
+from ..misc.demand import wait_demand
+from ..abstract.observer import Observer
+from ..misc.dispose_sink import dispose_sink
+from ..abstract.observable import Observable, observe
+from ..stream.single_stream import SingleStream
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class _ConflateSink(SingleStream[K]):
+    __slots__ = ("_key", "_task", "_pending")
+
+    def __init__(self, key: T.Callable[[K], T.Hashable], **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._task: T.Optional["Future[None]"] = None
+        self._pending: T.Dict[T.Hashable, K] = {}
+
+    def _store(self, value: K) -> None:
+        if self._task is None:
+            observer = self._observer
+            if not self._pending and observer is not None and observer.demand != 0:
+                # Observer is free, data is delivered right away and a task is only
+                # created if the observer suspends, to keep delivering what arrives meanwhile
+                self._task = eager(self._drain((value,)), self.loop)
+                return
+
+        # Newer data replaces the one pending for the same key, keeping its position
+        self._pending[self._key(value)] = value
+
+        if self._task is None:
+            self._task = self.loop.create_task(self._drain())
+
+    async def _drain(self, values: T.Sequence[K] = ()) -> None:
+        pending = self._pending
+        try:
+            if values:
+                await super().__asend_batch__(values)
+
+            while pending:
+                observer = self._observer
+                demand = None if observer is None else observer.demand
+                if demand == 0:
+                    # Values keep being conflated while observer doesn't request more
+                    await wait_demand(T.cast(Observer[K, T.Any], observer))
+                    continue
+
+                if demand is None or demand >= len(pending):
+                    values = list(pending.values())
+                    pending.clear()
+                else:
+                    keys = list(islice(pending, demand))
+                    values = [pending.pop(key) for key in keys]
+
+                await super().__asend_batch__(values)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del values
+        except ObserverClosedError:
+            pending.clear()
+        except CancelledError:
+            raise
+        except Exception as exc:
+            # Delivery can't continue, the error is handed to observer instead of being lost
+            pending.clear()
+            with suppress(ObserverClosedError):
+                await super().__araise__(exc)
+        finally:
+            self._task = None
+
+    async def _flush(self) -> None:
+        """Wait until all pending data is delivered."""
+        while self._task:
+            # Wait instead of awaiting directly to not cancel the drain along with the caller
+            await wait((self._task,))
+
+    @property
+    def demand(self) -> T.Optional[int]:
+        # Source is never held back, demand is honoured when delivering conflated data
+        return None
+
+    async def __asend__(self, value: K) -> None:
+        self._store(value)
+
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        for value in values:
+            try:
+                self._store(value)
+            except Exception as exc:
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    return
+
+    async def __araise__(self, exc: Exception) -> bool:
+        # Errors are delivered after the data received before them
+        await self._flush()
+        return await super().__araise__(exc)
+
+    async def __aclose__(self) -> None:
+        if self._observer is None:
+            # Nothing can be delivered without an observer
+            if self._task:
+                self._task.cancel()
+        else:
+            await self._flush()
+
+        await super().__aclose__()
+
+
+class Conflate(Observable[K]):
+    """Observable that only keeps the latest pending data for each key.
+
+    Data is forwarded as soon as the observer is free. While it is busy, data
+    received for a key replaces the one waiting to be delivered for the same
+    key, so a slow observer only receives the current data of each key and
+    queued data is bounded by the amount of distinct keys.
+    """
+
+    __slots__ = ("_key", "_source")
+
+    def __init__(
+        self, key: T.Callable[[K], T.Hashable], source: Observable[K], **kwargs: T.Any
+    ) -> None:
+        """Conflate constructor.
+
+        Arguments:
+            key: Function that returns the key of each data.
+            source: Observable source.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._source = source
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
+        sink: _ConflateSink[K] = _ConflateSink(self._key, loop=observer.loop)
+        with dispose_sink(sink):
+            return CompositeDisposable(observe(self._source, sink), observe(sink, observer))
+
+
+def conflate_op(key: T.Callable[[K], T.Hashable]) -> T.Callable[[Observable[K]], Conflate[K]]:
+    """Partial implementation of :class:`~.Conflate` to be used with operator semantics.
+
+    Returns:
+        Partial implementation of Conflate.
+
+    """
+    return T.cast(T.Callable[[Observable[K]], Conflate[K]], partial(Conflate, key))
@@ -4,9 +4,11 @@ __all__ = ("Filter", "filter_op")
 import typing as T
 from asyncio import iscoroutinefunction
 from functools import partial
+from itertools import count
 
 # Project
 from ..disposable import CompositeDisposable
+from ..misc.stage import DROP, Stage, StageFactory
 from ..abstract.observer import Observer
 from ..misc.dispose_sink import dispose_sink
 from ..abstract.observable import Observable, observe
@@ -17,6 +19,8 @@ K = T.TypeVar("K")
 
 
 class _FilterSink(SingleStream[K]):
+    __slots__ = ("_index", "_predicate")
+
     def __init__(
         self, predicate: T.Callable[[K, int], T.Union[T.Awaitable[bool], bool]], **kwargs: T.Any
     ) -> None:
@@ -42,10 +46,55 @@ class _FilterSink(SingleStream[K]):
 
             await res
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        if iscoroutinefunction(self._predicate):
+            # Asynchronous predicates are awaited one value at a time
+            return await self._asend_each(values)
+
+        accepted: T.List[K] = []
+        for value in values:
+            index = self._index
+            self._index += 1
+
+            try:
+                is_accepted = self._predicate(value, index)
+            except Exception as exc:
+                # Forward what was accepted so far, then handle the error in place
+                if accepted:
+                    await super().__asend_batch__(accepted)
+                    accepted = []
+
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    return
+            else:
+                if is_accepted:
+                    accepted.append(value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del values
+
+        await super().__asend_batch__(accepted)
+
+
+def _filter_stage(predicate: T.Callable[[K, int], bool]) -> Stage:
+    index = count()
+
+    def stage(value: K) -> T.Any:
+        return value if predicate(value, next(index)) else DROP
+
+    return stage
+
 
 class Filter(Observable[K]):
     """Observable that output filtered data from another observable source."""
 
+    __slots__ = ("_source", "_predicate")
+
     def __init__(
         self,
         predicate: T.Callable[[K, int], T.Union[T.Awaitable[bool], bool]],
@@ -66,6 +115,12 @@ class Filter(Observable[K]):
         self._source = source
         self._predicate = predicate
 
+    def _stage_factory(self) -> T.Optional[StageFactory]:
+        if iscoroutinefunction(self._predicate):
+            return None
+
+        return partial(_filter_stage, self._predicate)
+
     def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
         sink: _FilterSink[K] = _FilterSink(self._predicate, loop=observer.loop)
         with dispose_sink(sink):
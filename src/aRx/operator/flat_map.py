@@ -0,0 +1,126 @@
+__all__ = ("FlatMap", "flat_map_op")
+
+# Internal
+import typing as T
+from asyncio import InvalidStateError, iscoroutinefunction
+from functools import partial
+from contextlib import suppress
+
+# Project
+from .merge import _MergeSink
+from ..disposable import CompositeDisposable
+from ..abstract.observer import Observer
+from ..misc.dispose_sink import dispose_sink
+from ..abstract.observable import Observable, observe
+
+# Generic Types
+J = T.TypeVar("J")
+K = T.TypeVar("K")
+
+Mapper = T.Callable[[J, int], T.Union[T.Awaitable[Observable[K]], Observable[K]]]
+
+
+class _FlatMapSink(Observer[J, None]):
+    __slots__ = ("_index", "_merge", "_mapper")
+
+    def __init__(self, mapper: Mapper[J, K], merge: _MergeSink[K], **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._index = 0
+        self._merge = merge
+        self._mapper = mapper
+
+        # Stop reading source as soon as merged output closes
+        merge._add_close_listener(self._close_soon)
+
+    async def __asend__(self, value: J) -> None:
+        index = self._index
+        self._index += 1
+
+        inner = self._mapper(value, index)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        if iscoroutinefunction(self._mapper):
+            inner = await T.cast(T.Awaitable[Observable[K]], inner)
+
+        # Source is held back while the concurrency limit is reached
+        await self._merge._wait_slot()
+
+        self._merge._add(T.cast(Observable[K], inner))
+
+    async def __araise__(self, exc: Exception) -> bool:
+        if not self._merge.closed:
+            await self._merge.araise(exc)
+
+        return False
+
+    async def __aclose__(self) -> None:
+        # Sink should resolve to None when no error is registered
+        with suppress(InvalidStateError):
+            self.resolve(None)
+
+        self._merge._remove_close_listener(self._close_soon)
+        self._merge._seal()
+
+
+class FlatMap(Observable[K]):
+    """Observable that maps each data of its source to an observable, and merges their data.
+
+    Data from the mapped observables is outputted as it arrives, interleaved.
+    """
+
+    __slots__ = ("_source", "_mapper", "_max_concurrent")
+
+    def __init__(
+        self,
+        mapper: Mapper[J, K],
+        source: Observable[J],
+        max_concurrent: T.Optional[int] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """FlatMap constructor.
+
+        Arguments:
+            mapper: Function that returns an observable for each data of source.
+            source: Observable source.
+            max_concurrent: Maximum amount of mapped observables subscribed at
+                once. Source is held back while the limit is reached, so memory
+                stays bounded. By default there is no limit.
+            kwargs: Keyword parameters for super.
+
+        Raises:
+            ValueError: If max_concurrent isn't positive.
+
+        """
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive")
+
+        super().__init__(**kwargs)
+
+        self._source = source
+        self._mapper = mapper
+        self._max_concurrent = max_concurrent
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
+        merge: _MergeSink[K] = _MergeSink(self._max_concurrent, loop=observer.loop)
+        with dispose_sink(merge):
+            sink: _FlatMapSink[T.Any, K] = _FlatMapSink(self._mapper, merge, loop=observer.loop)
+            with dispose_sink(sink):
+                return CompositeDisposable(observe(self._source, sink), observe(merge, observer))
+
+
+def flat_map_op(
+    mapper: Mapper[J, K], max_concurrent: T.Optional[int] = None
+) -> T.Callable[[Observable[J]], FlatMap[K]]:
+    """Partial implementation of :class:`~.FlatMap` to be used with operator semantics.
+
+    Returns:
+        Partial implementation of FlatMap.
+
+    """
+    return T.cast(
+        T.Callable[[Observable[J]], FlatMap[K]],
+        partial(FlatMap, mapper, max_concurrent=max_concurrent),
+    )
@@ -0,0 +1,157 @@
+__all__ = ("Fused", "fuse")
+
+# Internal
+import typing as T
+
+# Project
+from ..disposable import CompositeDisposable
+from ..misc.stage import DROP, STOP, Stage, StageFactory
+from ..abstract.observer import Observer
+from ..misc.dispose_sink import dispose_sink
+from ..abstract.disposable import Disposable
+from ..abstract.observable import Observable, observe
+from ..stream.single_stream import SingleStream
+from ..observable.from_iterable import FromIterable
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class _FusedSink(SingleStream[K]):
+    __slots__ = ("_stages",)
+
+    def __init__(self, stages: T.Sequence[Stage], **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._stages = stages
+
+    async def __asend__(self, value: T.Any) -> None:
+        for stage in self._stages:
+            value = stage(value)
+            if value is DROP:
+                return
+            if value is STOP:
+                self._close_soon()
+                return
+
+        awaitable = super().__asend__(value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await awaitable
+
+    async def __asend_batch__(self, values: T.Sequence[T.Any]) -> None:
+        results: T.List[K] = []
+        for value in values:
+            try:
+                for stage in self._stages:
+                    value = stage(value)
+                    if value is DROP or value is STOP:
+                        break
+            except Exception as exc:
+                # Forward what was processed so far, then handle the error in place
+                if results:
+                    await super().__asend_batch__(results)
+                    results = []
+
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    return
+            else:
+                if value is STOP:
+                    await super().__asend_batch__(results)
+                    self._close_soon()
+                    return
+
+                if value is not DROP:
+                    results.append(value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del values
+
+        await super().__asend_batch__(results)
+
+
+class Fused(Observable[K]):
+    """Observable that applies a chain of synchronous operators in a single step.
+
+    Each operator in the chain is represented by a stage, a function that
+    receives a value and returns the value to be passed on, ``DROP`` to
+    discard it or ``STOP`` to close the stream. Stages are created per
+    subscription, so they can hold state like indexes and counters.
+
+    When the source is a :class:`~.FromIterable` and the observer can process
+    data synchronously, the whole pipeline runs in pull mode, see
+    :meth:`.FromIterable.__observe__`.
+
+    .. Note::
+
+        Fused observables are created by :func:`fuse`, there is no need to
+        instantiate them directly.
+    """
+
+    __slots__ = ("_source", "_factories")
+
+    def __init__(
+        self, factories: T.Sequence[StageFactory], source: Observable[T.Any], **kwargs: T.Any
+    ) -> None:
+        """Fused constructor.
+
+        Arguments:
+            factories: Stage factories, in the order they must be applied.
+            source: Observable source.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._source = source
+        self._factories = tuple(factories)
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> Disposable:
+        stages = tuple(factory() for factory in self._factories)
+
+        if isinstance(self._source, FromIterable):
+            # Try to run the whole pipeline in pull mode
+            disposable = self._source._observe(observer, stages)
+            if disposable:
+                return disposable
+
+        sink: _FusedSink[K] = _FusedSink(stages, loop=observer.loop)
+        with dispose_sink(sink):
+            return CompositeDisposable(observe(self._source, sink), observe(sink, observer))
+
+
+def fuse(observable: Observable[K]) -> Observable[K]:
+    """Convert an operator into a :class:`Fused` observable when it can be applied synchronously.
+
+    If the operator source is also a :class:`Fused` observable, both are merged
+    so that the whole chain is applied in a single step.
+
+    Operators that support fusion are :class:`~.Map`, :class:`~.Filter`,
+    :class:`~.Stop`, :class:`~.Assert`, :class:`~.Skip` and :class:`~.Take`,
+    as long as their callbacks aren't coroutine functions and, for ``Skip``
+    and ``Take``, their count isn't negative.
+
+    Arguments:
+        observable: Observable to be fused.
+
+    Returns:
+        A :class:`Fused` observable, or the given observable if fusion isn't possible.
+
+    """
+    get_factory = getattr(observable, "_stage_factory", None)
+    factory: T.Optional[StageFactory] = get_factory() if get_factory else None
+    if factory is None:
+        return observable
+
+    source: Observable[T.Any] = getattr(observable, "_source")
+    if isinstance(source, Fused):
+        return Fused(source._factories + (factory,), source._source)
+
+    return Fused((factory,), source)
@@ -2,11 +2,15 @@ __all__ = ("Map", "map_op")
 
 # Internal
 import typing as T
-from asyncio import iscoroutinefunction
+from asyncio import FIRST_COMPLETED, Task, Future, wait, iscoroutinefunction
 from functools import partial
+from itertools import count
+from collections import deque
 
 # Project
+from ..error import ObserverClosedError
 from ..disposable import CompositeDisposable
+from ..misc.stage import Stage, StageFactory
 from ..abstract.observer import Observer
 from ..misc.dispose_sink import dispose_sink
 from ..abstract.observable import Observable, observe
@@ -18,6 +22,8 @@ K = T.TypeVar("K")
 
 
 class _MapSink(T.Generic[J, K], SingleStream[K]):
+    __slots__ = ("_index", "_mapper")
+
     def __init__(self, mapper: T.Callable[[J, int], K], **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
@@ -43,37 +49,276 @@ class _MapSink(T.Generic[J, K], SingleStream[K]):
 
         await awaitable
 
+    async def __asend_batch__(self, values: T.Sequence[J]) -> None:
+        if iscoroutinefunction(self._mapper):
+            # Asynchronous mappers are awaited one value at a time
+            return await self._asend_each(values)
+
+        results: T.List[K] = []
+        for value in values:
+            index = self._index
+            self._index += 1
+
+            try:
+                results.append(self._mapper(value, index))
+            except Exception as exc:
+                # Forward what was mapped so far, then handle the error in place
+                if results:
+                    await super().__asend_batch__(results)
+                    results = []
+
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    return
+
+        # Remove reference early to avoid keeping large objects in memory
+        del values
+
+        await super().__asend_batch__(results)
+
+
+class _ConcurrentMapSink(_MapSink[J, K]):
+    __slots__ = ("_slot", "_task", "_ordered", "_pending", "_concurrency")
+
+    def __init__(
+        self,
+        mapper: T.Callable[[J, int], T.Any],
+        concurrency: int,
+        ordered: bool,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(mapper, **kwargs)
+
+        self._slot: T.Optional["Future[None]"] = None
+        self._task: T.Optional["Task[None]"] = None
+        self._ordered = ordered
+        self._pending: T.Deque["Future[T.Any]"] = deque()
+        self._concurrency = concurrency
+
+        # Release source held back by the concurrency limit as soon as this starts closing
+        self._add_close_listener(self._wake_slot)
+
+    @property
+    def demand(self) -> T.Optional[int]:
+        # Data in flight counts towards what observer requested
+        demand = super().demand
+        return None if demand is None else max(demand - self._held(), 0)
+
+    @property
+    def full(self) -> bool:
+        """Property that indicates if the concurrency limit was reached."""
+        return len(self._pending) >= self._concurrency
+
+    def _held(self) -> int:
+        """Amount of data accepted but not yet delivered."""
+        return len(self._pending)
+
+    def _unpack(self, future: "Future[T.Any]") -> T.Iterable[T.Tuple[bool, T.Any]]:
+        """Outcomes of a finished call, as (is_error, data) pairs."""
+        if future.cancelled():
+            return ()
+
+        exc = future.exception()
+        return ((False, future.result()),) if exc is None else ((True, exc),)
+
+    def _start(self, future: "Future[T.Any]") -> None:
+        """Register a call in flight, to be delivered by the drain."""
+        self._pending.append(future)
+
+        if self._task is None:
+            self._task = self.loop.create_task(self._drain())
+
+    def _wake_slot(self) -> None:
+        slot, self._slot = self._slot, None
+        if slot and not slot.done():
+            slot.set_result(None)
+
+    async def _wait_slot(self) -> None:
+        """Wait until another call can be started, or this starts closing."""
+        while self.full and not self.closed:
+            if self._slot is None:
+                self._slot = self.loop.create_future()
+
+            await self._slot
+
+    def _discard(self) -> None:
+        """Cancel calls in flight, and drop results not yet delivered."""
+        for future in self._pending:
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                # Mark exception as retrieved
+                future.exception()
+
+        self._pending.clear()
+        self._wake_slot()
+
+    async def _drain(self) -> None:
+        pending = self._pending
+        try:
+            while pending:
+                if self._ordered:
+                    # Results wait in the reorder window until all previous ones are delivered
+                    await wait((pending[0],))
+                    done = []
+                    while pending and pending[0].done():
+                        done.append(pending.popleft())
+                else:
+                    await wait(tuple(pending), return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future.done()]
+                    for future in done:
+                        pending.remove(future)
+
+                await self._deliver(done)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del done
+
+                self._wake_slot()
+        except ObserverClosedError:
+            self._discard()
+        finally:
+            self._task = None
+
+    async def _deliver(self, done: T.List["Future[T.Any]"]) -> None:
+        # Results are already mapped, forward them straight to the observer
+        results: T.List[K] = []
+        for future in done:
+            for is_error, data in self._unpack(future):
+                if not is_error:
+                    results.append(data)
+                    continue
+
+                # Forward what was mapped so far, then the error in place
+                if results:
+                    await SingleStream.__asend_batch__(self, results)
+                    results = []
+
+                await SingleStream.__araise__(self, data)
+
+                # Failed calls don't consume demand, re-check it upstream
+                if self._observer:
+                    self._observer._wake_demand()
+
+        if results:
+            await SingleStream.__asend_batch__(self, results)
+
+    async def _flush(self) -> None:
+        """Wait until all calls in flight are delivered."""
+        while self._task:
+            # Wait instead of awaiting directly to not cancel the drain along with the caller
+            await wait((self._task,))
+
+    async def __asend__(self, value: J) -> None:
+        # Source is held back while the concurrency limit is reached
+        await self._wait_slot()
+        if self.closed:
+            return
+
+        index = self._index
+        self._index += 1
+
+        self._start(self.loop.create_task(self._mapper(value, index)))
+
+    async def __araise__(self, exc: Exception) -> bool:
+        # Errors are delivered after the data received before them
+        await self._flush()
+        return await super().__araise__(exc)
+
+    async def __aclose__(self) -> None:
+        if self._observer is None or self._observer.closed:
+            # Nothing can be delivered anymore
+            self._discard()
+
+        await self._flush()
+        await super().__aclose__()
+
+
+def _map_stage(mapper: T.Callable[[J, int], K]) -> Stage:
+    index = count()
+
+    def stage(value: J) -> K:
+        return mapper(value, next(index))
+
+    return stage
+
 
 class Map(T.Generic[J, K], Observable[K]):
     """Observable that outputs transmuted data from an observable source."""
 
+    __slots__ = ("_mapper", "_source", "_ordered", "_concurrency")
+
     def __init__(
-        self, mapper: T.Callable[[J, int], K], source: Observable[J], **kwargs: T.Any
+        self,
+        mapper: T.Callable[[J, int], K],
+        source: Observable[J],
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: T.Any,
     ) -> None:
         """Map constructor.
 
         Arguments:
             mapper: Transmutation function.
             source: Observable source.
+            concurrency: Maximum amount of asynchronous mapper calls running at
+                once. Source is held back while the limit is reached. Ignored
+                for synchronous mappers.
+            ordered: Whether results of concurrent calls are outputted in the
+                order of their source data, or as soon as they are available.
             kwargs: Keyword parameters for super.
 
+        Raises:
+            ValueError: If concurrency isn't positive.
+
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+
         super().__init__(**kwargs)
 
         self._mapper = mapper
         self._source = source
+        self._ordered = ordered
+        self._concurrency = concurrency
+
+    def _stage_factory(self) -> T.Optional[StageFactory]:
+        if iscoroutinefunction(self._mapper):
+            return None
+
+        return partial(_map_stage, self._mapper)
 
     def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
-        sink: _MapSink[J, K] = _MapSink(self._mapper, loop=observer.loop)
+        sink: _MapSink[J, K]
+        if self._concurrency > 1 and iscoroutinefunction(self._mapper):
+            sink = _ConcurrentMapSink(
+                T.cast(T.Callable[[J, int], T.Awaitable[K]], self._mapper),
+                self._concurrency,
+                self._ordered,
+                loop=observer.loop,
+            )
+        else:
+            sink = _MapSink(self._mapper, loop=observer.loop)
+
         with dispose_sink(sink):
             return CompositeDisposable(observe(self._source, sink), observe(sink, observer))
 
 
-def map_op(mapper: T.Callable[[J, int], K]) -> T.Callable[[Observable[J]], Map[J, K]]:
+def map_op(
+    mapper: T.Callable[[J, int], K], *, concurrency: int = 1, ordered: bool = True
+) -> T.Callable[[Observable[J]], Map[J, K]]:
     """Partial implementation of :class:`~.Map` to be used with operator semantics.
 
     Returns:
         Partial implementation of Map
 
     """
-    return T.cast(T.Callable[[Observable[J]], Map[J, K]], partial(Map, mapper))
+    return T.cast(
+        T.Callable[[Observable[J]], Map[J, K]],
+        partial(Map, mapper, concurrency=concurrency, ordered=ordered),
+    )
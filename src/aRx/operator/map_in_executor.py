@@ -0,0 +1,235 @@
+__all__ = ("MapInExecutor", "map_in_executor_op")
+
+# Internal
+import typing as T
+from os import cpu_count
+from asyncio import Future
+from functools import partial
+from concurrent.futures import Executor
+
+# Project
+from .map import _ConcurrentMapSink
+from ..disposable import CompositeDisposable
+from ..abstract.observer import Observer
+from ..misc.dispose_sink import dispose_sink
+from ..abstract.observable import Observable, observe
+
+# Generic Types
+J = T.TypeVar("J")
+K = T.TypeVar("K")
+
+
+def _map_chunk(
+    mapper: T.Callable[[J, int], K], values: T.List[J], start: int
+) -> T.List[T.Tuple[bool, T.Any]]:
+    """Map a chunk of data inside the executor, capturing errors of each data."""
+    outcomes: T.List[T.Tuple[bool, T.Any]] = []
+    for index, value in enumerate(values, start):
+        try:
+            outcomes.append((False, mapper(value, index)))
+        except Exception as exc:
+            outcomes.append((True, exc))
+
+    return outcomes
+
+
+class _ExecutorMapSink(_ConcurrentMapSink[J, K]):
+    __slots__ = ("_chunk", "_executor", "_chunksize", "_scheduled")
+
+    def __init__(
+        self,
+        mapper: T.Callable[[J, int], K],
+        executor: T.Optional[Executor],
+        chunksize: int,
+        concurrency: int,
+        ordered: bool,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(mapper, concurrency, ordered, **kwargs)
+
+        self._chunk: T.List[J] = []
+        self._executor = executor
+        self._chunksize = chunksize
+        self._scheduled = False
+
+    def _held(self) -> int:
+        return len(self._pending) * self._chunksize + len(self._chunk)
+
+    def _unpack(self, future: "Future[T.Any]") -> T.Iterable[T.Tuple[bool, T.Any]]:
+        if future.cancelled():
+            return ()
+
+        # Errors of the chunk as a whole, like a broken pool, are delivered once
+        exc = future.exception()
+        if exc is not None:
+            return ((True, exc),)
+
+        return T.cast(T.List[T.Tuple[bool, T.Any]], future.result())
+
+    def _submit(self) -> None:
+        chunk, self._chunk = self._chunk, []
+
+        start = self._index
+        self._index += len(chunk)
+
+        self._start(
+            self.loop.run_in_executor(self._executor, _map_chunk, self._mapper, chunk, start)
+        )
+
+    def _submit_partial(self) -> None:
+        self._scheduled = False
+
+        # Partial chunk waits for a free slot, which reschedules it
+        if self._chunk and not (self.full or self.closed):
+            self._submit()
+
+    def _schedule_partial(self) -> None:
+        # Partial chunk is submitted once source stops sending, at the next loop iteration
+        if not self._scheduled:
+            self._scheduled = True
+            self.loop.call_soon(self._submit_partial)
+
+    async def _submit_held(self) -> None:
+        """Submit partial chunk within the concurrency limit, even while closing."""
+        while self._chunk and self.full:
+            if self._slot is None:
+                self._slot = self.loop.create_future()
+
+            await self._slot
+
+        if self._chunk:
+            self._submit()
+
+    def _wake_slot(self) -> None:
+        super()._wake_slot()
+
+        if self._chunk:
+            self._schedule_partial()
+
+    async def __asend__(self, value: J) -> None:
+        # Source is held back while the concurrency limit is reached
+        await self._wait_slot()
+        if self.closed:
+            return
+
+        self._chunk.append(value)
+
+        if len(self._chunk) >= self._chunksize:
+            self._submit()
+        else:
+            self._schedule_partial()
+
+    async def __araise__(self, exc: Exception) -> bool:
+        # Errors are delivered after the data received before them
+        await self._submit_held()
+
+        return await super().__araise__(exc)
+
+    async def __aclose__(self) -> None:
+        if self._observer is None or self._observer.closed:
+            self._chunk.clear()
+        else:
+            await self._submit_held()
+
+        await super().__aclose__()
+
+
+class MapInExecutor(T.Generic[J, K], Observable[K]):
+    """Observable that outputs data from an observable source transmuted inside an executor.
+
+    Data is mapped in chunks, to amortise the cost of sending it to the
+    executor, with a limited amount of chunks in flight. The event loop stays
+    responsive while blocking or CPU heavy mappers run in threads or
+    processes.
+
+    .. Note::
+
+        Mapper and data must be picklable when using a process pool.
+    """
+
+    __slots__ = ("_mapper", "_source", "_ordered", "_executor", "_chunksize", "_concurrency")
+
+    def __init__(
+        self,
+        mapper: T.Callable[[J, int], K],
+        source: Observable[J],
+        *,
+        executor: T.Optional[Executor] = None,
+        chunksize: int = 1,
+        concurrency: T.Optional[int] = None,
+        ordered: bool = True,
+        **kwargs: T.Any,
+    ) -> None:
+        """MapInExecutor constructor.
+
+        Arguments:
+            mapper: Synchronous transmutation function.
+            source: Observable source.
+            executor: Executor where mapper runs. By default the event loop's
+                default executor.
+            chunksize: Amount of data mapped by each executor call. Partial
+                chunks are submitted as soon as the source stops sending.
+            concurrency: Maximum amount of chunks in flight at once. Source is
+                held back while the limit is reached. By default the amount of
+                CPUs.
+            ordered: Whether results are outputted in the order of their
+                source data, or as soon as their chunk is done.
+            kwargs: Keyword parameters for super.
+
+        Raises:
+            ValueError: If chunksize or concurrency isn't positive.
+
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be positive")
+
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be positive")
+
+        super().__init__(**kwargs)
+
+        self._mapper = mapper
+        self._source = source
+        self._ordered = ordered
+        self._executor = executor
+        self._chunksize = chunksize
+        self._concurrency = concurrency or cpu_count() or 1
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
+        sink: _ExecutorMapSink[J, K] = _ExecutorMapSink(
+            self._mapper,
+            self._executor,
+            self._chunksize,
+            self._concurrency,
+            self._ordered,
+            loop=observer.loop,
+        )
+        with dispose_sink(sink):
+            return CompositeDisposable(observe(self._source, sink), observe(sink, observer))
+
+
+def map_in_executor_op(
+    mapper: T.Callable[[J, int], K],
+    *,
+    executor: T.Optional[Executor] = None,
+    chunksize: int = 1,
+    concurrency: T.Optional[int] = None,
+    ordered: bool = True,
+) -> T.Callable[[Observable[J]], MapInExecutor[J, K]]:
+    """Partial implementation of :class:`~.MapInExecutor` to be used with operator semantics.
+
+    Returns:
+        Partial implementation of MapInExecutor.
+
+    """
+    return T.cast(
+        T.Callable[[Observable[J]], MapInExecutor[J, K]],
+        partial(
+            MapInExecutor,
+            mapper,
+            executor=executor,
+            chunksize=chunksize,
+            concurrency=concurrency,
+            ordered=ordered,
+        ),
+    )
@@ -15,6 +15,8 @@ K = T.TypeVar("K")
 
 
 class _MaxSink(SingleStream[K]):
+    __slots__ = ("_max",)
+
     def __init__(self, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
@@ -27,6 +29,15 @@ class _MaxSink(SingleStream[K]):
         if is_greater:
             setattr(self, "_max", value)
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        try:
+            value = max(values)
+        except Exception:
+            # Let each value fail individually, as they would if sent one by one
+            return await self._asend_each(values)
+
+        await self.__asend__(value)
+
     async def __aclose__(self) -> None:
         try:
             awaitable = super().__asend__(getattr(self, "_max"))
@@ -52,6 +63,8 @@ class Max(Observable[K]):
         This observable only outputs data after source observable has closed.
     """
 
+    __slots__ = ("_source",)
+
     def __init__(self, source: Observable[K], **kwargs: T.Any) -> None:
         """Max constructor.
 
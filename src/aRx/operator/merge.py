@@ -0,0 +1,226 @@
+__all__ = ("Merge", "merge_op")
+
+# Internal
+import typing as T
+from asyncio import Task, Future, InvalidStateError, wait
+from functools import partial
+from contextlib import suppress
+from collections import deque
+
+# Project
+from ..abstract.observer import Observer
+from ..abstract.disposable import Disposable, adispose
+from ..misc.dispose_sink import dispose_sink
+from ..abstract.observable import Observable, observe
+from ..stream.single_stream import SingleStream
+
+# Generic Types
+J = T.TypeVar("J")
+
+
+class _InnerObserver(Observer[J, None]):
+    """Observer of an inner observable, forwarding its data to the merge sink."""
+
+    __slots__ = ("_sink",)
+
+    def __init__(self, sink: "_MergeSink[J]", **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._sink = sink
+
+    @property
+    def demand(self) -> T.Optional[int]:
+        return self._sink.demand
+
+    def _demanded(self) -> "Future[None]":
+        return self._sink._demanded()
+
+    async def __asend__(self, value: J) -> None:
+        if self._sink.closed:
+            self._close_soon()
+        else:
+            await self._sink.asend(value)
+
+    async def __asend_batch__(self, values: T.Sequence[J]) -> None:
+        if self._sink.closed:
+            self._close_soon()
+        else:
+            await self._sink.asend_batch(values)
+
+    async def __araise__(self, exc: Exception) -> bool:
+        if not self._sink.closed:
+            await self._sink.araise(exc)
+
+        return False
+
+    async def __aclose__(self) -> None:
+        # Inner observer should resolve to None when no error is registered
+        with suppress(InvalidStateError):
+            self.resolve(None)
+
+        self._sink._release(self)
+
+
+class _MergeSink(SingleStream[J]):
+    """Stream that merges the data of multiple inner observables, as it arrives.
+
+    At most ``max_concurrent`` inner observables are subscribed at once, the
+    remaining wait in a queue. Stream closes once it is sealed and every inner
+    observable is done.
+    """
+
+    __slots__ = ("_slot", "_queue", "_active", "_sealed", "_disposing", "_max_concurrent")
+
+    def __init__(self, max_concurrent: T.Optional[int], **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._slot: T.Optional["Future[None]"] = None
+        self._queue: T.Deque[Observable[J]] = deque()
+        self._active: T.Dict[_InnerObserver[J], T.Optional[Disposable]] = {}
+        self._sealed = False
+        self._disposing: T.Set["Task[None]"] = set()
+        self._max_concurrent = max_concurrent
+
+    @property
+    def full(self) -> bool:
+        """Property that indicates if no more inner observables can be subscribed now."""
+        return self._max_concurrent is not None and len(self._active) >= self._max_concurrent
+
+    def _add(self, source: Observable[J]) -> None:
+        """Subscribe inner observable, or queue it if the concurrency limit was reached."""
+        if self.closed:
+            return
+
+        if self.full:
+            self._queue.append(source)
+        else:
+            self._subscribe(source)
+
+    def _subscribe(self, source: Observable[J]) -> None:
+        inner: _InnerObserver[J] = _InnerObserver(self, loop=self.loop)
+        self._active[inner] = None
+
+        try:
+            disposable = observe(source, inner)
+        except Exception:
+            del self._active[inner]
+            raise
+
+        if inner in self._active:
+            self._active[inner] = disposable
+
+    def _release(self, inner: _InnerObserver[J]) -> None:
+        """Dispose a finished inner subscription, and subscribe the next queued observable."""
+        if inner not in self._active:
+            return
+
+        disposable = self._active.pop(inner)
+        if disposable:
+            task = self.loop.create_task(adispose(disposable))
+            self._disposing.add(task)
+            task.add_done_callback(self._disposing.discard)
+
+        if self.closed:
+            return
+
+        while self._queue and not self.full:
+            self._subscribe(self._queue.popleft())
+
+        slot, self._slot = self._slot, None
+        if slot and not slot.done():
+            slot.set_result(None)
+
+        self._close_if_done()
+
+    def _seal(self) -> None:
+        """Signal that no more inner observables will be added."""
+        self._sealed = True
+        self._close_if_done()
+
+    def _close_if_done(self) -> None:
+        if self._sealed and not (self._active or self._queue):
+            self._close_soon()
+
+    async def _wait_slot(self) -> None:
+        """Wait until another inner observable can be subscribed, or this stream closes."""
+        while self.full and not self.closed:
+            if self._slot is None:
+                self._slot = self.loop.create_future()
+
+            await self._slot
+
+    async def __aclose__(self) -> None:
+        self._queue.clear()
+
+        # Stop remaining inner observables
+        for inner in tuple(self._active):
+            if not inner.closed:
+                inner._close_soon()
+
+        slot, self._slot = self._slot, None
+        if slot and not slot.done():
+            slot.set_result(None)
+
+        # Finish disposing inner subscriptions before observer is notified
+        if self._disposing:
+            await wait(tuple(self._disposing))
+
+        await super().__aclose__()
+
+
+class Merge(Observable[J]):
+    """Observable that outputs the data of multiple observable sources, as it arrives."""
+
+    __slots__ = ("_sources", "_max_concurrent")
+
+    def __init__(
+        self,
+        *observables: Observable[T.Any],
+        max_concurrent: T.Optional[int] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """Merge constructor.
+
+        Arguments:
+            observables: Observables to be merged.
+            max_concurrent: Maximum amount of sources subscribed at once. The
+                remaining are subscribed, in order, as the previous ones finish.
+                By default all sources are subscribed at once.
+            kwargs: Keyword parameters for super.
+
+        Raises:
+            ValueError: If max_concurrent isn't positive.
+
+        """
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive")
+
+        super().__init__(**kwargs)
+
+        self._sources = observables
+        self._max_concurrent = max_concurrent
+
+    def __observe__(self, observer: Observer[J, T.Any]) -> Disposable:
+        sink: _MergeSink[J] = _MergeSink(self._max_concurrent, loop=observer.loop)
+        with dispose_sink(sink):
+            for source in self._sources:
+                sink._add(source)
+
+            sink._seal()
+
+            return observe(sink, observer)
+
+
+def merge_op(
+    *observables: Observable[T.Any], max_concurrent: T.Optional[int] = None
+) -> T.Callable[[Observable[T.Any]], Merge[T.Any]]:
+    """Partial implementation of :class:`~.Merge` to be used with operator semantics.
+
+    Returns:
+        Partial implementation of Merge.
+
+    """
+    return T.cast(
+        T.Callable[[Observable[T.Any]], Merge[T.Any]],
+        partial(Merge, *observables, max_concurrent=max_concurrent),
+    )
@@ -15,6 +15,8 @@ K = T.TypeVar("K")
 
 
 class _MinSink(SingleStream[K]):
+    __slots__ = ("_min",)
+
     def __init__(self, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
@@ -27,6 +29,15 @@ class _MinSink(SingleStream[K]):
         if is_greater:
             setattr(self, "_min", value)
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        try:
+            value = min(values)
+        except Exception:
+            # Let each value fail individually, as they would if sent one by one
+            return await self._asend_each(values)
+
+        await self.__asend__(value)
+
     async def __aclose__(self) -> None:
         try:
             awaitable = super().__asend__(getattr(self, "_min"))
@@ -52,6 +63,8 @@ class Min(Observable[K]):
         This observable only outputs data after source observable has closed.
     """
 
+    __slots__ = ("_source",)
+
     def __init__(self, source: Observable[K], **kwargs: T.Any) -> None:
         """Min constructor.
 
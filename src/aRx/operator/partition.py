@@ -0,0 +1,310 @@
+__all__ = ("Partition", "partition_op")
+
+# Internal
+import typing as T
+from asyncio import InvalidStateError, iscoroutinefunction
+from functools import partial
+from contextlib import suppress
+
+# Project
+from ..stream import MultiStream
+from ..overflow import Overflow
+from ..abstract.base import Base
+from ..abstract.observer import Observer
+from ..abstract.disposable import Disposable, adispose
+from ..abstract.observable import Observable, observe
+from ..disposable.anonymous_disposable import AnonymousDisposable
+
+# Generic Types
+K = T.TypeVar("K")
+
+Classifier = T.Callable[[K, int], T.Union[T.Awaitable[int], int]]
+
+
+class _PartitionSink(Observer[K, None]):
+    __slots__ = ("_index", "_branches", "_classifier")
+
+    def __init__(
+        self,
+        classifier: Classifier[K],
+        branches: T.Sequence[MultiStream[K]],
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._index = 0
+        self._branches = branches
+        self._classifier = classifier
+
+    async def __asend__(self, value: K) -> None:
+        index = self._index
+        self._index += 1
+
+        branch = self._classifier(value, index)
+
+        if iscoroutinefunction(self._classifier):
+            branch = await T.cast(T.Awaitable[int], branch)
+
+        stream = self._branches[T.cast(int, branch)]
+
+        # Remove reference early to avoid keeping large objects in memory
+        res = stream.asend(value)
+        del value
+
+        await res
+
+    async def _flush(self, batches: T.Dict[int, T.List[K]]) -> None:
+        for branch, values in batches.items():
+            await self._branches[branch].asend_batch(values)
+
+        batches.clear()
+
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        if iscoroutinefunction(self._classifier):
+            # Asynchronous classifiers are awaited one value at a time
+            return await self._asend_each(values)
+
+        # Group data by branch, keeping their order
+        batches: T.Dict[int, T.List[K]] = {}
+        branches = range(len(self._branches))
+        for value in values:
+            index = self._index
+            self._index += 1
+
+            try:
+                branch = branches[T.cast(int, self._classifier(value, index))]
+            except Exception as exc:
+                # Forward what was classified so far, then handle the error in place
+                await self._flush(batches)
+
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    return
+            else:
+                batch = batches.get(branch, None)
+                if batch is None:
+                    batches[branch] = [value]
+                else:
+                    batch.append(value)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del values
+
+        await self._flush(batches)
+
+    async def __araise__(self, ex: Exception) -> bool:
+        for stream in self._branches:
+            if not stream.closed:
+                await stream.araise(ex)
+
+        return False
+
+    async def __aclose__(self) -> None:
+        # Sink should resolve to None when no error is registered
+        with suppress(InvalidStateError):
+            self.resolve(None)
+
+        for stream in self._branches:
+            if not stream.closed:
+                await stream.aclose()
+
+
+class _Branch(Observable[K]):
+    """Observable of the data classified into one of the partition branches."""
+
+    __slots__ = ("_partition", "_index")
+
+    def __init__(self, partition: "Partition[K]", index: int, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._index = index
+        self._partition = partition
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> AnonymousDisposable:
+        return self._partition._observe_branch(observer, self._index)
+
+
+async def _release(connection: Disposable, sink: _PartitionSink[K]) -> None:
+    await adispose(connection)
+
+    # Observers of the detached branches close with them
+    if not sink.closed:
+        await sink.aclose()
+
+
+class Partition(Base, T.Generic[K]):
+    """Split an observable source into branches, classifying each data only once.
+
+    Unlike applying multiple :class:`~.Filter` to the same source, source is
+    subscribed a single time, when the first observer subscribes to any of
+    the branches, and unsubscribed when the last one leaves.
+
+    Each branch is a :class:`~.MultiStream`, so data classified into a branch
+    without observers is discarded instead of holding back the other branches.
+    Branches can be decoupled with a bounded queue per observer, through the
+    ``maxsize`` and ``overflow`` parameters, so a slow branch doesn't stall the
+    others either.
+
+    Partition is a sequence of its branches, so it can be unpacked:
+
+    .. code-block:: python
+
+        odds, evens = source | op.partition_op(lambda x, _: x % 2 == 1)
+
+    .. Note::
+
+        Errors are delivered to all branches.
+    """
+
+    __slots__ = (
+        "_sink",
+        "_count",
+        "_source",
+        "_maxsize",
+        "_branches",
+        "_overflow",
+        "_classifier",
+        "_connection",
+    )
+
+    def __init__(
+        self,
+        classifier: T.Callable[[K, int], T.Any],
+        source: Observable[K],
+        *,
+        count: T.Optional[int] = None,
+        maxsize: T.Optional[int] = None,
+        overflow: Overflow = Overflow.BLOCK,
+    ) -> None:
+        """Partition constructor.
+
+        Arguments:
+            classifier: Without ``count``, a predicate that routes data to the first branch when
+                true and to the second one when false. Otherwise, a function returning the
+                index of the branch each data is routed to.
+            source: Observable source.
+            count: Amount of branches, when using a classifier.
+            maxsize: Maximum amount of data queued for each branch observer, see
+                :class:`~.MultiStream`.
+            overflow: Policy applied when a branch observer queue is full.
+
+        Raises:
+            ValueError: If count is less than one.
+
+        """
+        if count is None:
+            count = 2
+            classifier = _from_predicate(classifier)
+        elif count < 1:
+            raise ValueError("count must be positive")
+
+        super().__init__()
+
+        self._source = source
+        self._classifier = classifier
+
+        # Internal
+        self._sink: T.Optional[_PartitionSink[K]] = None
+        self._count = 0
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._connection: T.Optional[Disposable] = None
+        self._branches = tuple(self._stream() for _ in range(count))
+
+    def __len__(self) -> int:
+        return len(self._branches)
+
+    def __getitem__(self, index: int) -> Observable[K]:
+        return _Branch(self, range(len(self._branches))[index])
+
+    def __iter__(self) -> T.Iterator[Observable[K]]:
+        return (_Branch(self, index) for index in range(len(self._branches)))
+
+    @property
+    def connected(self) -> bool:
+        """Property that indicates if source is currently subscribed."""
+        return self._sink is not None
+
+    def _stream(self) -> MultiStream[K]:
+        return MultiStream(maxsize=self._maxsize, overflow=self._overflow)
+
+    def _disconnect(self) -> None:
+        sink, self._sink = self._sink, None
+        connection, self._connection = self._connection, None
+        if sink is None or connection is None:
+            return
+
+        # Later observers subscribe to new branches, the detached ones close with the sink
+        self._branches = tuple(self._stream() for _ in self._branches)
+        sink.loop.create_task(_release(connection, sink))
+
+    def _observe_branch(self, observer: Observer[K, T.Any], index: int) -> AnonymousDisposable:
+        if self._sink is None and any(branch.closed for branch in self._branches):
+            self._branches = tuple(self._stream() for _ in self._branches)
+
+        disposable = observe(self._branches[index], observer)
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+
+            self._count -= 1
+            if self._count == 0:
+                self._disconnect()
+
+        async def dispose() -> None:
+            observer._remove_close_listener(release)
+            release()
+            await adispose(disposable)
+
+        self._count += 1
+        if self._count == 1:
+            sink: _PartitionSink[K] = _PartitionSink(
+                self._classifier, self._branches, loop=observer.loop
+            )
+            self._sink = sink
+            self._connection = observe(self._source, sink)
+
+        observer._add_close_listener(release)
+
+        return AnonymousDisposable(dispose)
+
+
+def _from_predicate(predicate: T.Callable[[K, int], T.Any]) -> Classifier[K]:
+    if iscoroutinefunction(predicate):
+
+        async def classify(value: K, index: int) -> int:
+            return 0 if await predicate(value, index) else 1
+
+    else:
+
+        def classify(value: K, index: int) -> int:  # type: ignore
+            return 0 if predicate(value, index) else 1
+
+    return classify
+
+
+def partition_op(
+    classifier: T.Callable[[K, int], T.Any], **kwargs: T.Any
+) -> T.Callable[[Observable[K]], Partition[K]]:
+    """Partial implementation of :class:`~.Partition` to be used with operator semantics.
+
+    Arguments:
+        classifier: Predicate, or classifier when ``count`` is given.
+        kwargs: Keyword parameters for Partition.
+
+    Returns:
+        Partial implementation of Partition.
+
+    """
+    return T.cast(
+        T.Callable[[Observable[K]], Partition[K]], partial(Partition, classifier, **kwargs)
+    )
@@ -0,0 +1,105 @@
+__all__ = ("Publish", "publish_op")
+
+# Internal
+import typing as T
+
+# Project
+from ..stream import MultiStream
+from ..abstract.observer import Observer
+from ..abstract.disposable import Disposable, adispose
+from ..abstract.observable import Observable, observe
+from ..disposable.anonymous_disposable import AnonymousDisposable
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+async def _release(connection: Disposable, stream: MultiStream[K]) -> None:
+    await adispose(connection)
+
+    # Observers of the detached stream close with it
+    if not stream.closed:
+        await stream.aclose()
+
+
+class Publish(Observable[K]):
+    """Connectable observable that shares a single subscription of its source.
+
+    Observers are subscribed to an internal :class:`~.MultiStream`, which is
+    only subscribed to the source when :meth:`connect` is called. So the
+    source work runs once and is shared by all observers.
+
+    .. Note::
+
+        Data outputted by source before connection, or while nobody is
+        observing, is lost, as in any other hot stream.
+    """
+
+    __slots__ = ("_source", "_stream", "_connection")
+
+    def __init__(self, source: Observable[K], **kwargs: T.Any) -> None:
+        """Publish constructor.
+
+        Arguments:
+            source: Observable source.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._source = source
+
+        # Internal
+        self._stream: MultiStream[K] = MultiStream()
+        self._connection: T.Optional[Disposable] = None
+
+    @property
+    def connected(self) -> bool:
+        """Property that indicates if the shared stream is subscribed to source."""
+        return self._connection is not None
+
+    def connect(self) -> Disposable:
+        """Subscribe shared stream to source, if not connected already.
+
+        Returns:
+            Disposable that disconnects from source, closing current observers.
+
+        """
+        if self._connection is None:
+            if self._stream.closed:
+                self._stream = MultiStream()
+
+            self._connection = observe(self._source, self._stream)
+
+        return AnonymousDisposable(self._disconnect)
+
+    def _disconnect(self) -> T.Optional[T.Awaitable[None]]:
+        """Detach shared stream from source.
+
+        Detaching is synchronous, so any connection made afterwards uses a new
+        shared stream. Disposing the old subscription is left to the returned
+        awaitable.
+
+        """
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return None
+
+        stream, self._stream = self._stream, MultiStream()
+        return _release(connection, stream)
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> Disposable:
+        if self._connection is None and self._stream.closed:
+            self._stream = MultiStream()
+
+        return observe(self._stream, observer)
+
+
+def publish_op() -> T.Type[Publish[K]]:
+    """Implementation of :class:`~.Publish` to be used with operator semantics.
+
+    Returns:
+        Implementation of Publish.
+
+    """
+    return Publish
@@ -0,0 +1,109 @@
+__all__ = ("RefCount", "ref_count_op", "share_op")
+
+# Internal
+import typing as T
+from asyncio import iscoroutine
+
+# Project
+from .publish import Publish
+from ..abstract.observer import Observer
+from ..abstract.disposable import adispose
+from ..abstract.observable import Observable, observe
+from ..disposable.anonymous_disposable import AnonymousDisposable
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class RefCount(Observable[K]):
+    """Observable that keeps a :class:`~.Publish` connected while it has observers.
+
+    Source is connected when the first observer subscribes and disconnected
+    when the last one leaves, either by disposing its subscription or by
+    closing. A later observer connects source again.
+    """
+
+    __slots__ = ("_source", "_count")
+
+    def __init__(self, source: Publish[K], **kwargs: T.Any) -> None:
+        """RefCount constructor.
+
+        Arguments:
+            source: Connectable observable source.
+            kwargs: Keyword parameters for super.
+
+        Raises:
+            TypeError: If source is not a :class:`~.Publish`.
+
+        """
+        if not isinstance(source, Publish):
+            raise TypeError("RefCount source must be a Publish")
+
+        super().__init__(**kwargs)
+
+        self._source = source
+
+        # Internal
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Amount of observers currently keeping source connected."""
+        return self._count
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> AnonymousDisposable:
+        source = self._source
+        disposable = observe(source, observer)
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+
+            self._count -= 1
+            if self._count == 0:
+                disconnection = source._disconnect()
+                if iscoroutine(disconnection):
+                    observer.loop.create_task(disconnection)
+
+        async def dispose() -> None:
+            observer._remove_close_listener(release)
+            release()
+            await adispose(disposable)
+
+        self._count += 1
+        if self._count == 1:
+            source.connect()
+
+        observer._add_close_listener(release)
+
+        return AnonymousDisposable(dispose)
+
+
+def ref_count_op() -> T.Type[RefCount[K]]:
+    """Implementation of :class:`~.RefCount` to be used with operator semantics.
+
+    Returns:
+        Implementation of RefCount.
+
+    """
+    return RefCount
+
+
+def share_op() -> T.Callable[[Observable[K]], RefCount[K]]:
+    """Share a single subscription of source among all observers.
+
+    Same as applying :func:`~.publish_op` followed by :func:`~.ref_count_op`.
+
+    Returns:
+        Function that wraps source in a reference counted :class:`~.Publish`.
+
+    """
+
+    def share(source: Observable[K]) -> RefCount[K]:
+        return RefCount(Publish(source))
+
+    return share
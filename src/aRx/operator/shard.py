@@ -0,0 +1,392 @@
+__all__ = ("Shard", "shard_op")
+
+# Internal
+import typing as T
+import pickle
+from queue import Empty
+from asyncio import Task, Future, wait, get_event_loop, new_event_loop, set_event_loop
+from functools import partial
+from contextlib import suppress
+from multiprocessing import get_context
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+
+# Project
+from ..error import ShardWorkerError, ObserverClosedError
+from ..disposable import CompositeDisposable
+from ..abstract.observer import Observer
+from ..misc.dispose_sink import dispose_sink
+from ..abstract.observable import Observable, observe
+from ..stream.single_stream import SingleStream
+from ..observer.anonymous_observer import AnonymousObserver
+
+# Generic Types
+J = T.TypeVar("J")
+K = T.TypeVar("K")
+
+Factory = T.Callable[[Observable[J]], Observable[K]]
+
+# Messages from workers, as (kind, payload)
+_DATA = 0  # Output data produced by the worker pipeline
+_DONE = 1  # Input chunk processed, along with the output data produced by it
+_ERROR = 2  # Error raised by the worker pipeline
+_END = 3  # Worker pipeline closed
+
+# Interval in which readers check if their worker is still alive
+_POLL_INTERVAL = 0.1
+
+
+def _portable(exc: Exception) -> Exception:
+    """Exceptions that can't be pickled are replaced, so they still reach the parent."""
+    try:
+        pickle.dumps(exc)
+    except Exception:
+        return RuntimeError(repr(exc))
+
+    return exc
+
+
+async def _serve(factory: Factory[J, K], inbox: T.Any, outbox: T.Any) -> None:
+    loop = get_event_loop()
+    results: T.List[K] = []
+    scheduled = False
+
+    def flush(kind: int = _DATA) -> None:
+        nonlocal results, scheduled
+
+        scheduled = False
+        if results or kind != _DATA:
+            outbox.put((kind, results))
+            results = []
+
+    def collect(value: K) -> None:
+        nonlocal scheduled
+
+        results.append(value)
+
+        # Data produced outside of an input chunk is sent once pipeline is idle
+        if not scheduled:
+            scheduled = True
+            loop.call_soon(flush)
+
+    def report(exc: Exception) -> bool:
+        flush()
+        outbox.put((_ERROR, _portable(exc)))
+        return False
+
+    stream: SingleStream[J] = SingleStream()
+    observer: AnonymousObserver[K, None] = AnonymousObserver(collect, report)
+    observe(factory(stream), observer)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            chunk = await loop.run_in_executor(executor, inbox.get)
+            if chunk is None:
+                break
+
+            if not stream.closed:
+                await stream.asend_batch(chunk)
+
+            # Remove reference early to avoid keeping large objects in memory
+            del chunk
+
+            flush(_DONE)
+
+    await stream.aclose()
+    with suppress(Exception):
+        await observer
+
+    flush()
+    outbox.put((_END, None))
+
+
+def _run_worker(factory: Factory[J, K], inbox: T.Any, outbox: T.Any) -> None:
+    """Worker process entry point, runs the sub-pipeline in its own event loop."""
+    loop = new_event_loop()
+    set_event_loop(loop)
+    try:
+        loop.run_until_complete(_serve(factory, inbox, outbox))
+    finally:
+        loop.close()
+
+
+def _receive(outbox: T.Any) -> T.Optional[T.Tuple[int, T.Any]]:
+    try:
+        return T.cast(T.Tuple[int, T.Any], outbox.get(timeout=_POLL_INTERVAL))
+    except Empty:
+        return None
+
+
+class _ShardSink(T.Generic[J, K], SingleStream[K]):
+    __slots__ = (
+        "_key",
+        "_slot",
+        "_chunks",
+        "_inboxes",
+        "_readers",
+        "_backlog",
+        "_in_flight",
+        "_processes",
+        "_chunksize",
+        "_scheduled",
+        "_reader_executor",
+    )
+
+    def __init__(
+        self,
+        workers: int,
+        key: T.Callable[[J], T.Hashable],
+        factory: Factory[J, K],
+        chunksize: int,
+        backlog: int,
+        context: BaseContext,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._slot: T.Optional["Future[None]"] = None
+        self._chunks: T.List[T.List[J]] = [[] for _ in range(workers)]
+        self._backlog = backlog
+        self._chunksize = chunksize
+        self._in_flight = [0] * workers
+        self._scheduled = False
+
+        self._inboxes: T.List[T.Any] = []
+        self._processes: T.List[T.Any] = []
+        for _ in range(workers):
+            inbox, outbox = context.Queue(), context.Queue()
+            process = context.Process(
+                target=_run_worker, args=(factory, inbox, outbox), daemon=True
+            )
+            process.start()
+
+            self._inboxes.append((inbox, outbox))
+            self._processes.append(process)
+
+        # Outputs of each worker are received in their own thread
+        self._reader_executor = ThreadPoolExecutor(max_workers=workers)
+        self._readers: T.List["Task[None]"] = [
+            self.loop.create_task(self._read(index)) for index in range(workers)
+        ]
+
+        # Release source held back by a busy worker as soon as this starts closing
+        self._add_close_listener(self._wake_slot)
+
+    @property
+    def demand(self) -> T.Optional[int]:
+        # Workers don't map input to output one to one, source is held back by the backlog
+        return None
+
+    def _wake_slot(self) -> None:
+        slot, self._slot = self._slot, None
+        if slot and not slot.done():
+            slot.set_result(None)
+
+    def _send(self, index: int) -> None:
+        chunk, self._chunks[index] = self._chunks[index], []
+
+        self._in_flight[index] += 1
+        self._inboxes[index][0].put(chunk)
+
+    def _send_partial(self) -> None:
+        self._scheduled = False
+
+        if self.closed:
+            return
+
+        for index, chunk in enumerate(self._chunks):
+            if chunk:
+                self._send(index)
+
+    async def _read(self, index: int) -> None:
+        outbox = self._inboxes[index][1]
+        process = self._processes[index]
+        try:
+            while True:
+                message = await self.loop.run_in_executor(
+                    self._reader_executor, _receive, outbox
+                )
+
+                if message is None:
+                    if process.exitcode is None:
+                        continue
+
+                    raise ShardWorkerError(
+                        f"Shard worker {index} exited unexpectedly, code: {process.exitcode}"
+                    )
+
+                kind, payload = message
+                if kind == _END:
+                    break
+
+                if kind == _ERROR:
+                    await SingleStream.__araise__(self, payload)
+                    continue
+
+                if kind == _DONE:
+                    self._in_flight[index] -= 1
+                    self._wake_slot()
+
+                if payload:
+                    await SingleStream.__asend_batch__(self, payload)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del payload
+        except ObserverClosedError:
+            pass
+        except Exception as exc:
+            if not self.closed:
+                await self.araise(exc)
+                self._close_soon()
+            elif self._observer is not None and not self._observer.closed:
+                # Close is waiting for this worker, error goes straight to observer
+                await self._observer.araise(exc)
+
+    async def __asend__(self, value: J) -> None:
+        index = hash(self._key(value)) % len(self._chunks)
+
+        # Source is held back while the worker is busy with too many chunks
+        while self._in_flight[index] >= self._backlog and not self.closed:
+            if self._slot is None:
+                self._slot = self.loop.create_future()
+
+            await self._slot
+
+        if self.closed:
+            return
+
+        chunk = self._chunks[index]
+        chunk.append(value)
+
+        if len(chunk) >= self._chunksize:
+            self._send(index)
+        elif not self._scheduled:
+            # Partial chunks are sent once source stops sending, at the next loop iteration
+            self._scheduled = True
+            self.loop.call_soon(self._send_partial)
+
+    async def __aclose__(self) -> None:
+        if self._observer is None or self._observer.closed:
+            # Nothing can be delivered anymore
+            for process in self._processes:
+                process.terminate()
+
+            for reader in self._readers:
+                reader.cancel()
+        else:
+            for index, chunk in enumerate(self._chunks):
+                if chunk:
+                    self._send(index)
+
+            # Workers finish processing their inbox, then close their pipeline
+            for inbox, _ in self._inboxes:
+                inbox.put(None)
+
+        await wait(self._readers)
+
+        for process in self._processes:
+            await self.loop.run_in_executor(self._reader_executor, process.join)
+
+        self._reader_executor.shutdown(wait=False)
+
+        for inbox, outbox in self._inboxes:
+            inbox.close()
+            outbox.close()
+
+        await super().__aclose__()
+
+
+class Shard(T.Generic[J, K], Observable[K]):
+    """Observable that runs a sub-pipeline over multiple worker processes.
+
+    Each worker process runs its own event loop, with the sub-pipeline built by
+    factory over the data routed to it. Data is routed by the hash of its key,
+    so data with the same key is processed by the same worker, in order. Output
+    of all workers is merged as it arrives.
+
+    .. Note::
+
+        Factory, data and output must be picklable. With the ``spawn`` start
+        method, factory must also be importable, like a module level function.
+    """
+
+    __slots__ = ("_key", "_source", "_factory", "_workers", "_backlog", "_context", "_chunksize")
+
+    def __init__(
+        self,
+        workers: int,
+        key: T.Callable[[J], T.Hashable],
+        factory: Factory[J, K],
+        source: Observable[J],
+        *,
+        chunksize: int = 64,
+        backlog: int = 4,
+        context: T.Optional[BaseContext] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """Shard constructor.
+
+        Arguments:
+            workers: Amount of worker processes.
+            key: Function that returns the key of each data, used for routing.
+            factory: Function that receives an observable and returns the
+                sub-pipeline applied to it inside each worker.
+            source: Observable source.
+            chunksize: Amount of data sent to a worker at once. Partial chunks
+                are sent as soon as the source stops sending.
+            backlog: Maximum amount of chunks waiting in each worker. Source is
+                held back while the worker of its data is full.
+            context: Multiprocessing context used to start workers. By default
+                the default multiprocessing context.
+            kwargs: Keyword parameters for super.
+
+        Raises:
+            ValueError: If workers, chunksize or backlog isn't positive.
+
+        """
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        if chunksize < 1:
+            raise ValueError("chunksize must be positive")
+
+        if backlog < 1:
+            raise ValueError("backlog must be positive")
+
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._source = source
+        self._factory = factory
+        self._workers = workers
+        self._backlog = backlog
+        self._context = get_context() if context is None else context
+        self._chunksize = chunksize
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
+        sink: _ShardSink[J, K] = _ShardSink(
+            self._workers,
+            self._key,
+            self._factory,
+            self._chunksize,
+            self._backlog,
+            self._context,
+            loop=observer.loop,
+        )
+        with dispose_sink(sink):
+            return CompositeDisposable(observe(self._source, sink), observe(sink, observer))
+
+
+def shard_op(
+    workers: int, key: T.Callable[[J], T.Hashable], factory: Factory[J, K], **kwargs: T.Any
+) -> T.Callable[[Observable[J]], Shard[J, K]]:
+    """Partial implementation of :class:`~.Shard` to be used with operator semantics.
+
+    Returns:
+        Partial implementation of Shard.
+
+    """
+    return T.cast(
+        T.Callable[[Observable[J]], Shard[J, K]], partial(Shard, workers, key, factory, **kwargs)
+    )
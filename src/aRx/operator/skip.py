@@ -7,6 +7,7 @@ from collections import deque
 
 # Project
 from ..disposable import CompositeDisposable
+from ..misc.stage import DROP, Stage, StageFactory
 from ..abstract.observer import Observer
 from ..misc.dispose_sink import dispose_sink
 from ..abstract.observable import Observable, observe
@@ -17,6 +18,8 @@ K = T.TypeVar("K")
 
 
 class _SkipSink(SingleStream[K]):
+    __slots__ = ("_count", "_reverse_queue")
+
     def __init__(self, count: int, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
@@ -42,6 +45,15 @@ class _SkipSink(SingleStream[K]):
 
         await awaitable
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        if self._reverse_queue is not None:
+            return await self._asend_each(values)
+
+        skipped = min(self._count, len(values))
+        self._count -= skipped
+
+        await super().__asend_batch__(values[skipped:])
+
     async def __aclose__(self) -> None:
         if self._reverse_queue is not None:
             self._reverse_queue.clear()
@@ -49,9 +61,26 @@ class _SkipSink(SingleStream[K]):
         await super().__aclose__()
 
 
+def _skip_stage(count: int) -> Stage:
+    remaining = count
+
+    def stage(value: K) -> T.Any:
+        nonlocal remaining
+
+        if remaining > 0:
+            remaining -= 1
+            return DROP
+
+        return value
+
+    return stage
+
+
 class Skip(Observable[K]):
     """Observable that outputs data from source skipping some."""
 
+    __slots__ = ("_count", "_source")
+
     def __init__(self, count: int, source: Observable[K], **kwargs: T.Any) -> None:
         """Skip constructor.
 
@@ -72,6 +101,13 @@ class Skip(Observable[K]):
         self._count = count
         self._source = source
 
+    def _stage_factory(self) -> T.Optional[StageFactory]:
+        # Skipping from the end requires buffering until source closes
+        if self._count < 0:
+            return None
+
+        return partial(_skip_stage, self._count)
+
     def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
         sink: _SkipSink[K] = _SkipSink(self._count, loop=observer.loop)
         with dispose_sink(sink):
@@ -4,9 +4,11 @@ __all__ = ("Stop", "stop_op")
 import typing as T
 from asyncio import iscoroutinefunction
 from functools import partial
+from itertools import count
 
 # Project
 from ..disposable import CompositeDisposable
+from ..misc.stage import STOP, Stage, StageFactory
 from ..abstract.observer import Observer
 from ..misc.dispose_sink import dispose_sink
 from ..abstract.observable import Observable, observe
@@ -17,6 +19,8 @@ K = T.TypeVar("K")
 
 
 class _StopSink(SingleStream[K]):
+    __slots__ = ("_index", "_predicate")
+
     def __init__(
         self, predicate: T.Callable[[K, int], T.Union[T.Awaitable[bool], bool]], **kwargs: T.Any
     ) -> None:
@@ -33,19 +37,64 @@ class _StopSink(SingleStream[K]):
         if iscoroutinefunction(self._predicate):
             must_stop = await T.cast(T.Awaitable[bool], must_stop)
 
-        awaitable = T.cast(
-            T.Awaitable[T.Any], self.aclose() if must_stop else super().__asend__(value)
-        )
+        if must_stop:
+            self._close_soon()
+            return
+
+        awaitable = super().__asend__(value)
 
         # Remove reference early to avoid keeping large objects in memory
         del value
 
         await awaitable
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        if iscoroutinefunction(self._predicate):
+            # Asynchronous predicates are awaited one value at a time
+            return await self._asend_each(values)
+
+        start = 0
+        for position, value in enumerate(values):
+            index = self._index
+            self._index += 1
+
+            try:
+                must_stop = self._predicate(value, index)
+            except Exception as exc:
+                # Forward what passed so far, then handle the error in place
+                await super().__asend_batch__(values[start:position])
+                start = position + 1
+
+                if self.closed:
+                    raise
+
+                await self.araise(exc)
+
+                if self.closed:
+                    return
+            else:
+                if must_stop:
+                    await super().__asend_batch__(values[start:position])
+                    self._close_soon()
+                    return
+
+        await super().__asend_batch__(values[start:])
+
+
+def _stop_stage(predicate: T.Callable[[K, int], bool]) -> Stage:
+    index = count()
+
+    def stage(value: K) -> T.Any:
+        return STOP if predicate(value, next(index)) else value
+
+    return stage
+
 
 class Stop(Observable[K]):
     """Observable that stops according to a predicate."""
 
+    __slots__ = ("_source", "_predicate")
+
     def __init__(
         self,
         predicate: T.Callable[[K, int], T.Union[T.Awaitable[bool], bool]],
@@ -65,6 +114,12 @@ class Stop(Observable[K]):
         self._source = source
         self._predicate = predicate
 
+    def _stage_factory(self) -> T.Optional[StageFactory]:
+        if iscoroutinefunction(self._predicate):
+            return None
+
+        return partial(_stop_stage, self._predicate)
+
     def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
         sink: _StopSink[K] = _StopSink(self._predicate, loop=observer.loop)
         with dispose_sink(sink):
@@ -7,6 +7,7 @@ from collections import deque
 
 # Project
 from ..disposable import CompositeDisposable
+from ..misc.stage import STOP, Stage, StageFactory
 from ..abstract.observer import Observer
 from ..misc.dispose_sink import dispose_sink
 from ..abstract.observable import Observable, observe
@@ -17,6 +18,8 @@ K = T.TypeVar("K")
 
 
 class _TakeSink(SingleStream[K]):
+    __slots__ = ("_count", "_reverse_queue")
+
     def __init__(self, count: int, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
@@ -29,17 +32,31 @@ class _TakeSink(SingleStream[K]):
         if self._reverse_queue is None:
             if self._count > 0:
                 self._count -= 1
-                awaitable: T.Awaitable[T.Any] = super().__asend__(value)
-            else:
-                awaitable = self.aclose()
+                awaitable = super().__asend__(value)
 
-            # Remove reference early to avoid keeping large objects in memory
-            del value
+                # Remove reference early to avoid keeping large objects in memory
+                del value
 
-            await awaitable
+                await awaitable
+            else:
+                self._close_soon()
         else:
             self._reverse_queue.append(value)
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        if self._reverse_queue is not None:
+            self._reverse_queue.extend(values)
+            return
+
+        taken = values[: self._count]
+        self._count -= len(taken)
+
+        await super().__asend_batch__(taken)
+
+        # Data arriving after count is exhausted closes the stream
+        if len(values) > len(taken):
+            self._close_soon()
+
     async def __aclose__(self) -> None:
         while self._reverse_queue:
             await super().__asend__(self._reverse_queue.popleft())
@@ -47,7 +64,25 @@ class _TakeSink(SingleStream[K]):
         return await super().__aclose__()
 
 
+def _take_stage(count: int) -> Stage:
+    remaining = count
+
+    def stage(value: K) -> T.Any:
+        nonlocal remaining
+
+        if remaining > 0:
+            remaining -= 1
+            return value
+
+        # Data arriving after count is exhausted closes the stream
+        return STOP
+
+    return stage
+
+
 class Take(Observable[K]):
+    __slots__ = ("_count", "_source")
+
     def __init__(self, count: int, source: Observable[K], **kwargs: T.Any) -> None:
         """Take constructor.
 
@@ -73,6 +108,13 @@ class Take(Observable[K]):
         self._count = count
         self._source = source
 
+    def _stage_factory(self) -> T.Optional[StageFactory]:
+        # Taking from the end requires buffering until source closes
+        if self._count < 0:
+            return None
+
+        return partial(_take_stage, self._count)
+
     def __observe__(self, observer: Observer[K, T.Any]) -> CompositeDisposable:
         sink: _TakeSink[K] = _TakeSink(self._count, loop=observer.loop)
         with dispose_sink(sink):
@@ -0,0 +1,29 @@
+__all__ = ("Lag", "Overflow")
+
+# Internal
+import typing as T
+from enum import Enum
+
+
+class Overflow(Enum):
+    """Policy applied when data arrives at a full bounded queue."""
+
+    #: Wait until the queue has space again.
+    BLOCK = "block"
+    #: Discard the oldest queued data to make space for the new one.
+    DROP_OLDEST = "drop_oldest"
+    #: Discard the new data.
+    DROP_NEWEST = "drop_newest"
+    #: Disconnect the observer that can't keep up.
+    DISCONNECT = "disconnect"
+    #: Reject the new data with a :class:`~.BufferOverflowError`.
+    RAISE = "raise"
+
+
+class Lag(T.NamedTuple):
+    """Counters of a bounded queue in front of an observer."""
+
+    #: Amount of data waiting to be delivered.
+    pending: int
+    #: Total amount of data discarded due to overflow.
+    dropped: int
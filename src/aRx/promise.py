@@ -3,7 +3,7 @@ __all__ = ("Promise",)
 # Internal
 import typing as T
 from abc import ABCMeta, abstractmethod
-from asyncio import CancelledError, AbstractEventLoop, InvalidStateError, shield, ensure_future
+from asyncio import Future, CancelledError, InvalidStateError, ensure_future
 
 # Project
 from .abstract.promise import Promise as AbstractPromise
@@ -13,73 +13,139 @@ K = T.TypeVar("K")
 L = T.TypeVar("L")
 
 
-async def resolve_awaitable(awaitable: T.Union[K, T.Awaitable[K]], loop: AbstractEventLoop) -> K:
-    try:
-        result_fut = ensure_future(T.cast(T.Awaitable[K], awaitable), loop=loop)
-    except TypeError:
-        return T.cast(K, awaitable)  # Not an awaitable
-    else:
-        return await result_fut
-
-
 class Promise(AbstractPromise[K]):
-    """Promise implementation that maintains the callback queue using :class:`~typing.Coroutine`.
+    """Promise implementation that chains callbacks with :class:`~asyncio.Future` done callbacks.
     
     See: :class:`~.abstract.promise.Promise` for more information on the Promise abstract interface.
     """
 
+    __slots__ = ()
+
     def then(
         self, on_fulfilled: T.Callable[[K], T.Union[L, T.Awaitable[L]]]
     ) -> "ChainPromise[K, L]":
-        """Concrete implementation that wraps the received callback on a :class:`~typing.Coroutine`.
-        The :class:`~typing.Coroutine` will await the promise resolution and,
-        if no exception is raised, it will call the callback with the promise 
-        result.
+        """Concrete implementation that registers the received callback on the promise resolution.
+        If no exception is raised, the callback is called with the promise
+        result. A :class:`~asyncio.Task` is only created when the callback
+        returns an awaitable.
 
         See: :meth:`~.abstract.promise.Promise.then` for more information.
 
         """
-        return FulfillmentPromise(self, on_fulfilled, loop=self._loop)
+        return FulfillmentPromise(self, on_fulfilled, loop=self.loop)
 
     def catch(
         self, on_reject: T.Callable[[Exception], T.Union[L, T.Awaitable[L]]]
     ) -> "ChainPromise[K, L]":
-        """Concrete implementation that wraps the received callback on a :class:`~typing.Coroutine`.
-        The :class:`~typing.Coroutine` will await the promise resolution and,
-        if a exception is raised, it will call the callback with the promise 
-        exception.
+        """Concrete implementation that registers the received callback on the promise resolution.
+        If a exception is raised, the callback is called with the promise
+        exception. A :class:`~asyncio.Task` is only created when the callback
+        returns an awaitable.
 
         See: :meth:`~.abstract.promise.Promise.catch` for more information.
         
         """
-        return RejectionPromise(self, on_reject, loop=self._loop)
+        return RejectionPromise(self, on_reject, loop=self.loop)
 
     def lastly(self, on_resolved: T.Callable[[], T.Any]) -> "ChainPromise[K, K]":
-        """Concrete implementation that wraps the received callback on a :class:`~typing.Coroutine`.
-        The :class:`~typing.Coroutine` will await the promise resolution and
-        call the callback.
+        """Concrete implementation that registers the received callback on the promise resolution.
+        The callback is called regardless of the promise result. A
+        :class:`~asyncio.Task` is only created when the callback returns an
+        awaitable.
 
         See: :meth:`~.abstract.promise.Promise.lastly` for more information.
 
         """
-        return ResolutionPromise(self, on_resolved, loop=self._loop)
+        return ResolutionPromise(self, on_resolved, loop=self.loop)
 
 
 class ChainPromise(T.Generic[K, L], Promise[K], metaclass=ABCMeta):
-    """A special promise implementation used by the chained callback Promises."""
+    """A special promise implementation used by the chained callback Promises.
+
+    The chain is driven by a done callback registered on the parent promise, so
+    no :class:`~asyncio.Task` is created unless the callback returns an awaitable.
+    """
+
+    __slots__ = ("_callback", "_pending")
 
     def __init__(
         self, promise: AbstractPromise[K], callback: T.Callable[..., T.Any], **kwargs: T.Any
     ) -> None:
-        super().__init__(self._wrapper(shield(promise, loop=promise.loop), callback), **kwargs)
+        super().__init__(**kwargs)
+
+        # Internal
+        self._callback = callback
+        self._pending: T.Optional["Future[T.Any]"] = None
 
-        # Disable the "destroy pending task" warning
-        self._fut._log_destroy_pending = False  # type: ignore
+        promise._fut.add_done_callback(self._on_resolution)
 
     @abstractmethod
-    def _wrapper(self, promise: T.Awaitable[K], callback: T.Callable[..., T.Any]) -> T.Any:
+    def _handle(self, resolution: "Future[K]") -> None:
+        """Execute callback according to parent resolution and settle this promise.
+
+        Arguments:
+            resolution: Parent promise internal future, already done.
+
+        """
         raise NotImplementedError
 
+    def _on_resolution(self, resolution: "Future[K]") -> None:
+        # Chain was cancelled before parent resolution
+        if self._fut.done():
+            return
+
+        try:
+            self._handle(resolution)
+        except CancelledError:
+            # CancelledError must be propagated
+            self._fut.cancel()
+        except Exception as exc:
+            if not self._fut.done():
+                self._fut.set_exception(exc)
+
+    def _chain(self, result: T.Union[L, T.Awaitable[L]]) -> None:
+        """Settle this promise with callback result, awaiting it first if necessary."""
+        # Callback may have cancelled this promise
+        if self._fut.done():
+            return
+
+        try:
+            self._pending = ensure_future(T.cast(T.Awaitable[L], result), loop=self.loop)
+        except TypeError:
+            self._settle(T.cast(L, result))  # Not an awaitable
+        else:
+            self._pending.add_done_callback(self._on_callback_resolution)
+
+    def _on_callback_resolution(self, pending: "Future[L]") -> None:
+        self._pending = None
+
+        if self._fut.done():
+            return
+
+        if pending.cancelled():
+            self._fut.cancel()
+        else:
+            exc = pending.exception()
+            if exc is None:
+                self._settle(pending.result())
+            else:
+                self._fut.set_exception(exc)
+
+    def _settle(self, result: T.Any) -> None:
+        """Resolve this promise with the final callback result."""
+        self._fut.set_result(result)
+
+    def cancel(self) -> bool:
+        """See: :meth:`~aRx.abstract.promise.Promise.cancel` for more information.
+
+        Also cancels the awaitable returned by the callback, if it is still pending.
+
+        """
+        if self._pending:
+            self._pending.cancel()
+
+        return super().cancel()
+
     def resolve(self, _: K) -> None:
         """See: :meth:`~aRx.abstract.promise.Promise.resolve` for more information.
         
@@ -100,6 +166,8 @@ class ChainPromise(T.Generic[K, L], Promise[K], metaclass=ABCMeta):
 
 
 class FulfillmentPromise(ChainPromise[K, L]):
+    __slots__ = ()
+
     def __init__(
         self,
         promise: AbstractPromise[K],
@@ -108,23 +176,18 @@ class FulfillmentPromise(ChainPromise[K, L]):
     ) -> None:
         super().__init__(promise, on_fulfilled, **kwargs)
 
-    async def _wrapper(
-        self, promise: T.Awaitable[K], on_fulfilled: T.Callable[[K], T.Union[L, T.Awaitable[L]]]
-    ) -> L:
-        """Coroutine that wraps a promise and manages a fulfillment callback.
+    def _handle(self, resolution: "Future[K]") -> None:
+        """Call fulfillment callback with parent result.
 
-        Arguments:
-            promise: Promise to be awaited for chain action
-            on_fulfilled: Fulfillment callback.
-
-        Returns:
-            Callback result.
+        Parent exception or cancellation is passed along, without calling the callback.
 
         """
-        return await resolve_awaitable(on_fulfilled(await promise), self.loop)
+        self._chain(self._callback(resolution.result()))
 
 
 class RejectionPromise(ChainPromise[K, L]):
+    __slots__ = ()
+
     def __init__(
         self,
         promise: AbstractPromise[K],
@@ -133,52 +196,51 @@ class RejectionPromise(ChainPromise[K, L]):
     ) -> None:
         super().__init__(promise, on_reject, **kwargs)
 
-    async def _wrapper(
-        self,
-        promise: T.Awaitable[K],
-        on_reject: T.Callable[[Exception], T.Union[L, T.Awaitable[L]]],
-    ) -> T.Union[L, K]:
-        """Coroutine that wraps a promise and manages a rejection callback.
+    def _handle(self, resolution: "Future[K]") -> None:
+        """Call rejection callback with parent exception.
 
-        Arguments:
-            promise: Promise to be awaited for chain action
-            on_reject: Rejection callback.
-
-        Returns:
-            Callback result.
+        Parent result or cancellation is passed along, without calling the callback.
 
         """
         try:
-            return await promise
+            result = resolution.result()
         except CancelledError:
             raise  # CancelledError must be propagated
         except Exception as exc:
-            return await resolve_awaitable(on_reject(exc), self.loop)
+            self._chain(self._callback(exc))
+        else:
+            self._fut.set_result(result)
 
 
 class ResolutionPromise(ChainPromise[K, K]):
+    __slots__ = ("_resolution",)
+
     def __init__(
         self, promise: AbstractPromise[K], on_resolution: T.Callable[[], T.Any], **kwargs: T.Any
     ) -> None:
         super().__init__(promise, on_resolution, **kwargs)
 
-        self._direct_cancellation = False
+        self._resolution: T.Optional["Future[K]"] = None
 
-    def cancel(self) -> bool:
-        self._direct_cancellation = True
-        return super().cancel()
+    def _handle(self, resolution: "Future[K]") -> None:
+        """Call resolution callback, then pass parent resolution along.
+
+        The callback is executed always, except in the case this promise was
+        cancelled first. If it fails, its exception is used instead.
 
-    async def _wrapper(self, promise: T.Awaitable[K], on_resolution: T.Callable[[], T.Any]) -> K:
-        """Coroutine that wraps a promise and manages a resolution callback.
-        Arguments:
-            promise: Promise to be awaited for chain action
-            on_resolution: Resolution callback.
-        Returns:
-            Callback result.
         """
-        try:
-            return await promise
-        finally:
-            # Finally executes always, except in the case itself was stopped.
-            if not self._direct_cancellation:
-                await resolve_awaitable(on_resolution(), self.loop)
+        self._resolution = resolution
+        self._chain(self._callback())
+
+    def _settle(self, _: T.Any) -> None:
+        resolution, self._resolution = self._resolution, None
+
+        assert resolution
+        if resolution.cancelled():
+            self._fut.cancel()
+        else:
+            exc = resolution.exception()
+            if exc is None:
+                self._fut.set_result(resolution.result())
+            else:
+                self._fut.set_exception(exc)
@@ -7,6 +7,10 @@ diversity of other observables and observers.
 
 # Project
 from .multi_stream import MultiStream
+from .replay_stream import ReplayStream
+from .routed_stream import RoutedStream
 from .single_stream import SingleStream
+from .behavior_stream import BehaviorStream
+from .shared_memory_stream import SharedMemoryStream
 
 Stream = MultiStream
@@ -0,0 +1,47 @@
+__all__ = ("BehaviorStream",)
+
+# Internal
+import typing as T
+
+# Project
+from .replay_stream import ReplayStream
+
+# Generic Types
+K = T.TypeVar("K")
+
+_EMPTY = object()
+
+
+class BehaviorStream(ReplayStream[K]):
+    """Hot stream that holds its latest data, and delivers it to new observers.
+
+    Same as a :class:`~.ReplayStream` that caches a single data.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, value: T.Any = _EMPTY, **kwargs: T.Any) -> None:
+        """BehaviorStream constructor.
+
+        Arguments:
+            value: Initial value. If omitted, stream holds nothing until it receives data.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(1, **kwargs)
+
+        if value is not _EMPTY:
+            self._record((value,))
+
+    @property
+    def value(self) -> K:
+        """Latest data received by this stream.
+
+        Raises:
+            LookupError: If stream holds no data.
+
+        """
+        if not self._buffer:
+            raise LookupError("BehaviorStream holds no data")
+
+        return self._buffer[-1][1]
@@ -2,11 +2,15 @@ __all__ = ("MultiStream",)
 
 # Internal
 import typing as T
-from asyncio import ALL_COMPLETED, Event, Future, InvalidStateError, wait
+from asyncio import ALL_COMPLETED, Future, InvalidStateError, wait
+from functools import partial
 from contextlib import suppress
 
 # Project
-from ..error import MultiStreamError, ObserverClosedError
+from ..error import MultiStreamError, BufferOverflowError, ObserverClosedError
+from ..overflow import Lag, Overflow
+from ..misc.eager import eager
+from ..misc.mailbox import Mailbox
 from ..abstract.observer import Observer
 from ..abstract.observable import Observable
 from ..disposable.anonymous_disposable import AnonymousDisposable
@@ -16,22 +20,6 @@ J = T.TypeVar("J")
 K = T.TypeVar("K")
 
 
-# Observation dispose
-async def dispose_observation(
-    dispose_event: Event, observers: T.List[Observer[K, T.Any]], observer: Observer[K, T.Any]
-) -> None:
-    # Wait external signal
-    await dispose_event.wait()
-
-    try:
-        observers.remove(observer)
-    except ValueError:
-        pass  # Already removed ignore
-
-    if not (observer.closed or observer.keep_alive):
-        await observer.aclose()
-
-
 class MultiStream(Observer[K, None], Observable[K]):
     """Hot stream that can be observed by multiple observers.
 
@@ -41,46 +29,153 @@ class MultiStream(Observer[K, None], Observable[K]):
         there are currently no observer running.
     """
 
-    def __init__(self, **kwargs: T.Any) -> None:
+    __slots__ = ("_maxsize", "_overflow", "_observers", "_mailboxes")
+
+    def __init__(
+        self,
+        *,
+        maxsize: T.Optional[int] = None,
+        overflow: Overflow = Overflow.BLOCK,
+        **kwargs: T.Any,
+    ) -> None:
         """MultiStream constructor.
 
         Arguments:
+            maxsize: Enables decoupled mode, where each observer receives data
+                from its own bounded queue and task, so slow observers don't
+                stall the others. By default data is delivered directly to all
+                observers, at the pace of the slowest one.
+            overflow: Policy applied when an observer queue is full.
             kwargs: Keyword parameters for super.
 
+        Raises:
+            ValueError: If maxsize isn't positive.
+
         """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
         super().__init__(**kwargs)
 
+        self._maxsize = maxsize
+        self._overflow = overflow
+
         # Internal
-        self._observers: T.List[Observer[K, T.Any]] = []
+        # Subscribed observers, mapped to the listener that forgets them once they close
+        self._observers: T.Dict[Observer[K, T.Any], T.Callable[[], T.Any]] = {}
+        self._mailboxes: T.Optional[T.Dict[Observer[K, T.Any], Mailbox[K]]] = (
+            None if maxsize is None else {}
+        )
 
-    async def __asend__(self, value: K) -> None:
-        send_event = tuple(obv.asend(value) for obv in self._observers if not obv.closed)
-        if send_event:
-            awaitable = wait(send_event, return_when=ALL_COMPLETED)
+    def lag(self, observer: Observer[K, T.Any]) -> T.Optional[Lag]:
+        """Counters of the queue in front of an observer, in decoupled mode.
 
-            # Remove reference early to avoid keeping large objects in memory
-            del value
+        Arguments:
+            observer: Subscribed observer.
 
-            done, pending = await awaitable  # type: T.Set[Future[None]], T.Set[Future[None]]
+        Returns:
+            Queue counters, or None if this stream isn't decoupled or observer isn't subscribed.
 
-            assert not pending
-            for fut in done:
-                exc = fut.exception()
-                if exc and not isinstance(exc, ObserverClosedError):
-                    raise exc
+        """
+        mailbox = self._mailboxes.get(observer, None) if self._mailboxes else None
+        return None if mailbox is None else mailbox.lag
 
-    async def __araise__(self, ex: Exception) -> bool:
-        raise_event = tuple(obv.araise(ex) for obv in self._observers if not obv.closed)
-        if raise_event:
-            done, pending = await wait(
-                raise_event, return_when=ALL_COMPLETED
+    async def _broadcast(self, events: T.Iterable[T.Coroutine[T.Any, T.Any, None]]) -> None:
+        """Deliver events to observers.
+
+        Each event executes synchronously until it finishes or suspends, only
+        the ones that suspend are scheduled as :class:`~asyncio.Task`.
+
+        """
+        error: T.Optional[BaseException] = None
+        pending: T.List["Future[None]"] = []
+        for event in events:
+            try:
+                task = eager(event, self.loop)
+            except ObserverClosedError:
+                continue  # Observer closed midway, ignore
+            except Exception as exc:
+                if error is None:
+                    error = exc
+            else:
+                if task:
+                    pending.append(task)
+
+        if pending:
+            done, pending_ = await wait(
+                pending, return_when=ALL_COMPLETED
             )  # type: T.Set[Future[None]], T.Set[Future[None]]
 
-            assert not pending
+            assert not pending_
             for fut in done:
                 exc = fut.exception()
-                if exc and not isinstance(exc, ObserverClosedError):
-                    raise exc
+                if error is None and exc and not isinstance(exc, ObserverClosedError):
+                    error = exc
+
+        if error:
+            raise error
+
+    def _receivers(self) -> T.Tuple[Observer[K, T.Any], ...]:
+        """Observers that currently receive everything delivered by this stream."""
+        return tuple(self._observers)
+
+    def _subscribers(self, _: K) -> T.Iterable[Observer[K, T.Any]]:
+        """Observers that must receive the given data."""
+        return self._receivers()
+
+    async def _post(
+        self, values: T.Sequence[K], observers: T.Iterable[Observer[K, T.Any]]
+    ) -> None:
+        """Queue data for observers, waiting only for the ones that are full."""
+        assert self._mailboxes is not None
+
+        blocked = []
+        for observer in observers:
+            mailbox = self._mailboxes.get(observer, None)
+            if mailbox is None:
+                continue
+
+            for index, value in enumerate(values):
+                try:
+                    accepted = mailbox.offer(value)
+                except BufferOverflowError as exc:
+                    # Only the observer that can't keep up is notified
+                    mailbox.put_error(exc)
+                    continue
+
+                if not accepted:
+                    blocked.append((mailbox, values[index:]))
+                    break
+
+        for mailbox, remaining in blocked:
+            for value in remaining:
+                await mailbox.put(value)
+
+    async def __asend__(self, value: K) -> None:
+        observers = self._subscribers(value)
+        if self._mailboxes is not None:
+            return await self._post((value,), observers)
+
+        await self._broadcast(obv.asend(value) for obv in observers if not obv.closed)
+
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        observers = self._receivers()
+        if self._mailboxes is not None:
+            return await self._post(values, observers)
+
+        await self._broadcast(obv.asend_batch(values) for obv in observers if not obv.closed)
+
+    async def __araise__(self, ex: Exception) -> bool:
+        observers = self._receivers()
+        if self._mailboxes is not None:
+            for observer in observers:
+                mailbox = self._mailboxes.get(observer, None)
+                if mailbox is not None:
+                    mailbox.put_error(ex)
+
+            return False
+
+        await self._broadcast(obv.araise(ex) for obv in observers if not obv.closed)
 
         return False
 
@@ -89,21 +184,122 @@ class MultiStream(Observer[K, None], Observable[K]):
         with suppress(InvalidStateError):
             self.resolve(None)
 
+        # Release all observers
+        observers, self._observers = self._observers, {}
+        mailboxes, self._mailboxes = self._mailboxes, None if self._mailboxes is None else {}
+        closing = []
+        for observer, listener in observers.items():
+            observer._remove_close_listener(listener)
+            if mailboxes:
+                # Observers receive remaining queued data before closing
+                mailbox = mailboxes.pop(observer)
+                mailbox.close()
+                closing.append(mailbox)
+            elif not (observer.closed or observer.keep_alive):
+                observer._close_soon()
+
+        for mailbox in closing:
+            await mailbox.wait_closed()
+
+    def _register(self, observer: Observer[K, T.Any]) -> None:
+        if self.done():
+            # Stream already released its observers
+            if not (observer.closed or observer.keep_alive):
+                observer._close_soon()
+            return
+
+        # Forget observer as soon as it starts closing
+        listener = partial(self._forget, observer)
+        self._observers[observer] = listener
+        if self._mailboxes is not None:
+            disconnect = partial(self._disconnect, observer)
+            self._mailboxes[observer] = Mailbox(
+                observer, T.cast(int, self._maxsize), self._overflow, disconnect
+            )
+
+        observer._add_close_listener(listener)
+
+    def _forget(self, observer: Observer[K, T.Any]) -> T.Optional[T.Callable[[], T.Any]]:
+        if self._mailboxes:
+            mailbox = self._mailboxes.pop(observer, None)
+            if mailbox is not None:
+                mailbox.stop()
+
+        return self._observers.pop(observer, None)
+
+    def _disconnect(self, observer: Observer[K, T.Any]) -> None:
+        listener = self._forget(observer)
+        if listener is None:
+            return  # Already released
+
+        observer._remove_close_listener(listener)
+        if not (observer.closed or observer.keep_alive):
+            observer._close_soon()
+
+    async def _dispose_observations(self, observers: T.Iterable[Observer[K, T.Any]]) -> None:
+        closing = []
+        for observer in observers:
+            listener = self._forget(observer)
+            if listener is None:
+                continue  # Already released
+
+            observer._remove_close_listener(listener)
+            if not (observer.closed or observer.keep_alive):
+                closing.append(observer.aclose())
+
+        if not closing:
+            return
+
+        done, pending = await wait(
+            closing, return_when=ALL_COMPLETED
+        )  # type: T.Set[Future[bool]], T.Set[Future[bool]]
+
+        assert not pending
+        for fut in done:
+            exc = fut.exception()
+            if exc:
+                raise exc
+
     def __observe__(self, observer: Observer[K, T.Any]) -> AnonymousDisposable:
         # Guard against duplicated observers
         if observer in self._observers:
             raise MultiStreamError(f"{observer} is already observing this stream")
 
-        # Add observer to internal observation list
-        self._observers.append(observer)
+        self._register(observer)
+
+        # Disposing this observation removes observer and closes it
+        return AnonymousDisposable(partial(self._dispose_observations, (observer,)))
+
+    def observe_many(self, observers: T.Iterable[Observer[K, T.Any]]) -> AnonymousDisposable:
+        """Subscribe multiple observers at once.
+
+        Observers are validated before any of them is subscribed.
+
+        Arguments:
+            observers: Observers which will subscribe.
+
+        Raises:
+            ObserverClosedError: If any observer is closed.
+            MultiStreamError: If any observer is duplicated or already observing this stream.
+
+        Returns:
+            Disposable that undoes all these subscriptions.
+
+        """
+        subscribing = tuple(observers)
+
+        for observer in subscribing:
+            if observer.closed:
+                raise ObserverClosedError(observer)
+
+            if observer in self._observers:
+                raise MultiStreamError(f"{observer} is already observing this stream")
 
-        # Set-up dispose execution
-        dispose_event = Event()
-        self.loop.create_task(dispose_observation(dispose_event, self._observers, observer))
+        if len(set(subscribing)) != len(subscribing):
+            raise MultiStreamError("Observers must be unique")
 
-        # When either this stream or observer closes sets dispose_event
-        self.lastly(dispose_event.set)
-        observer.lastly(dispose_event.set)
+        for observer in subscribing:
+            self._register(observer)
 
-        # Sets dispose_event if this observation is disposed
-        return AnonymousDisposable(dispose_event.set)
+        # Disposing these observations removes all observers and closes them
+        return AnonymousDisposable(partial(self._dispose_observations, subscribing))
@@ -0,0 +1,213 @@
+__all__ = ("ReplayStream",)
+
+# Internal
+import typing as T
+from asyncio import Task, wait
+from collections import deque
+
+# Project
+from ..error import BufferOverflowError, ObserverClosedError
+from .multi_stream import MultiStream
+from ..misc.mailbox import Mailbox
+from ..abstract.observer import Observer
+from ..misc.current_task import current_task
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class ReplayStream(MultiStream[K]):
+    """Hot stream that replays its most recent data to new observers.
+
+    Data is cached in a ring buffer, limited by size, by age or by both. Each
+    new observer receives the cached data, then the live data, without gaps or
+    duplicates. While an observer catches up, live data for it is queued after
+    the cached data, and source is held back until it catches up, as it's
+    held back by live observers.
+
+    .. Note::
+
+        Errors are not cached, but they are delivered in order to observers
+        that are catching up.
+    """
+
+    __slots__ = ("_window", "_buffer", "_catching_up", "_catch_up_tasks")
+
+    def __init__(
+        self,
+        maxlen: T.Optional[int] = None,
+        window: T.Optional[float] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        """ReplayStream constructor.
+
+        Arguments:
+            maxlen: Maximum amount of data cached.
+            window: Maximum age, in seconds, of the data cached.
+            kwargs: Keyword parameters for super.
+
+        Raises:
+            ValueError: If neither limit is given, or a limit isn't positive.
+
+        """
+        if maxlen is None and window is None:
+            raise ValueError("ReplayStream requires maxlen, window or both")
+
+        if (maxlen is not None and maxlen < 1) or (window is not None and window <= 0):
+            raise ValueError("ReplayStream limits must be positive")
+
+        super().__init__(**kwargs)
+
+        self._window = window
+
+        # Internal
+        # Cached data, with the loop time it was received at
+        self._buffer: T.Deque[T.Tuple[float, K]] = deque(maxlen=maxlen)
+        # Observers receiving cached data, mapped to the data queued for them meanwhile
+        self._catching_up: T.Dict[Observer[K, T.Any], T.Deque[T.Tuple[bool, T.Any]]] = {}
+        self._catch_up_tasks: T.Set["Task[None]"] = set()
+
+    @property
+    def cached(self) -> T.List[K]:
+        """Data that would be replayed to a new observer."""
+        self._evict()
+        return [value for _, value in self._buffer]
+
+    def _evict(self) -> None:
+        if self._window is None:
+            return
+
+        buffer = self._buffer
+        limit = self.loop.time() - self._window
+        while buffer and buffer[0][0] < limit:
+            buffer.popleft()
+
+    def _record(self, values: T.Sequence[K]) -> None:
+        now = 0.0 if self._window is None else self.loop.time()
+        self._buffer.extend((now, value) for value in values)
+        self._evict()
+
+        for pending in self._catching_up.values():
+            pending.extend((False, value) for value in values)
+
+    def _receivers(self) -> T.Tuple[Observer[K, T.Any], ...]:
+        catching_up = self._catching_up
+        if not catching_up:
+            return tuple(self._observers)
+
+        return tuple(observer for observer in self._observers if observer not in catching_up)
+
+    async def _wait_catch_up(self) -> None:
+        """Wait observers catching up, so data queued for them doesn't grow unbounded."""
+        # Observers sending data back to this stream while catching up don't wait for themselves
+        task = current_task(self.loop)
+        tasks = [catch_up for catch_up in self._catch_up_tasks if catch_up is not task]
+        if tasks:
+            await wait(tasks)
+
+    async def __asend__(self, value: K) -> None:
+        self._record((value,))
+        await super().__asend__(value)
+        await self._wait_catch_up()
+
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        self._record(values)
+        await super().__asend_batch__(values)
+        await self._wait_catch_up()
+
+    async def __araise__(self, ex: Exception) -> bool:
+        for pending in self._catching_up.values():
+            pending.append((True, ex))
+
+        return await super().__araise__(ex)
+
+    async def __aclose__(self) -> None:
+        # Observers catching up are released once they receive everything queued for them
+        for observer in self._catching_up:
+            listener = self._observers.pop(observer, None)
+            if listener:
+                observer._remove_close_listener(listener)
+            if self._mailboxes:
+                self._mailboxes.pop(observer, None)
+
+        await super().__aclose__()
+
+        self._buffer.clear()
+
+        # Wait observers catching up to receive everything queued for them
+        await self._wait_catch_up()
+
+    def _register(self, observer: Observer[K, T.Any]) -> None:
+        super()._register(observer)
+
+        # Stream may have released observer right away
+        if observer not in self._observers:
+            return
+
+        self._evict()
+        if not self._buffer:
+            return
+
+        pending: T.Deque[T.Tuple[bool, T.Any]] = deque(
+            (False, value) for _, value in self._buffer
+        )
+        self._catching_up[observer] = pending
+
+        mailbox = self._mailboxes.get(observer, None) if self._mailboxes else None
+        task = self.loop.create_task(self._catch_up(observer, pending, mailbox))
+        task.add_done_callback(self._catch_up_tasks.discard)
+        self._catch_up_tasks.add(task)
+
+    def _forget(self, observer: Observer[K, T.Any]) -> T.Optional[T.Callable[[], T.Any]]:
+        self._catching_up.pop(observer, None)
+        return super()._forget(observer)
+
+    async def _catch_up(
+        self,
+        observer: Observer[K, T.Any],
+        pending: T.Deque[T.Tuple[bool, T.Any]],
+        mailbox: T.Optional[Mailbox[K]],
+    ) -> None:
+        """Deliver cached and queued data to observer, until it can receive live data."""
+        try:
+            # Observer is live as soon as nothing is queued for it
+            while pending and self._catching_up.get(observer, None) is pending:
+                if observer.closed:
+                    return
+
+                is_error, data = pending.popleft()
+                if is_error:
+                    if mailbox is not None:
+                        mailbox.put_error(data)
+                    else:
+                        await observer.araise(data)
+                    continue
+
+                values = [data]
+                while pending and not pending[0][0]:
+                    values.append(pending.popleft()[1])
+
+                if mailbox is not None:
+                    for value in values:
+                        try:
+                            await mailbox.put(value)
+                        except BufferOverflowError as exc:
+                            mailbox.put_error(exc)
+                else:
+                    await observer.asend_batch(values)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del values, data
+        except ObserverClosedError:
+            return
+        finally:
+            if self._catching_up.get(observer, None) is pending:
+                del self._catching_up[observer]
+
+        # Stream closed while observer was catching up
+        if self.done() and not (observer.closed or observer.keep_alive):
+            if mailbox is not None:
+                mailbox.close()
+                await mailbox.wait_closed()
+            else:
+                observer._close_soon()
@@ -0,0 +1,205 @@
+__all__ = ("RoutedStream",)
+
+# Internal
+import typing as T
+from functools import partial
+
+# Project
+from ..error import MultiStreamError
+from .multi_stream import MultiStream
+from ..abstract.observer import Observer
+from ..abstract.disposable import Disposable
+from ..abstract.observable import Observable
+from ..disposable.anonymous_disposable import AnonymousDisposable
+
+# Generic Types
+K = T.TypeVar("K")
+
+#: Pattern matching any key.
+WILDCARD = "*"
+
+
+class _Node:
+    """Character trie node, holding observers whose prefix ends here."""
+
+    __slots__ = ("children", "observers")
+
+    def __init__(self) -> None:
+        self.children: T.Dict[str, _Node] = {}
+        self.observers: T.Dict[Observer[T.Any, T.Any], None] = {}
+
+
+class _Route(Observable[K]):
+    """Observable of the data routed to a pattern."""
+
+    __slots__ = ("_stream", "_pattern")
+
+    def __init__(self, stream: "RoutedStream[K]", pattern: str, **kwargs: T.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._stream = stream
+        self._pattern = pattern
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> Disposable:
+        return self._stream._observe_route(observer, self._pattern)
+
+
+class RoutedStream(MultiStream[K]):
+    """Hot stream that delivers each data only to observers interested in its key.
+
+    Observers subscribe to a pattern, through :meth:`route`. A pattern is
+    either an exact key, or a prefix followed by ``*``. A lone ``*`` matches
+    any key, and is what observers subscribed directly to the stream use.
+    Interested observers are found through a dict, for exact keys, and a
+    character trie, for prefixes, so dispatch cost depends on the amount of
+    matches rather than on the amount of observers.
+
+    .. Note::
+
+        Errors are delivered to all observers, regardless of their pattern.
+    """
+
+    __slots__ = ("_key", "_trie", "_exact", "_patterns")
+
+    def __init__(self, key: T.Callable[[K], str], **kwargs: T.Any) -> None:
+        """RoutedStream constructor.
+
+        Arguments:
+            key: Function that returns the routing key of each data.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._key = key
+
+        # Internal
+        self._trie = _Node()
+        self._exact: T.Dict[str, T.Dict[Observer[K, T.Any], None]] = {}
+        self._patterns: T.Dict[Observer[K, T.Any], str] = {}
+
+    def route(self, pattern: str) -> Observable[K]:
+        """Observable of the data whose key matches the given pattern.
+
+        Arguments:
+            pattern: Exact key, or prefix followed by ``*``.
+
+        Raises:
+            ValueError: If ``*`` is used anywhere but at the end of the pattern.
+
+        Returns:
+            Observable that subscribes observers to this stream under the pattern.
+
+        """
+        if WILDCARD in pattern[:-1]:
+            raise ValueError("Wildcard is only allowed at the end of a pattern")
+
+        return _Route(self, pattern)
+
+    def _subscribers(self, value: K) -> T.Iterable[Observer[K, T.Any]]:
+        key = self._key(value)
+
+        matches = list(self._exact.get(key, ()))
+
+        node: T.Optional[_Node] = self._trie
+        for char in key:
+            assert node
+            matches.extend(node.observers)
+
+            node = node.children.get(char, None)
+            if node is None:
+                break
+        else:
+            assert node
+            matches.extend(node.observers)
+
+        return matches
+
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        # Group data by observer, keeping their order
+        batches: T.Dict[Observer[K, T.Any], T.List[K]] = {}
+        for value in values:
+            for observer in self._subscribers(value):
+                batch = batches.get(observer, None)
+                if batch is None:
+                    batches[observer] = [value]
+                else:
+                    batch.append(value)
+
+        if self._mailboxes is not None:
+            for observer, batch in batches.items():
+                await self._post(batch, (observer,))
+        else:
+            await self._broadcast(
+                obv.asend_batch(batch) for obv, batch in batches.items() if not obv.closed
+            )
+
+    async def __aclose__(self) -> None:
+        await super().__aclose__()
+
+        self._trie = _Node()
+        self._exact.clear()
+        self._patterns.clear()
+
+    def _observe_route(self, observer: Observer[K, T.Any], pattern: str) -> AnonymousDisposable:
+        # Guard against duplicated observers
+        if observer in self._observers:
+            raise MultiStreamError(f"{observer} is already observing this stream")
+
+        self._register(observer, pattern)
+
+        # Disposing this observation removes observer and closes it
+        return AnonymousDisposable(partial(self._dispose_observations, (observer,)))
+
+    def __observe__(self, observer: Observer[K, T.Any]) -> AnonymousDisposable:
+        return self._observe_route(observer, WILDCARD)
+
+    def _register(self, observer: Observer[K, T.Any], pattern: str = WILDCARD) -> None:
+        super()._register(observer)
+
+        # Stream may have released observer right away
+        if observer not in self._observers:
+            return
+
+        self._patterns[observer] = pattern
+        if pattern.endswith(WILDCARD):
+            node = self._trie
+            for char in pattern[:-1]:
+                child = node.children.get(char, None)
+                if child is None:
+                    child = node.children[char] = _Node()
+                node = child
+
+            node.observers[observer] = None
+        else:
+            self._exact.setdefault(pattern, {})[observer] = None
+
+    def _forget(self, observer: Observer[K, T.Any]) -> T.Optional[T.Callable[[], T.Any]]:
+        pattern = self._patterns.pop(observer, None)
+        if pattern is not None:
+            if pattern.endswith(WILDCARD):
+                self._unindex(self._trie, pattern[:-1], observer)
+            else:
+                observers = self._exact[pattern]
+                del observers[observer]
+                if not observers:
+                    del self._exact[pattern]
+
+        return super()._forget(observer)
+
+    @staticmethod
+    def _unindex(node: _Node, prefix: str, observer: Observer[K, T.Any]) -> bool:
+        """Remove observer from trie, pruning empty nodes.
+
+        Returns:
+            Boolean indicating if node became empty.
+
+        """
+        if prefix:
+            char = prefix[0]
+            if RoutedStream._unindex(node.children[char], prefix[1:], observer):
+                del node.children[char]
+        else:
+            del node.observers[observer]
+
+        return not (node.children or node.observers)
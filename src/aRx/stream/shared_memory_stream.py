@@ -0,0 +1,472 @@
+__all__ = ("SharedMemoryStream", "SharedMemorySender", "SharedMemoryReceiver")
+
+# Internal
+import typing as T
+import pickle
+from os import read, write, set_blocking
+from struct import Struct
+from asyncio import (
+    FIRST_COMPLETED,
+    Future,
+    CancelledError,
+    AbstractEventLoop,
+    InvalidStateError,
+    wait,
+)
+from contextlib import suppress
+from multiprocessing import Pipe, RawArray
+
+# Project
+from ..disposable import AnonymousDisposable
+from ..misc.demand import wait_demand
+from ..abstract.base import Base
+from ..abstract.observer import Observer
+from ..abstract.observable import Observable
+
+# Bytes reserved for the control words at the start of the shared memory
+_HEADER = 64
+
+# Smallest ring buffer, so errors always fit
+_MIN_CAPACITY = 4096
+
+# Control words
+_HEAD = 0  # Total amount of bytes written
+_TAIL = 1  # Total amount of bytes read
+_READER_WAITING = 2
+_WRITER_WAITING = 3
+
+# Each record starts with its payload size and kind, and is aligned to 8 bytes
+_RECORD = Struct("II")
+_DATA = 0
+_WRAP = 1  # Padding until the end of the ring, payload size is the padding size
+_ERROR = 2
+_END = 3
+
+# Interval in which waiting sides re-check the ring, in case a wake up is missed
+_POLL_INTERVAL = 0.01
+
+Buffer = T.Union[bytes, bytearray, memoryview]
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _wake(future: "Future[None]") -> None:
+    with suppress(InvalidStateError):
+        future.set_result(None)
+
+
+class _Ring:
+    """Single producer, single consumer, ring buffer of records in shared memory.
+
+    Each side only writes its own position, so no lock is needed. Positions
+    are published after the records they cover are written or read.
+    """
+
+    __slots__ = ("capacity", "_memory", "_control", "_data", "_readable", "_writable")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+
+        self._memory = RawArray("B", _HEADER + capacity)
+
+        # Pipes used to wake a side waiting for data or for free space
+        self._readable = Pipe(duplex=False)
+        self._writable = Pipe(duplex=False)
+
+        self._attach()
+
+    def __getstate__(self) -> T.Tuple[T.Any, ...]:
+        return self.capacity, self._memory, self._readable, self._writable
+
+    def __setstate__(self, state: T.Tuple[T.Any, ...]) -> None:
+        self.capacity, self._memory, self._readable, self._writable = state
+        self._attach()
+
+    def _attach(self) -> None:
+        view = memoryview(self._memory).cast("B")
+        self._data = view[_HEADER:]
+        self._control = view[:_HEADER].cast("Q")
+
+        # Wake up pipes are drained without blocking
+        set_blocking(self._readable[0].fileno(), False)
+        set_blocking(self._writable[0].fileno(), False)
+
+    @property
+    def empty(self) -> bool:
+        return self._control[_HEAD] == self._control[_TAIL]
+
+    def _notify(self, flag: int, connection: T.Any) -> None:
+        # Only pay for a system call when the other side is waiting
+        if self._control[flag]:
+            self._control[flag] = 0
+            write(connection.fileno(), b"\0")
+
+    async def _wait(
+        self,
+        flag: int,
+        connection: T.Any,
+        ready: T.Callable[[], bool],
+        loop: AbstractEventLoop,
+        stop: T.Optional["Future[None]"] = None,
+    ) -> None:
+        self._control[flag] = 1
+
+        # Re-check after flagging, the other side may have acted in between
+        if ready():
+            self._control[flag] = 0
+            return
+
+        future = loop.create_future()
+        loop.add_reader(connection.fileno(), _wake, future)
+        try:
+            await wait(
+                (future,) if stop is None else (future, stop),
+                timeout=_POLL_INTERVAL,
+                return_when=FIRST_COMPLETED,
+            )
+        finally:
+            loop.remove_reader(connection.fileno())
+            self._control[flag] = 0
+
+        with suppress(BlockingIOError):
+            read(connection.fileno(), 4096)
+
+    def _reserve(self, total: int) -> T.Optional[int]:
+        """Position where a record of the given total size can be written now, if any."""
+        control, capacity = self._control, self.capacity
+        while True:
+            head = control[_HEAD]
+            offset = head % capacity
+            free = capacity - (head - control[_TAIL])
+
+            if offset + total <= capacity:
+                return head if free >= total else None
+
+            # Record doesn't fit before the end, skip to the start of the ring
+            padding = capacity - offset
+            if free < padding:
+                return None
+
+            _RECORD.pack_into(self._data, offset, padding, _WRAP)
+            control[_HEAD] = head + padding
+
+    async def write(
+        self, kind: int, payload: memoryview, loop: AbstractEventLoop, notify: bool = True
+    ) -> None:
+        """Copy a record into the ring, waiting for free space if necessary.
+
+        Arguments:
+            kind: Kind of record.
+            payload: Record content.
+            loop: Event loop where to wait for free space.
+            notify: Whether to wake the reader right away, or leave it to the
+                next record.
+
+        Raises:
+            ValueError: If payload doesn't fit in the ring buffer.
+
+        """
+        size = payload.nbytes
+        total = _RECORD.size + _align(size)
+        if total > self.capacity:
+            raise ValueError(f"Payload of {size} bytes doesn't fit in the shared memory")
+
+        head = self._reserve(total)
+        while head is None:
+            # Reader must be awake to free space
+            self._notify(_READER_WAITING, self._readable[1])
+
+            await self._wait(
+                _WRITER_WAITING,
+                self._writable[0],
+                lambda: self.capacity - (self._control[_HEAD] - self._control[_TAIL]) >= total,
+                loop,
+            )
+
+            head = self._reserve(total)
+
+        offset = head % self.capacity
+        start = offset + _RECORD.size
+        _RECORD.pack_into(self._data, offset, size, kind)
+        self._data[start : start + size] = payload
+
+        # Publish record only after it is fully written
+        self._control[_HEAD] = head + total
+
+        if notify:
+            self._notify(_READER_WAITING, self._readable[1])
+
+    def flush(self) -> None:
+        """Wake the reader, if it is waiting for records."""
+        self._notify(_READER_WAITING, self._readable[1])
+
+    async def wait_readable(self, loop: AbstractEventLoop, stop: "Future[None]") -> None:
+        """Wait until a record is available, or stop is resolved."""
+        await self._wait(_READER_WAITING, self._readable[0], lambda: not self.empty, loop, stop)
+
+    def scan(self, limit: T.Optional[int]) -> T.Tuple[T.List[memoryview], int, int]:
+        """Read available records, without releasing them.
+
+        Returns:
+            Payload views, the position after them, and their kind. Data
+            records are read together, other records are read one at a time.
+
+        """
+        control, data, capacity = self._control, self._data, self.capacity
+
+        head = control[_HEAD]
+        position = control[_TAIL]
+        views: T.List[memoryview] = []
+        while position != head and (limit is None or len(views) < limit):
+            offset = position % capacity
+            size, kind = _RECORD.unpack_from(data, offset)
+            if kind == _WRAP:
+                position += size
+                continue
+
+            if kind != _DATA and views:
+                break
+
+            start = offset + _RECORD.size
+            views.append(data[start : start + size])
+            position += _RECORD.size + _align(size)
+
+            if kind != _DATA:
+                return views, position, kind
+
+        return views, position, _DATA
+
+    def release(self, position: int) -> None:
+        """Free the space of all records before position, to be reused by the writer."""
+        self._control[_TAIL] = position
+        self._notify(_WRITER_WAITING, self._writable[1])
+
+
+class SharedMemorySender(Observer[Buffer, None]):
+    """Observer that writes bytes-like data into a :class:`~.SharedMemoryStream`.
+
+    Data is copied directly into shared memory, without pickling. Data must
+    support the buffer protocol and be C-contiguous, like :class:`bytes` or
+    NumPy arrays. Errors are pickled and close is forwarded to the receiver.
+    """
+
+    __slots__ = ("_ring",)
+
+    def __init__(self, ring: _Ring, **kwargs: T.Any) -> None:
+        """SharedMemorySender constructor.
+
+        Arguments:
+            ring: Shared memory ring buffer.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._ring = ring
+
+    async def __asend__(self, value: Buffer) -> None:
+        await self._ring.write(_DATA, memoryview(value).cast("B"), self.loop)
+
+    async def __asend_batch__(self, values: T.Sequence[Buffer]) -> None:
+        ring = self._ring
+        try:
+            for value in values:
+                if self.closed:
+                    break
+
+                try:
+                    # Reader is only woken once for the whole batch
+                    await ring.write(_DATA, memoryview(value).cast("B"), self.loop, False)
+                except CancelledError:
+                    raise
+                except Exception as exc:
+                    if self.closed:
+                        raise
+
+                    await self.araise(exc)
+        finally:
+            ring.flush()
+
+    async def __araise__(self, exc: Exception) -> bool:
+        try:
+            payload = pickle.dumps(exc)
+        except Exception:
+            payload = pickle.dumps(RuntimeError(repr(exc)))
+
+        if _RECORD.size + len(payload) > self._ring.capacity:
+            payload = pickle.dumps(RuntimeError(f"{type(exc).__qualname__} too big to be sent"))
+
+        await self._ring.write(_ERROR, memoryview(payload), self.loop)
+        return False
+
+    async def __aclose__(self) -> None:
+        try:
+            await self._ring.write(_END, memoryview(b""), self.loop)
+        finally:
+            with suppress(InvalidStateError):
+                self.resolve(None)
+
+
+class SharedMemoryReceiver(Observable[Buffer]):
+    """Observable that reads data from a :class:`~.SharedMemoryStream`.
+
+    Data is delivered as :class:`bytes`, copied out of the shared memory.
+
+    .. Note::
+
+        With ``zero_copy``, data is delivered as :class:`memoryview` over the
+        shared memory itself. Its space is reused as soon as the observer
+        returns from processing it, so views must not be kept. This rules out
+        observers that queue data to process it later, like
+        :class:`~.Buffer`, :class:`~.Conflate` or a decoupled
+        :class:`~.MultiStream`.
+    """
+
+    __slots__ = ("_ring", "_zero_copy")
+
+    @staticmethod
+    async def _worker(
+        ring: _Ring, observer: Observer[Buffer, T.Any], stop: "Future[None]", zero_copy: bool
+    ) -> None:
+        loop = observer.loop
+        try:
+            while not (stop.done() or observer.closed):
+                if observer.demand == 0:
+                    await wait_demand(observer, stop)
+                    continue
+
+                if ring.empty:
+                    await ring.wait_readable(loop, stop)
+                    continue
+
+                views, position, kind = ring.scan(observer.demand)
+                try:
+                    if kind == _END:
+                        break
+
+                    if kind == _ERROR:
+                        await observer.araise(pickle.loads(views[0]))
+                    elif views:
+                        # Views are delivered in place, before their space is released
+                        await observer.asend_batch(
+                            views if zero_copy else [bytes(view) for view in views]
+                        )
+                finally:
+                    # Remove reference early to not hold the shared memory
+                    del views
+
+                    ring.release(position)
+        except CancelledError:
+            raise
+        except Exception as exc:
+            if not observer.closed:
+                await observer.araise(exc)
+
+        if not (observer.closed or observer.keep_alive):
+            await observer.aclose()
+
+    def __init__(self, ring: _Ring, *, zero_copy: bool = False, **kwargs: T.Any) -> None:
+        """SharedMemoryReceiver constructor.
+
+        Arguments:
+            ring: Shared memory ring buffer.
+            zero_copy: Whether data is delivered as views over the shared
+                memory, instead of copies.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        self._zero_copy = zero_copy
+
+        # Internal
+        self._ring: T.Optional[_Ring] = ring
+
+    def __observe__(self, observer: Observer[Buffer, T.Any]) -> AnonymousDisposable:
+        """Schedule shared memory reading and register observer."""
+        stop_future: "Future[None]" = observer.loop.create_future()
+
+        def stop() -> None:
+            with suppress(InvalidStateError):
+                stop_future.set_result(None)
+
+        if self._ring:
+            observer.loop.create_task(
+                SharedMemoryReceiver._worker(self._ring, observer, stop_future, self._zero_copy)
+            )
+
+            # Stop worker as soon as observer starts closing
+            observer._add_close_listener(stop)
+
+            # Only a single consumer is supported
+            self._ring = None
+        elif not (observer.closed or observer.keep_alive):
+            observer.loop.create_task(observer.aclose())
+
+        return AnonymousDisposable(stop)
+
+
+class SharedMemoryStream(Base):
+    """Stream of bytes-like data between two processes, through shared memory.
+
+    Data is written by a single :class:`~.SharedMemorySender`, in one process,
+    into a ring buffer in shared memory, and read by a single
+    :class:`~.SharedMemoryReceiver`, in another process, avoiding pickling and
+    pipes. The stream must be created before the processes are started, and
+    passed to the other process as an argument of
+    :class:`multiprocessing.Process`.
+
+    .. Note::
+
+        The ring buffer relies on aligned 8 bytes writes being atomic and not
+        reordered with previous writes, as in x86-64.
+    """
+
+    __slots__ = ("_ring",)
+
+    def __init__(self, capacity: int = 1 << 20) -> None:
+        """SharedMemoryStream constructor.
+
+        Arguments:
+            capacity: Size, in bytes, of the ring buffer. Data bigger than it
+                can't be sent. Writer waits while the ring buffer is full.
+
+        Raises:
+            ValueError: If capacity is too small.
+
+        """
+        if capacity < _MIN_CAPACITY:
+            raise ValueError(f"capacity must be at least {_MIN_CAPACITY} bytes")
+
+        self._ring = _Ring(_align(capacity))
+
+    @property
+    def capacity(self) -> int:
+        """Size, in bytes, of the ring buffer."""
+        return self._ring.capacity
+
+    def sender(self, **kwargs: T.Any) -> SharedMemorySender:
+        """Observer that writes data into this stream, at the producer process.
+
+        Arguments:
+            kwargs: Keyword parameters for :class:`~.SharedMemorySender`.
+
+        Returns:
+            Observer of the producer side.
+
+        """
+        return SharedMemorySender(self._ring, **kwargs)
+
+    def receiver(self, **kwargs: T.Any) -> SharedMemoryReceiver:
+        """Observable that reads data from this stream, at the consumer process.
+
+        Arguments:
+            kwargs: Keyword parameters for :class:`~.SharedMemoryReceiver`.
+
+        Returns:
+            Observable of the consumer side.
+
+        """
+        return SharedMemoryReceiver(self._ring, **kwargs)
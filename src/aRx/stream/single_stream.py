@@ -7,7 +7,6 @@ from contextlib import suppress
 
 # Project
 from ..error import SingleStreamError
-from ..promise import Promise
 from ..abstract.observer import Observer
 from ..abstract.disposable import Disposable
 from ..abstract.observable import Observable
@@ -26,6 +25,8 @@ class SingleStream(Observer[K, None], Observable[K]):
         wait for the observer action to execute.
     """
 
+    __slots__ = ("_lock", "_observer")
+
     def __init__(self, **kwargs: T.Any) -> None:
         """SingleStream constructor.
 
@@ -36,25 +37,28 @@ class SingleStream(Observer[K, None], Observable[K]):
         super().__init__(**kwargs)
 
         # Internal
-        self._lock: "Future[None]" = self._loop.create_future()
+        self._lock: T.Optional["Future[None]"] = None
         self._observer: T.Optional[Observer[K, T.Any]] = None
-        self._observer_close_promise: T.Optional[Promise[bool]] = None
+
+    def _observed(self) -> "Future[None]":
+        """Future resolved when an observer is assigned, only allocated when first needed."""
+        if self._lock is None:
+            self._lock = self.loop.create_future()
+
+        return self._lock
 
     @property
-    def closed(self) -> bool:
-        """Property that indicates if this stream is closed or not."""
-        return bool(
-            super().closed
-            or (
-                # Also report closed when observer is closed
-                self._observer
-                and self._observer.closed
-            )
-        )
+    def demand(self) -> T.Optional[int]:
+        # Demand flows straight through from the observer
+        return self._demand if self._observer is None else self._observer.demand
+
+    def _demanded(self) -> "Future[None]":
+        return super()._demanded() if self._observer is None else self._observer._demanded()
 
     async def __asend__(self, value: K) -> None:
         # Wait for observer
-        await self._lock
+        if self._observer is None:
+            await self._observed()
 
         # _observer must be available at this point
         assert self._observer
@@ -66,9 +70,25 @@ class SingleStream(Observer[K, None], Observable[K]):
 
         await awaitable
 
+    async def __asend_batch__(self, values: T.Sequence[K]) -> None:
+        # Wait for observer
+        if self._observer is None:
+            await self._observed()
+
+        # _observer must be available at this point
+        assert self._observer
+
+        awaitable = self._observer.asend_batch(values)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del values
+
+        await awaitable
+
     async def __araise__(self, exc: Exception) -> bool:
         # Wait for observer
-        await self._lock
+        if self._observer is None:
+            await self._observed()
 
         # _observer must be available at this point
         assert self._observer
@@ -80,11 +100,12 @@ class SingleStream(Observer[K, None], Observable[K]):
 
     async def __aclose__(self) -> None:
         # Cancel all awaiting event in the case we weren't subscribed
-        self._lock.cancel()
+        if self._lock:
+            self._lock.cancel()
 
-        # Cancel observer close guard
-        if self._observer_close_promise:
-            self._observer_close_promise.cancel()
+        # Stop listening to observer close
+        if self._observer:
+            self._observer._remove_close_listener(self._close_soon)
 
         # Resolve internal future
         with suppress(InvalidStateError):
@@ -107,10 +128,11 @@ class SingleStream(Observer[K, None], Observable[K]):
         # Set stream observer
         self._observer = observer
 
-        # Close Stream when observer closes
-        self._observer_close_promise = observer.lastly(self.aclose)
+        # Close Stream as soon as observer starts closing
+        observer._add_close_listener(self._close_soon)
 
         # Release any awaiting event
-        self._lock.set_result(None)
+        if self._lock:
+            self._lock.set_result(None)
 
         return self
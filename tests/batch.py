@@ -0,0 +1,84 @@
+from asyncio import get_event_loop
+
+from aRx import operator as op
+from aRx.stream import SingleStream
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, observe
+
+
+def record(events):
+    return AnonymousObserver(events.append, lambda exc: events.append(type(exc).__name__))
+
+
+async def run_pipeline(batch_size):
+    events = []
+    source = (
+        FromIterable([3, 2, 0, 4, 12, 0, 6], batch_size)
+        | op.map_op(lambda value, _: 12 // value)
+        | op.filter_op(lambda value, _: value != 1)
+    )
+    observer = record(events)
+    observe(source, observer)
+    await observer
+    return events
+
+
+async def test_batch_iterable_equivalence():
+    expected = [4, 6, "ZeroDivisionError", 3, "ZeroDivisionError", 2]
+    assert await run_pipeline(1) == expected
+    assert await run_pipeline(3) == expected
+    assert await run_pipeline(100) == expected
+
+
+try:
+    get_event_loop().run_until_complete(test_batch_iterable_equivalence())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_batch_stream_equivalence():
+    results = []
+    for batched in (False, True):
+        events = []
+        stream = SingleStream()
+        observer = record(events)
+        observe(stream | op.map_op(lambda value, _: 12 // value), observer)
+
+        values = [1, 0, 2, 3]
+        if batched:
+            await stream.asend_batch(values)
+        else:
+            for value in values:
+                await stream.asend(value)
+
+        await stream.aclose()
+        await observer
+        results.append(events)
+
+    assert results[0] == results[1] == [12, "ZeroDivisionError", 6, 4]
+
+
+try:
+    get_event_loop().run_until_complete(test_batch_stream_equivalence())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_batch_take_boundary():
+    events = []
+    observer = record(events)
+    observe(FromIterable(range(10), 4) | op.take_op(5), observer)
+    await observer
+    assert events == [0, 1, 2, 3, 4]
+
+
+try:
+    get_event_loop().run_until_complete(test_batch_take_boundary())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,54 @@
+"""Time a producer spends sending to a slow observer, directly and through a buffer.
+
+Usage:
+    python tests/benchmarks/buffer.py [events]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import sleep, get_event_loop
+
+from aRx.stream import MultiStream
+from aRx.operator import Buffer
+from aRx.overflow import Overflow
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+async def slow(_):
+    await sleep(0.001)
+
+
+async def bench(events, overflow):
+    stream = MultiStream()
+    observer = AnonymousObserver(slow, araise=lambda _: False)
+    buffer = None
+    if overflow is None:
+        observe(stream, observer)
+    else:
+        buffer = Buffer(64, stream, overflow)
+        observe(buffer, observer)
+
+    start = perf_counter()
+    for i in range(events):
+        await stream.asend(i)
+    sending = perf_counter() - start
+
+    lag = buffer.lag(observer) if buffer else None
+    await stream.aclose()
+    await observer
+    return sending, lag
+
+
+def main(events):
+    loop = get_event_loop()
+    print(f"{'policy':>12} {'producer':>12} {'dropped':>8}")
+    for overflow in (None, *Overflow):
+        sending, lag = loop.run_until_complete(bench(events, overflow))
+        name = overflow.name if overflow else "unbuffered"
+        dropped = lag.dropped if lag else 0
+        print(f"{name:>12} {sending * 1000:>9.1f} ms {dropped:>8}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
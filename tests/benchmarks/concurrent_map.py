@@ -0,0 +1,44 @@
+"""Throughput of an I/O bound asynchronous mapper, for increasing concurrency.
+
+Usage:
+    python tests/benchmarks/concurrent_map.py [items]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import sleep, get_event_loop
+
+from aRx.operator import map_op
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+async def lookup(value, _):
+    # Simulates a network round trip
+    await sleep(0.005)
+    return value
+
+
+async def bench(items, concurrency, ordered):
+    observer = AnonymousObserver(lambda _: None)
+
+    start = perf_counter()
+    observe(
+        FromIterable(range(items)) | map_op(lookup, concurrency=concurrency, ordered=ordered),
+        observer,
+    )
+    await observer
+    return items / (perf_counter() - start)
+
+
+def main(items):
+    loop = get_event_loop()
+    print(f"{'concurrency':>12} {'ordered':>12} {'unordered':>12}")
+    for concurrency in (1, 4, 16, 64):
+        ordered = loop.run_until_complete(bench(items, concurrency, True))
+        unordered = loop.run_until_complete(bench(items, concurrency, False))
+        print(f"{concurrency:>12} {ordered:>8.0f} i/s {unordered:>8.0f} i/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
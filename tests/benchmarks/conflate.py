@@ -0,0 +1,55 @@
+"""Work done by a slow observer, queuing every update against conflating them by key.
+
+Usage:
+    python tests/benchmarks/conflate.py [events]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import sleep, get_event_loop
+
+from aRx.stream import MultiStream
+from aRx.operator import Conflate
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+def key(event):
+    return event[0]
+
+
+async def bench(keys, events, conflate):
+    stream = MultiStream(maxsize=events) if not conflate else MultiStream()
+    delivered = 0
+
+    async def slow(_):
+        nonlocal delivered
+        delivered += 1
+        await sleep(0.001)
+
+    observer = AnonymousObserver(slow)
+    observe(Conflate(key, stream) if conflate else stream, observer)
+
+    start = perf_counter()
+    for i in range(events):
+        await stream.asend((i % keys, i))
+        if i % 100 == 0:
+            await sleep(0)
+    await stream.aclose()
+    await observer
+    return delivered, perf_counter() - start
+
+
+def main(events):
+    loop = get_event_loop()
+    print(f"{'keys':>6} {'queued':>22} {'conflated':>22}")
+    for keys in (1, 10, 100):
+        results = [loop.run_until_complete(bench(keys, events, mode)) for mode in (False, True)]
+        print(
+            f"{keys:>6} "
+            + " ".join(f"{count:>8} calls {elapsed:>6.2f} s" for count, elapsed in results)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
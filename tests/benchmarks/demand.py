@@ -0,0 +1,57 @@
+"""Data read from a source ahead of a slow observer, with and without demand.
+
+Without demand the observer is fed through an unbounded buffer, so the whole
+source is read upfront. Requesting data in windows keeps the source paused
+until the observer catches up.
+
+Usage:
+    python tests/benchmarks/demand.py [items]
+"""
+
+import sys
+from asyncio import sleep, get_event_loop
+
+from aRx.operator import Buffer
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+async def bench(items, window):
+    read = 0
+    ahead = 0
+
+    def source():
+        nonlocal read
+        for i in range(items):
+            read += 1
+            yield i
+
+    received = 0
+
+    async def slow(_):
+        nonlocal ahead, received
+        received += 1
+        ahead = max(ahead, read - received)
+        await sleep(0)
+        if window and observer.demand == 0:
+            observer.request(window)
+
+    observer = AnonymousObserver(slow)
+    if window:
+        observer.request(window)
+
+    observe(Buffer(items, FromIterable(source(), batch_size=16)), observer)
+    await observer
+    return ahead
+
+
+def main(items):
+    loop = get_event_loop()
+    print(f"{'window':>10} {'max read ahead':>15}")
+    for window in (None, 256, 16):
+        ahead = loop.run_until_complete(bench(items, window))
+        print(f"{window or 'unbounded':>10} {ahead:>15}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
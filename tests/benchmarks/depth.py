@@ -0,0 +1,48 @@
+"""Throughput of unfused operator chains against their depth.
+
+Operators are chained without fusion, so every item goes through one sink
+per operator and the closed state is checked at every hop.
+
+Usage:
+    python tests/benchmarks/depth.py [items]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import get_event_loop
+
+from aRx.operator import Map
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+def identity(value, _):
+    return value
+
+
+async def asend(_):
+    pass
+
+
+async def bench(count, depth):
+    source = FromIterable(range(count))
+    for _ in range(depth):
+        source = Map(identity, source)
+
+    observer = AnonymousObserver(asend)
+    start = perf_counter()
+    observe(source, observer)
+    await observer
+    return perf_counter() - start
+
+
+def main(count):
+    loop = get_event_loop()
+    print(f"{'depth':>5} {'items/s':>12} {'us/item/hop':>12}")
+    for depth in (1, 2, 5, 10, 20, 50):
+        elapsed = min(loop.run_until_complete(bench(count, depth)) for _ in range(3))
+        print(f"{depth:>5} {count / elapsed:>12,.0f} {elapsed / count / depth * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,73 @@
+"""Throughput of the iterable sources delivering into a no-op observer.
+
+A synchronous observer lets FromIterable run in pull mode, an asynchronous one
+forces data through the push (asend) path.
+
+Usage:
+    python tests/benchmarks/from_iterable.py [items]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import get_event_loop
+
+from aRx.operator import map_op, filter_op
+from aRx.observable import FromIterable, FromAsyncIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+async def arange(count):
+    for i in range(count):
+        yield i
+
+
+async def asend(_):
+    pass
+
+
+async def bench(source, observer):
+    start = perf_counter()
+    observe(source, observer)
+    await observer
+    return perf_counter() - start
+
+
+def pipeline(source):
+    return (
+        source
+        | map_op(lambda x, _: x + 1)
+        | filter_op(lambda x, _: x % 2)
+        | map_op(lambda x, _: str(x))
+    )
+
+
+def main(count):
+    loop = get_event_loop()
+    for name, factory, make_observer in (
+        (
+            "FromIterable push",
+            lambda: FromIterable(range(count)),
+            lambda: AnonymousObserver(asend),
+        ),
+        ("FromIterable pull", lambda: FromIterable(range(count)), AnonymousObserver),
+        (
+            "FromIterable batched",
+            lambda: FromIterable(range(count), batch_size=64),
+            lambda: AnonymousObserver(asend),
+        ),
+        ("FromAsyncIterable", lambda: FromAsyncIterable(arange(count)), AnonymousObserver),
+        (
+            "pipeline push",
+            lambda: pipeline(FromIterable(range(count))),
+            lambda: AnonymousObserver(asend),
+        ),
+        ("pipeline pull", lambda: pipeline(FromIterable(range(count))), AnonymousObserver),
+    ):
+        elapsed = min(
+            loop.run_until_complete(bench(factory(), make_observer())) for _ in range(3)
+        )
+        print(f"{name:<22} {count / elapsed:>12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,54 @@
+"""Throughput of map pipelines against their depth, with and without operator fusion.
+
+Usage:
+    python tests/benchmarks/fusion.py [items]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import get_event_loop
+
+from aRx.operator import Map, map_op
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+def increment(value, _):
+    return value + 1
+
+
+async def bench(source):
+    observer = AnonymousObserver()
+    start = perf_counter()
+    observe(source, observer)
+    await observer
+    return perf_counter() - start
+
+
+def unfused(count, depth):
+    source = FromIterable(range(count))
+    for _ in range(depth):
+        source = Map(increment, source)
+    return source
+
+
+def fused(count, depth):
+    source = FromIterable(range(count))
+    for _ in range(depth):
+        source = source | map_op(increment)
+    return source
+
+
+def main(count):
+    loop = get_event_loop()
+    print(f"{'depth':>5} {'unfused':>14} {'fused':>14}")
+    for depth in (1, 2, 4, 8, 16):
+        results = [
+            count / min(loop.run_until_complete(bench(factory(count, depth))) for _ in range(3))
+            for factory in (unfused, fused)
+        ]
+        print(f"{depth:>5} " + " ".join(f"{result:>10,.0f} i/s" for result in results))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,69 @@
+"""Event loop responsiveness while draining a blocking iterable, in the loop and in a thread.
+
+A timer task measures how late it wakes up while a source whose iterator
+blocks for every item is drained.
+
+Usage:
+    python tests/benchmarks/jitter.py [items] [blocking time in us]
+"""
+
+import sys
+from time import sleep as block, perf_counter
+from asyncio import sleep, get_event_loop
+from concurrent.futures import ThreadPoolExecutor
+
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+INTERVAL = 0.001
+
+
+def blocking(items, delay):
+    for i in range(items):
+        block(delay)
+        yield i
+
+
+async def timer(lateness):
+    while True:
+        start = perf_counter()
+        await sleep(INTERVAL)
+        lateness.append(perf_counter() - start - INTERVAL)
+
+
+async def bench(items, delay, executor):
+    lateness = []
+    ticker = get_event_loop().create_task(timer(lateness))
+    await sleep(INTERVAL)
+
+    start = perf_counter()
+    received = []
+    observer = AnonymousObserver(received.append)
+    source = FromIterable(blocking(items, delay), batch_size=64, executor=executor)
+    observe(source, observer)
+    await observer
+    assert len(received) == items
+    elapsed = perf_counter() - start
+
+    ticker.cancel()
+    lateness.sort()
+    return elapsed, lateness[len(lateness) * 99 // 100], lateness[-1]
+
+
+def main(items, delay):
+    loop = get_event_loop()
+    print(f"{'mode':>8} {'total':>10} {'p99 jitter':>12} {'max jitter':>12}")
+    with ThreadPoolExecutor(1) as executor:
+        for name, mode in (("loop", None), ("thread", executor)):
+            elapsed, p99, worst = loop.run_until_complete(bench(items, delay, mode))
+            print(
+                f"{name:>8} {elapsed * 1000:>7.0f} ms"
+                f" {p99 * 1000:>9.2f} ms {worst * 1000:>9.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        (float(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1e6,
+    )
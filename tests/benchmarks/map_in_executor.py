@@ -0,0 +1,60 @@
+"""Throughput and event loop latency of a CPU bound mapper run in a process pool.
+
+Usage:
+    python tests/benchmarks/map_in_executor.py [items]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import sleep, get_event_loop
+from concurrent.futures import ProcessPoolExecutor
+
+from aRx.operator import map_in_executor_op
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+def work(value, _):
+    # Simulates a CPU heavy transformation
+    return sum(i * i for i in range(2000 + value % 10))
+
+
+async def ticker(latency):
+    while True:
+        start = perf_counter()
+        await sleep(0.001)
+        latency[0] = max(latency[0], perf_counter() - start - 0.001)
+
+
+async def bench(items, executor, chunksize):
+    latency = [0.0]
+    tick = get_event_loop().create_task(ticker(latency))
+    observer = AnonymousObserver(lambda _: None)
+    operator = map_in_executor_op(work, executor=executor, chunksize=chunksize)
+
+    start = perf_counter()
+    observe(FromIterable(range(items)) | operator, observer)
+    await observer
+    elapsed = perf_counter() - start
+
+    tick.cancel()
+    return items / elapsed, latency[0]
+
+
+def main(items):
+    loop = get_event_loop()
+
+    start = perf_counter()
+    for i in range(items):
+        work(i, i)
+    print(f"{'inline':>10} {items / (perf_counter() - start):>8.0f} i/s")
+
+    with ProcessPoolExecutor() as executor:
+        print(f"{'chunksize':>10} {'throughput':>12} {'loop latency':>14}")
+        for chunksize in (1, 16, 256):
+            rate, latency = loop.run_until_complete(bench(items, executor, chunksize))
+            print(f"{chunksize:>10} {rate:>8.0f} i/s {latency * 1000:>11.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
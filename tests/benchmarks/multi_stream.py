@@ -0,0 +1,71 @@
+"""MultiStream fan-out throughput against the number of subscribers.
+
+Synchronous subscribers are delivered to directly, asynchronous ones suspend
+and must be scheduled. Churn measures subscribing and disposing one observer
+while the stream holds the given number of subscribers.
+
+Usage:
+    python tests/benchmarks/multi_stream.py [deliveries]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import sleep, get_event_loop
+
+from aRx.stream import MultiStream
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+from aRx.abstract.disposable import adispose
+
+
+def send(_):
+    pass
+
+
+async def asend(_):
+    await sleep(0)
+
+
+async def bench(subscribers, items, callback):
+    stream = MultiStream()
+    for _ in range(subscribers):
+        observe(stream, AnonymousObserver(callback))
+
+    start = perf_counter()
+    for i in range(items):
+        await stream.asend(i)
+    elapsed = perf_counter() - start
+
+    await stream.aclose()
+    return elapsed
+
+
+async def churn(subscribers, count):
+    stream = MultiStream()
+    stream.observe_many(AnonymousObserver() for _ in range(subscribers))
+
+    start = perf_counter()
+    for _ in range(count):
+        await adispose(observe(stream, AnonymousObserver()))
+    elapsed = perf_counter() - start
+
+    await stream.aclose()
+    return elapsed
+
+
+def main(deliveries):
+    loop = get_event_loop()
+    print(f"{'subscribers':>11} {'sync':>18} {'async':>18} {'churn':>18}")
+    for subscribers in (1, 10, 100, 1000, 10000, 100000):
+        items = max(deliveries // subscribers, 1)
+        results = [
+            subscribers * items / loop.run_until_complete(bench(subscribers, items, callback))
+            for callback in (send, asend)
+        ]
+        rates = [f"{result:>10,.0f} del/s" for result in results]
+        rates.append(f"{1000 / loop.run_until_complete(churn(subscribers, 1000)):>10,.0f} sub/s")
+        print(f"{subscribers:>11} " + " ".join(rates))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
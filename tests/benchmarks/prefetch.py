@@ -0,0 +1,48 @@
+"""End-to-end time of a paged async source consumed by a slow observer, by prefetch.
+
+Fetching each page and processing it take about the same time, so reading
+ahead should nearly halve the total time.
+
+Usage:
+    python tests/benchmarks/prefetch.py [pages] [latency in ms]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import sleep, get_event_loop
+
+from aRx.observable import FromAsyncIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+async def pages(count, latency):
+    for page in range(count):
+        await sleep(latency)
+        yield page
+
+
+async def bench(count, latency, prefetch):
+    async def process(_):
+        await sleep(latency)
+
+    observer = AnonymousObserver(process)
+
+    start = perf_counter()
+    observe(FromAsyncIterable(pages(count, latency), prefetch=prefetch), observer)
+    await observer
+    return perf_counter() - start
+
+
+def main(count, latency):
+    loop = get_event_loop()
+    print(f"{'prefetch':>8} {'total':>10}")
+    for prefetch in (0, 1, 4):
+        elapsed = loop.run_until_complete(bench(count, latency, prefetch))
+        print(f"{prefetch:>8} {elapsed * 1000:>7.0f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+        (float(sys.argv[2]) if len(sys.argv) > 2 else 5) / 1000,
+    )
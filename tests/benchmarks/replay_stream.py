@@ -0,0 +1,54 @@
+"""Send throughput of a replay stream by cache size, and catch-up time of a late observer.
+
+Send throughput should not depend on the cache size, as eviction is constant
+time.
+
+Usage:
+    python tests/benchmarks/replay_stream.py [events]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import get_event_loop
+
+from aRx.stream import ReplayStream
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+def noop(_):
+    pass
+
+
+async def bench(maxlen, events):
+    stream = ReplayStream(maxlen, window=60)
+    observe(stream, AnonymousObserver(noop))
+
+    start = perf_counter()
+    for i in range(events):
+        await stream.asend(i)
+    sending = perf_counter() - start
+
+    received = []
+    late = AnonymousObserver(received.append)
+
+    start = perf_counter()
+    observe(stream, late)
+    await stream.aclose()
+    await late
+    catch_up = perf_counter() - start
+
+    assert len(received) == min(maxlen, events)
+    return events / sending, catch_up
+
+
+def main(events):
+    loop = get_event_loop()
+    print(f"{'maxlen':>8} {'send':>18} {'catch-up':>12}")
+    for maxlen in (10, 1000, 100000):
+        send, catch_up = loop.run_until_complete(bench(maxlen, events))
+        print(f"{maxlen:>8} {send:>12,.0f} ev/s {catch_up * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
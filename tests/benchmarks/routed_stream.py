@@ -0,0 +1,69 @@
+"""Dispatch throughput of keyed events, filtering on every subscriber against routing.
+
+Each subscriber is interested in a single key, and every event matches a
+single subscriber.
+
+Usage:
+    python tests/benchmarks/routed_stream.py [events]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import get_event_loop
+
+from aRx.stream import MultiStream, RoutedStream
+from aRx.operator import Filter
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+def key(event):
+    return event[0]
+
+
+def noop(_):
+    pass
+
+
+def filtered(subscribers):
+    stream = MultiStream()
+    for i in range(subscribers):
+        topic = f"topic.{i}"
+        interested = Filter(lambda event, _, topic=topic: event[0] == topic, stream)
+        observe(interested, AnonymousObserver(noop))
+    return stream
+
+
+def routed(subscribers):
+    stream = RoutedStream(key)
+    for i in range(subscribers):
+        observe(stream.route(f"topic.{i}"), AnonymousObserver(noop))
+    return stream
+
+
+async def bench(stream, subscribers, events):
+    topics = [(f"topic.{i % subscribers}", i) for i in range(events)]
+
+    start = perf_counter()
+    for event in topics:
+        await stream.asend(event)
+    elapsed = perf_counter() - start
+
+    await stream.aclose()
+    return elapsed
+
+
+def main(events):
+    loop = get_event_loop()
+    print(f"{'subscribers':>11} {'filtered':>18} {'routed':>18}")
+    for subscribers in (10, 100, 1000, 10000):
+        count = max(events * 10 // subscribers, 10)
+        results = [
+            count / loop.run_until_complete(bench(factory(subscribers), subscribers, count))
+            for factory in (filtered, routed)
+        ]
+        print(f"{subscribers:>11} " + " ".join(f"{result:>12,.0f} ev/s" for result in results))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,57 @@
+"""Throughput of a CPU bound pipeline sharded over an increasing amount of processes.
+
+Usage:
+    python tests/benchmarks/shard.py [items] [max workers]
+"""
+
+import os
+import sys
+from time import perf_counter
+from asyncio import get_event_loop
+
+from aRx.operator import map_op, shard_op
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+def work(value, _):
+    # Simulates a CPU heavy transformation
+    return sum(i * i for i in range(2000 + value % 10))
+
+
+def pipeline(source):
+    return source | map_op(work)
+
+
+async def bench(items, workers):
+    observer = AnonymousObserver(lambda _: None)
+    source = FromIterable(range(items))
+
+    start = perf_counter()
+    if workers:
+        observe(source | shard_op(workers, lambda value: value, pipeline), observer)
+    else:
+        observe(pipeline(source), observer)
+
+    await observer
+    return items / (perf_counter() - start)
+
+
+def main(items, max_workers):
+    loop = get_event_loop()
+    baseline = loop.run_until_complete(bench(items, 0))
+    print(f"{'workers':>8} {'throughput':>12} {'speedup':>8}")
+    print(f"{'inline':>8} {baseline:>8.0f} i/s {1:>7.2f}x")
+
+    workers = 1
+    while workers <= max_workers:
+        rate = loop.run_until_complete(bench(items, workers))
+        print(f"{workers:>8} {rate:>8.0f} i/s {rate / baseline:>7.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
@@ -0,0 +1,130 @@
+"""Throughput and latency of data sent between processes, through shared memory and a Queue.
+
+Usage:
+    python tests/benchmarks/shared_memory_stream.py [megabytes]
+"""
+
+import sys
+import time
+from struct import Struct
+from asyncio import sleep, new_event_loop, set_event_loop, get_event_loop
+from multiprocessing import Queue, Process
+
+from aRx.stream import SharedMemoryStream
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+LATENCY_SAMPLES = 200
+TIMESTAMP = Struct("d")
+
+
+def run(coroutine):
+    loop = new_event_loop()
+    set_event_loop(loop)
+    loop.run_until_complete(coroutine)
+
+
+def queue_producer(queue, size, count):
+    payload = bytes(size)
+    for _ in range(count):
+        queue.put(payload)
+    queue.put(None)
+
+
+def queue_pinger(queue):
+    for _ in range(LATENCY_SAMPLES):
+        time.sleep(0.001)
+        queue.put(TIMESTAMP.pack(time.perf_counter()))
+    queue.put(None)
+
+
+def stream_producer(stream, size, count):
+    async def produce():
+        sender = stream.sender()
+        payload = bytes(size)
+        observe(FromIterable(payload for _ in range(count)), sender)
+        await sender
+
+    run(produce())
+
+
+def stream_pinger(stream):
+    async def ping():
+        sender = stream.sender()
+        for _ in range(LATENCY_SAMPLES):
+            await sleep(0.001)
+            await sender.asend(TIMESTAMP.pack(time.perf_counter()))
+        await sender.aclose()
+
+    run(ping())
+
+
+def bench_queue(size, count):
+    queue = Queue()
+    process = Process(target=queue_producer, args=(queue, size, count))
+
+    start = time.perf_counter()
+    process.start()
+    while queue.get() is not None:
+        pass
+    elapsed = time.perf_counter() - start
+
+    process.join()
+
+    queue = Queue()
+    process = Process(target=queue_pinger, args=(queue,))
+    process.start()
+    latencies = []
+    while True:
+        message = queue.get()
+        if message is None:
+            break
+        latencies.append(time.perf_counter() - TIMESTAMP.unpack(message)[0])
+    process.join()
+
+    return elapsed, sum(latencies) / len(latencies)
+
+
+async def bench_stream(size, count, zero_copy):
+    stream = SharedMemoryStream(4 << 20)
+    process = Process(target=stream_producer, args=(stream, size, count))
+    observer = AnonymousObserver()
+
+    start = time.perf_counter()
+    process.start()
+    observe(stream.receiver(zero_copy=zero_copy), observer)
+    await observer
+    elapsed = time.perf_counter() - start
+
+    process.join()
+
+    latencies = []
+    stream = SharedMemoryStream()
+    process = Process(target=stream_pinger, args=(stream,))
+    observer = AnonymousObserver(
+        lambda view: latencies.append(time.perf_counter() - TIMESTAMP.unpack(view)[0])
+    )
+    process.start()
+    observe(stream.receiver(), observer)
+    await observer
+    process.join()
+
+    return elapsed, sum(latencies) / len(latencies)
+
+
+def main(megabytes):
+    loop = get_event_loop()
+    print(f"{'size':>8} {'transport':>10} {'throughput':>14} {'latency':>10}")
+    for size in (64, 4096, 65536, 1 << 20):
+        count = megabytes * (1 << 20) // size
+        for name, (elapsed, latency) in (
+            ("queue", bench_queue(size, count)),
+            ("shared", loop.run_until_complete(bench_stream(size, count, False))),
+            ("zero-copy", loop.run_until_complete(bench_stream(size, count, True))),
+        ):
+            rate = megabytes / elapsed
+            print(f"{size:>8} {name:>10} {rate:>9.1f} MB/s {latency * 1e6:>7.0f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 64)
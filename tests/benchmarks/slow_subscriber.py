@@ -0,0 +1,58 @@
+"""Delivery time to a fast subscriber sharing a MultiStream with a slow one.
+
+In direct mode the stream runs at the pace of its slowest subscriber, in
+decoupled mode each subscriber drains its own bounded queue.
+
+Usage:
+    python tests/benchmarks/slow_subscriber.py [items]
+"""
+
+import sys
+from time import perf_counter
+from asyncio import sleep, get_event_loop
+
+from aRx.stream import MultiStream
+from aRx.overflow import Overflow
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+async def slow(_):
+    await sleep(0.001)
+
+
+async def bench(items, **kwargs):
+    stream = MultiStream(**kwargs)
+    received = []
+    fast, lagging = AnonymousObserver(received.append), AnonymousObserver(slow)
+    observe(stream, fast)
+    observe(stream, lagging)
+
+    start = perf_counter()
+    for i in range(items):
+        await stream.asend(i)
+        await sleep(0)
+    while len(received) < items:
+        await sleep(0)
+    elapsed = perf_counter() - start
+
+    lag = stream.lag(lagging)
+    await stream.aclose()
+    return elapsed, lag
+
+
+def main(items):
+    loop = get_event_loop()
+    print(f"{'mode':<24} {'fast subscriber':>16}  slow subscriber")
+    for name, kwargs in (
+        ("direct", {}),
+        ("decoupled block", dict(maxsize=64)),
+        ("decoupled drop oldest", dict(maxsize=64, overflow=Overflow.DROP_OLDEST)),
+        ("decoupled disconnect", dict(maxsize=64, overflow=Overflow.DISCONNECT)),
+    ):
+        elapsed, lag = loop.run_until_complete(bench(items, **kwargs))
+        print(f"{name:<24} {elapsed * 1000:>13.1f} ms  {lag}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
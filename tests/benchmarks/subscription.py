@@ -0,0 +1,67 @@
+"""Cost of setting up subscriptions: subscriptions per second and bytes per subscription.
+
+Usage:
+    python tests/benchmarks/subscription.py [subscriptions]
+"""
+
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+
+from aRx.stream import SingleStream
+from aRx.operator import Map, Filter
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+def increment(value, _):
+    return value + 1
+
+
+def odd(value, _):
+    return value % 2
+
+
+def observer():
+    return AnonymousObserver()
+
+
+def stream():
+    source = SingleStream()
+    return source, observe(source, AnonymousObserver())
+
+
+def pipeline():
+    source = SingleStream()
+    operators = Map(increment, Filter(odd, Map(increment, source)))
+    return source, observe(operators, AnonymousObserver())
+
+
+def rate(factory, count):
+    start = perf_counter()
+    for _ in range(count):
+        factory()
+    return count / (perf_counter() - start)
+
+
+def size(factory, count):
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    alive = [factory() for _ in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del alive
+    return (end - start) / count
+
+
+def main(count):
+    print(f"{'setup':<10} {'subscriptions/s':>16} {'bytes':>8}")
+    for name, factory in (("observer", observer), ("stream", stream), ("pipeline", pipeline)):
+        result = max(rate(factory, count) for _ in range(3))
+        print(f"{name:<10} {result:>16,.0f} {size(factory, count):>8,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,105 @@
+from asyncio import sleep, get_event_loop
+
+from aRx import operator as op
+from aRx.stream import SingleStream
+from aRx.overflow import Lag, Overflow
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+async def buffer_run(overflow, values):
+    events = []
+    gate = get_event_loop().create_future()
+
+    async def slow(value):
+        events.append(value)
+        if not gate.done():
+            await gate
+
+    source = SingleStream()
+    buffered = source | op.buffer_op(2, overflow)
+    observer = AnonymousObserver(slow, lambda exc: events.append(type(exc).__name__))
+    observe(buffered, observer)
+
+    # Observer is busy with the first value while the others are buffered
+    await source.asend(0)
+    await sleep(0.01)
+    for value in values:
+        await source.asend(value)
+    lag = buffered.lag(observer)
+
+    gate.set_result(None)
+    await source.aclose()
+    await observer
+    return events, lag
+
+
+async def test_buffer_drop_newest():
+    events, lag = await buffer_run(Overflow.DROP_NEWEST, [1, 2, 3, 4])
+    assert lag == Lag(2, 2)
+    assert events == [0, 1, 2]
+
+
+try:
+    get_event_loop().run_until_complete(test_buffer_drop_newest())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_buffer_raise():
+    events, lag = await buffer_run(Overflow.RAISE, [1, 2, 3, 4])
+
+    # Consecutive discarded data is reported once, but counted individually
+    assert lag == Lag(2, 2)
+    assert events == [0, 1, 2, "BufferOverflowError"]
+
+
+try:
+    get_event_loop().run_until_complete(test_buffer_raise())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_buffer_block():
+    loop = get_event_loop()
+    events = []
+    gate = loop.create_future()
+
+    async def slow(value):
+        events.append(value)
+        if not gate.done():
+            await gate
+
+    source = SingleStream()
+    buffered = source | op.buffer_op(2)
+    observer = AnonymousObserver(slow)
+    observe(buffered, observer)
+
+    await source.asend(0)
+    await sleep(0.01)
+    await source.asend_batch([1, 2])
+
+    # Source waits for space instead of discarding data
+    sending = loop.create_task(source.asend(3))
+    await sleep(0.01)
+    assert not sending.done()
+    assert buffered.lag(observer) == Lag(2, 0)
+
+    gate.set_result(None)
+    await sending
+    await source.aclose()
+    await observer
+
+    assert events == [0, 1, 2, 3]
+
+
+try:
+    get_event_loop().run_until_complete(test_buffer_block())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,106 @@
+from asyncio import InvalidStateError, CancelledError, sleep, get_event_loop
+
+from aRx.promise import Promise
+
+
+async def test_chain_promise_resolve():
+    events = []
+
+    async def double(value):
+        await sleep(0)
+        return value * 2
+
+    promise = Promise()
+    chain = promise.then(double).then(lambda value: value + 1).lastly(lambda: events.append("end"))
+    promise.resolve(2)
+
+    assert await chain == 5
+    assert events == ["end"]
+
+
+try:
+    get_event_loop().run_until_complete(test_chain_promise_resolve())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_chain_promise_reject():
+    events = []
+
+    promise = Promise()
+    chain = (
+        promise.then(lambda value: events.append(value))
+        .lastly(lambda: events.append("lastly"))
+        .catch(lambda exc: type(exc).__name__)
+    )
+    promise.reject(ValueError())
+
+    # Rejection skips fulfillment callbacks until a catch
+    assert await chain == "ValueError"
+    assert events == ["lastly"]
+
+    # Chained promises are settled only by their parent
+    for settle in (lambda: chain.resolve(None), lambda: chain.reject(Exception())):
+        try:
+            settle()
+        except InvalidStateError:
+            pass
+        else:
+            raise AssertionError("Chain promise settled externally")
+
+
+try:
+    get_event_loop().run_until_complete(test_chain_promise_reject())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_chain_promise_cancel():
+    events = []
+
+    async def slow(value):
+        try:
+            await sleep(10)
+        except CancelledError:
+            events.append("callback cancelled")
+            raise
+
+    # Parent cancellation propagates down the chain
+    promise = Promise()
+    chain = promise.then(lambda value: value).catch(lambda exc: exc)
+    promise.cancel()
+    try:
+        await chain
+    except CancelledError:
+        pass
+    else:
+        raise AssertionError("Chain wasn't cancelled")
+
+    # Cancelling a chain cancels the awaitable returned by its callback
+    promise = Promise()
+    chain = promise.then(slow)
+    promise.resolve(1)
+    await sleep(0.01)
+    assert chain.cancel()
+    await sleep(0.01)
+    assert events == ["callback cancelled"]
+
+    # Cancelled chain doesn't call its callback
+    promise = Promise()
+    chain = promise.then(events.append)
+    chain.cancel()
+    promise.resolve(2)
+    await sleep(0)
+    assert events == ["callback cancelled"]
+
+
+try:
+    get_event_loop().run_until_complete(test_chain_promise_cancel())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
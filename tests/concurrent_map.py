@@ -0,0 +1,60 @@
+from asyncio import sleep, get_event_loop
+
+from aRx import operator as op
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, observe
+
+
+async def concurrent_map_run(ordered):
+    concurrency = {"active": 0, "peak": 0}
+
+    async def mapper(value, _):
+        concurrency["active"] += 1
+        concurrency["peak"] = max(concurrency["peak"], concurrency["active"])
+        try:
+            # Later data finishes first
+            await sleep((10 - value) * 0.002)
+            if value == 5:
+                raise ValueError(value)
+            return value * 10
+        finally:
+            concurrency["active"] -= 1
+
+    events = []
+    observer = AnonymousObserver(events.append, lambda exc: events.append(type(exc).__name__))
+    source = FromIterable(range(10)) | op.map_op(mapper, concurrency=4, ordered=ordered)
+    observe(source, observer)
+    await observer
+
+    assert concurrency["peak"] == 4
+    return events
+
+
+async def test_concurrent_map_ordered():
+    # Results and errors keep the source order
+    events = await concurrent_map_run(True)
+    assert events == [0, 10, 20, 30, 40, "ValueError", 60, 70, 80, 90]
+
+
+try:
+    get_event_loop().run_until_complete(test_concurrent_map_ordered())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_concurrent_map_unordered():
+    # Results are delivered as they complete
+    events = await concurrent_map_run(False)
+    expected = [0, 10, 20, 30, 40, "ValueError", 60, 70, 80, 90]
+    assert events != expected
+    assert sorted(events, key=str) == sorted(expected, key=str)
+
+
+try:
+    get_event_loop().run_until_complete(test_concurrent_map_unordered())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,74 @@
+from asyncio import sleep, get_event_loop
+
+from aRx import operator as op
+from aRx.stream import SingleStream, BehaviorStream
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+async def test_behavior_stream_value():
+    stream = BehaviorStream(0)
+    assert stream.value == 0
+
+    first = []
+    observe(stream, AnonymousObserver(first.append))
+    await stream.asend_batch([1, 2])
+    assert stream.value == 2
+
+    # New observers receive the current value, then live data
+    second = []
+    observe(stream, AnonymousObserver(second.append))
+    await stream.asend(3)
+    await stream.aclose()
+
+    assert first == [0, 1, 2, 3]
+    assert second == [2, 3]
+
+    try:
+        BehaviorStream().value
+    except LookupError:
+        pass
+    else:
+        raise AssertionError("Empty BehaviorStream has a value")
+
+
+try:
+    get_event_loop().run_until_complete(test_behavior_stream_value())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_conflate_latest_per_key():
+    events = []
+    gate = get_event_loop().create_future()
+
+    async def slow(value):
+        events.append(value)
+        if not gate.done():
+            await gate
+
+    source = SingleStream()
+    observer = AnonymousObserver(slow, lambda exc: events.append(type(exc).__name__))
+    observe(source | op.conflate_op(lambda value: value[0]), observer)
+
+    # Observer is busy with the first value while the others are conflated
+    await source.asend(("a", 0))
+    await source.asend_batch([("a", 1), ("b", 1), ("a", 2)])
+    gate.set_result(None)
+    await source.araise(ValueError())
+
+    await source.asend(("b", 2))
+    await source.aclose()
+    await observer
+
+    assert events == [("a", 0), ("a", 2), ("b", 1), "ValueError", ("b", 2)]
+
+
+try:
+    get_event_loop().run_until_complete(test_conflate_latest_per_key())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,89 @@
+from asyncio import sleep, get_event_loop
+
+from aRx import operator as op
+from aRx.stream import MultiStream
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, observe
+
+
+async def demand_run(source, observer, received):
+    # Observer starts with room for 2 data, then asks for 3 more, then for everything
+    observer.request(2)
+    observe(source, observer)
+
+    await sleep(0.01)
+    assert received == [0, 1]
+    assert observer.demand == 0
+
+    observer.request(3)
+    await sleep(0.01)
+    assert received == [0, 1, 2, 3, 4]
+
+    observer.request(None)
+    await sleep(0.01)
+    assert received == list(range(10))
+
+
+async def test_demand_pull():
+    received = []
+    observer = AnonymousObserver(received.append)
+    source = FromIterable(range(10)) | op.map_op(lambda value, _: value)
+    await demand_run(source, observer, received)
+
+
+try:
+    get_event_loop().run_until_complete(test_demand_pull())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_demand_batch():
+    received = []
+
+    async def asend(value):
+        received.append(value)
+
+    observer = AnonymousObserver(asend)
+    await demand_run(FromIterable(range(10), 4), observer, received)
+
+
+try:
+    get_event_loop().run_until_complete(test_demand_batch())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_demand_mailbox():
+    received = []
+
+    async def asend(value):
+        received.append(value)
+
+    stream = MultiStream(maxsize=10)
+    observer = AnonymousObserver(asend)
+    observer.request(2)
+    observe(stream, observer)
+    await stream.asend_batch(list(range(10)))
+
+    # Queued data waits for the observer to request it
+    await sleep(0.01)
+    assert received == [0, 1]
+    assert stream.lag(observer).pending == 8
+
+    observer.request(None)
+    await sleep(0.01)
+    assert received == list(range(10))
+
+    await stream.aclose()
+
+
+try:
+    get_event_loop().run_until_complete(test_demand_mailbox())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
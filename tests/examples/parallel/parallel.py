@@ -2,10 +2,11 @@ import time
 import asyncio
 import logging
 from threading import current_thread
-from asyncio.futures import wrap_future
 from concurrent.futures import ThreadPoolExecutor
 
-from aioreactive.core import Operators as op, AsyncObservable
+from aRx import operator as op
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
 
 log = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -13,7 +14,7 @@ logging.basicConfig(level=logging.INFO)
 executor = ThreadPoolExecutor(max_workers=10)
 
 
-def long_running(value) -> int:
+def long_running(value, _) -> int:
     print("Long running ({0}) on thread {1}".format(value, current_thread().name))
     time.sleep(3)
     print("Long running, done ({0}) on thread {1}".format(value, current_thread().name))
@@ -21,15 +22,14 @@ def long_running(value) -> int:
 
 
 async def main() -> None:
-    xs = AsyncObservable.from_iterable([1, 2, 3, 4, 5])
+    xs = FromIterable([1, 2, 3, 4, 5])
 
-    async def mapper(value) -> AsyncObservable:
-        fut = executor.submit(long_running, value)
-        return AsyncObservable.unit(wrap_future(fut))
+    # At most 3 long running calls at once
+    ys = xs | op.map_in_executor_op(long_running, executor=executor, concurrency=3)
 
-    ys = xs | op.flat_map(mapper) | op.to_async_iterable()
-    async for x in ys:
-        print(x)
+    listener = AnonymousObserver(print)
+    observe(ys, listener)
+    await listener
 
 
 if __name__ == "__main__":
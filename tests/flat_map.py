@@ -0,0 +1,69 @@
+from asyncio import sleep, get_event_loop
+
+from aRx import operator as op
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, FromAsyncIterable, observe
+
+
+def tracked(concurrency):
+    # Async iterable that keeps count of how many of its kind are running at once
+    async def inner(value):
+        concurrency["active"] += 1
+        concurrency["peak"] = max(concurrency["peak"], concurrency["active"])
+        try:
+            for index in range(3):
+                await sleep(0.001)
+                yield value, index
+        finally:
+            concurrency["active"] -= 1
+
+    return inner
+
+
+async def test_flat_map_max_concurrent():
+    for max_concurrent in (1, 3):
+        concurrency = {"active": 0, "peak": 0}
+        inner = tracked(concurrency)
+
+        received = []
+        observer = AnonymousObserver(received.append)
+        source = FromIterable(range(10)) | op.flat_map_op(
+            lambda value, _: FromAsyncIterable(inner(value)), max_concurrent
+        )
+        observe(source, observer)
+        await observer
+
+        assert concurrency["peak"] == max_concurrent
+        assert sorted(received) == [(value, index) for value in range(10) for index in range(3)]
+
+
+try:
+    get_event_loop().run_until_complete(test_flat_map_max_concurrent())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_merge_max_concurrent():
+    concurrency = {"active": 0, "peak": 0}
+    inner = tracked(concurrency)
+
+    received = []
+    observer = AnonymousObserver(received.append)
+    sources = [FromAsyncIterable(inner(value)) for value in range(5)]
+    observe(op.Merge(*sources, max_concurrent=2), observer)
+    await observer
+
+    # Queued sources are subscribed in order, as earlier ones finish
+    assert concurrency["peak"] == 2
+    assert sorted(received) == [(value, index) for value in range(5) for index in range(3)]
+    assert received[-1] == (4, 2)
+
+
+try:
+    get_event_loop().run_until_complete(test_merge_max_concurrent())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
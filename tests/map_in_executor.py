@@ -0,0 +1,93 @@
+from time import sleep
+from asyncio import get_event_loop
+from concurrent.futures import ThreadPoolExecutor
+
+from aRx import operator as op
+from aRx.stream import SingleStream
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, observe
+
+executor = ThreadPoolExecutor(4)
+
+
+def mapper(value, index):
+    # Later chunks finish first
+    sleep((10 - value) * 0.003)
+    if value == 4:
+        raise ValueError(value)
+
+    assert value == index
+    return value * 10
+
+
+def record(events):
+    return AnonymousObserver(events.append, lambda exc: events.append(type(exc).__name__))
+
+
+async def map_in_executor_run(ordered):
+    events = []
+    observer = record(events)
+    source = FromIterable(range(10)) | op.map_in_executor_op(
+        mapper, executor=executor, chunksize=3, concurrency=3, ordered=ordered
+    )
+    observe(source, observer)
+    await observer
+    return events
+
+
+async def test_map_in_executor_ordered():
+    events = await map_in_executor_run(True)
+    assert events == [0, 10, 20, 30, "ValueError", 50, 60, 70, 80, 90]
+
+
+try:
+    get_event_loop().run_until_complete(test_map_in_executor_ordered())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_map_in_executor_unordered():
+    events = await map_in_executor_run(False)
+
+    # Chunks are delivered as they complete, each one in order
+    chunks = [[0, 10, 20], [30, "ValueError", 50], [60, 70, 80], [90]]
+    assert events != sum(chunks, [])
+    assert len(events) == 10
+    for chunk in chunks:
+        start = events.index(chunk[0])
+        assert events[start : start + len(chunk)] == chunk
+
+
+try:
+    get_event_loop().run_until_complete(test_map_in_executor_unordered())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_map_in_executor_partial_chunk():
+    events = []
+    observer = record(events)
+
+    source = SingleStream()
+    observe(source | op.map_in_executor_op(mapper, executor=executor, chunksize=3), observer)
+
+    # Partial chunks are submitted before errors and close are delivered
+    await source.asend_batch([0, 1])
+    await source.araise(KeyError())
+    await source.asend(2)
+    await source.aclose()
+    await observer
+
+    assert events == [0, 10, "KeyError", 20]
+
+
+try:
+    get_event_loop().run_until_complete(test_map_in_executor_partial_chunk())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
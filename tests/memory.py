@@ -0,0 +1,44 @@
+import gc
+import tracemalloc
+
+from aRx.stream import SingleStream
+from aRx.operator import Map, Filter
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+SUBSCRIPTIONS = 10000
+
+
+def bytes_per_subscription(subscribe):
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    subscriptions = [subscribe() for _ in range(SUBSCRIPTIONS)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(subscriptions) == SUBSCRIPTIONS
+    return (end - start) / SUBSCRIPTIONS
+
+
+def subscribe_stream():
+    source = SingleStream()
+    return source, observe(source, AnonymousObserver())
+
+
+def subscribe_pipeline():
+    source = SingleStream()
+    operators = Map(lambda x, _: x, Filter(lambda x, _: True, Map(lambda x, _: x, source)))
+    return source, observe(operators, AnonymousObserver())
+
+
+for name, subscribe, budget in (
+    ("stream", subscribe_stream, 1536),
+    ("pipeline", subscribe_pipeline, 4096),
+):
+    size = bytes_per_subscription(subscribe)
+    if size <= budget:
+        print("Success")
+    else:
+        print("Failed")
+        print(f"{name}: {size:.0f} bytes per subscription, budget is {budget}")
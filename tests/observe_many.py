@@ -0,0 +1,97 @@
+from asyncio import sleep, get_event_loop
+
+from aRx.error import MultiStreamError, ObserverClosedError
+from aRx.stream import MultiStream
+from aRx.observer import AnonymousObserver
+from aRx.disposable import adispose
+
+
+async def test_observe_many():
+    received = [[], [], []]
+    observers = [AnonymousObserver(values.append) for values in received]
+
+    stream = MultiStream()
+    disposable = stream.observe_many(observers[:2])
+    stream.observe_many(observers[2:])
+
+    await stream.asend(1)
+    await stream.asend_batch([2, 3])
+    assert received == [[1, 2, 3]] * 3
+
+    # Disposing the group closes and removes only its observers
+    await adispose(disposable)
+    assert observers[0].closed and observers[1].closed
+    assert not observers[2].closed
+
+    await stream.asend(4)
+    assert received == [[1, 2, 3], [1, 2, 3], [1, 2, 3, 4]]
+
+    await stream.aclose()
+    await sleep(0)
+    assert observers[2].closed
+
+
+try:
+    get_event_loop().run_until_complete(test_observe_many())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_observe_many_validation():
+    stream = MultiStream()
+    observer = AnonymousObserver()
+    stream.observe_many([observer])
+
+    # Nothing is subscribed when any observer is invalid
+    fresh = AnonymousObserver()
+    for observers in ([fresh, observer], [fresh, fresh]):
+        try:
+            stream.observe_many(observers)
+        except MultiStreamError:
+            pass
+        else:
+            raise AssertionError("Invalid observers subscribed")
+
+    stream.observe_many([fresh])
+    await stream.aclose()
+
+
+try:
+    get_event_loop().run_until_complete(test_observe_many_validation())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_observer_close_unsubscribes():
+    received = []
+    observer = AnonymousObserver(received.append)
+
+    stream = MultiStream()
+    stream.observe_many([observer])
+    await stream.asend(1)
+
+    # Closed observer is removed from the stream, and can't subscribe again
+    await observer.aclose()
+    await stream.asend(2)
+    assert received == [1]
+
+    try:
+        stream.observe_many([observer])
+    except ObserverClosedError:
+        pass
+    else:
+        raise AssertionError("Closed observer subscribed")
+
+    await stream.aclose()
+
+
+try:
+    get_event_loop().run_until_complete(test_observer_close_unsubscribes())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
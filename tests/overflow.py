@@ -0,0 +1,129 @@
+from asyncio import sleep, get_event_loop
+
+from aRx.stream import MultiStream
+from aRx.overflow import Lag, Overflow
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+def gated(events, gate):
+    async def asend(value):
+        events.append(value)
+        if not gate.done():
+            await gate
+
+    return AnonymousObserver(asend, lambda exc: events.append(type(exc).__name__))
+
+
+async def overflow_run(overflow, sends):
+    # Data is sent while the subscriber is busy with the first value
+    events = []
+    gate = get_event_loop().create_future()
+    stream = MultiStream(maxsize=2, overflow=overflow)
+    observer = gated(events, gate)
+    observe(stream, observer)
+
+    await stream.asend(0)
+    await sleep(0.01)
+    for send in sends:
+        await send(stream)
+    lag = stream.lag(observer)
+
+    if not gate.done():
+        gate.set_result(None)
+    await stream.aclose()
+    await sleep(0.01)
+    return events, lag
+
+
+def send(value):
+    return lambda stream: stream.asend(value)
+
+
+def error(stream):
+    return stream.araise(ValueError())
+
+
+async def test_overflow_drop_oldest():
+    events, lag = await overflow_run(Overflow.DROP_OLDEST, [send(1), send(2), send(3)])
+    assert events == [0, 2, 3]
+    assert lag == Lag(2, 1)
+
+
+try:
+    get_event_loop().run_until_complete(test_overflow_drop_oldest())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_overflow_drop_newest():
+    events, lag = await overflow_run(Overflow.DROP_NEWEST, [send(1), send(2), send(3)])
+    assert events == [0, 1, 2]
+    assert lag == Lag(2, 1)
+
+
+try:
+    get_event_loop().run_until_complete(test_overflow_drop_newest())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_overflow_disconnect():
+    events, lag = await overflow_run(Overflow.DISCONNECT, [send(1), send(2), send(3)])
+
+    # Subscriber is removed as soon as its queue overflows
+    assert events == [0]
+    assert lag is None
+
+
+try:
+    get_event_loop().run_until_complete(test_overflow_disconnect())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_overflow_block():
+    loop = get_event_loop()
+    blocked = []
+
+    async def send_blocking(stream):
+        blocked.append(loop.create_task(stream.asend(3)))
+        await sleep(0.01)
+
+    events, lag = await overflow_run(Overflow.BLOCK, [send(1), send(2), send_blocking])
+
+    # Sender waited for space instead of discarding data
+    assert lag == Lag(2, 0)
+    assert blocked[0].done()
+    assert events == [0, 1, 2, 3]
+
+
+try:
+    get_event_loop().run_until_complete(test_overflow_block())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_overflow_keeps_errors():
+    # Queued errors are never discarded, nor take space from data
+    events, lag = await overflow_run(
+        Overflow.DROP_OLDEST, [error, send(1), send(2), send(3), error, send(4)]
+    )
+    assert events == [0, "ValueError", 3, "ValueError", 4]
+    assert lag == Lag(2, 2)
+
+
+try:
+    get_event_loop().run_until_complete(test_overflow_keeps_errors())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,59 @@
+from asyncio import sleep, get_event_loop
+
+from aRx import operator as op
+from aRx.stream import MultiStream
+from aRx.observable import FromIterable, observe
+from aRx.observer import AnonymousObserver
+
+
+async def test_partition_unobserved_branch():
+    odds, evens = FromIterable(range(10)) | op.partition_op(lambda value, _: value % 2 == 1)
+
+    # Data routed to the branch nobody observes is discarded
+    received = []
+    observer = AnonymousObserver(received.append)
+    observe(evens, observer)
+    await observer
+
+    assert received == [0, 2, 4, 6, 8]
+
+
+try:
+    get_event_loop().run_until_complete(test_partition_unobserved_branch())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_partition_single_subscription():
+    source = MultiStream()
+    partition = source | op.partition_op(lambda value, index: value % 3, count=3)
+
+    first, last = [], []
+    observers = [AnonymousObserver(first.append), AnonymousObserver(last.append)]
+    observe(partition[0], observers[0])
+    observe(partition[2], observers[1])
+
+    # Source is subscribed once, however many branches are observed
+    assert partition.connected and len(source._observers) == 1
+
+    await source.asend_batch(list(range(9)))
+    assert first == [0, 3, 6]
+    assert last == [2, 5, 8]
+
+    # and unsubscribed once the last branch observer leaves
+    for observer in observers:
+        await observer.aclose()
+    await sleep(0.01)
+    assert not (partition.connected or source._observers)
+
+    await source.aclose()
+
+
+try:
+    get_event_loop().run_until_complete(test_partition_single_subscription())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
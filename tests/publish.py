@@ -0,0 +1,84 @@
+from asyncio import sleep, get_event_loop
+
+from aRx import operator as op
+from aRx.stream import MultiStream
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+from aRx.disposable import adispose
+
+
+async def test_publish_connect():
+    source = MultiStream()
+    published = source | op.publish_op()
+
+    first, second = [], []
+    observers = [AnonymousObserver(first.append), AnonymousObserver(second.append)]
+    for observer in observers:
+        observe(published, observer)
+
+    # Source is only subscribed on connect, and only once
+    await source.asend(0)
+    assert not (published.connected or source._observers)
+
+    connection = published.connect()
+    published.connect()
+    assert published.connected and len(source._observers) == 1
+
+    await source.asend(1)
+    assert first == second == [1]
+
+    # Disconnecting unsubscribes from source and closes current observers
+    await adispose(connection)
+    await sleep(0)
+    assert not (published.connected or source._observers)
+    assert all(observer.closed for observer in observers)
+
+    await source.aclose()
+
+
+try:
+    get_event_loop().run_until_complete(test_publish_connect())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_ref_count_connect_disconnect():
+    source = MultiStream()
+    shared = source | op.share_op()
+
+    first, second, third = [], [], []
+    first_disposable = observe(shared, AnonymousObserver(first.append))
+    second_observer = AnonymousObserver(second.append)
+    observe(shared, second_observer)
+    assert shared.count == 2 and len(source._observers) == 1
+
+    await source.asend(1)
+
+    # Source stays connected until the last observer leaves
+    await adispose(first_disposable)
+    assert shared.count == 1 and len(source._observers) == 1
+
+    await source.asend(2)
+    await second_observer.aclose()
+    await sleep(0.01)
+    assert shared.count == 0 and not source._observers
+
+    # A later observer connects source again
+    observe(shared, AnonymousObserver(third.append))
+    await source.asend(3)
+
+    assert first == [1]
+    assert second == [1, 2]
+    assert third == [3]
+
+    await source.aclose()
+
+
+try:
+    get_event_loop().run_until_complete(test_ref_count_connect_disconnect())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,76 @@
+from asyncio import sleep, get_event_loop
+from itertools import count
+
+from aRx import operator as op
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, observe
+
+
+async def test_pull_mode_yield_every():
+    received = []
+    observer = AnonymousObserver(received.append)
+    observe(FromIterable(range(100), yield_every=10), observer)
+
+    # Other tasks run every yield_every values
+    seen = []
+    while not observer.done():
+        seen.append(len(received))
+        await sleep(0)
+
+    assert received == list(range(100))
+    assert all(later - earlier <= 10 for earlier, later in zip(seen, seen[1:]))
+    assert len(seen) >= 10
+
+
+try:
+    get_event_loop().run_until_complete(test_pull_mode_yield_every())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_pull_mode_stops_on_close():
+    received = []
+    observer = AnonymousObserver(received.append)
+    observe(FromIterable(count(), yield_every=5), observer)
+
+    await sleep(0)
+    await sleep(0)
+    await observer.aclose()
+
+    # Iterator isn't read anymore once the observer is closed
+    amount = len(received)
+    await sleep(0.01)
+    assert 0 < amount == len(received)
+
+
+try:
+    get_event_loop().run_until_complete(test_pull_mode_stops_on_close())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_pull_mode_fused_stages():
+    received = []
+    observer = AnonymousObserver(received.append)
+    source = (
+        FromIterable(count(), yield_every=4)
+        | op.map_op(lambda value, _: value * 2)
+        | op.filter_op(lambda value, _: value % 3 == 0)
+        | op.take_op(5)
+    )
+    observe(source, observer)
+    await observer
+
+    assert received == [0, 6, 12, 18, 24]
+
+
+try:
+    get_event_loop().run_until_complete(test_pull_mode_fused_stages())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,85 @@
+from asyncio import sleep, get_event_loop
+
+from aRx.stream import ReplayStream
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+
+
+async def test_replay_size_bound():
+    stream = ReplayStream(maxlen=3)
+    await stream.asend_batch([0, 1, 2, 3])
+    await stream.asend(4)
+    assert stream.cached == [2, 3, 4]
+
+    received = []
+    observe(stream, AnonymousObserver(received.append))
+    await stream.asend(5)
+    await stream.aclose()
+
+    assert received == [2, 3, 4, 5]
+
+
+try:
+    get_event_loop().run_until_complete(test_replay_size_bound())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_replay_time_bound():
+    stream = ReplayStream(window=0.05)
+    await stream.asend_batch([0, 1])
+    await sleep(0.1)
+    await stream.asend(2)
+
+    received = []
+    observe(stream, AnonymousObserver(received.append))
+    await stream.aclose()
+
+    assert received == [2]
+
+
+try:
+    get_event_loop().run_until_complete(test_replay_time_bound())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def catch_up_run(**kwargs):
+    events = []
+
+    async def slow(value):
+        events.append(value)
+        await sleep(0.001)
+
+    stream = ReplayStream(maxlen=100, **kwargs)
+    await stream.asend_batch(list(range(10)))
+
+    # Live data arrives while the observer is still receiving the cache
+    observer = AnonymousObserver(slow, lambda exc: events.append(type(exc).__name__))
+    observe(stream, observer)
+    for value in range(10, 20):
+        await stream.asend(value)
+        if value == 14:
+            await stream.araise(ValueError())
+
+    await stream.aclose()
+    await observer
+    return events
+
+
+async def test_replay_catch_up():
+    expected = list(range(15)) + ["ValueError"] + list(range(15, 20))
+    assert await catch_up_run() == expected
+    assert await catch_up_run(maxsize=4) == expected
+
+
+try:
+    get_event_loop().run_until_complete(test_replay_catch_up())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
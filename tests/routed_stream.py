@@ -0,0 +1,70 @@
+from asyncio import get_event_loop
+
+from aRx.stream import RoutedStream
+from aRx.observable import observe
+from aRx.observer import AnonymousObserver
+from aRx.disposable import adispose
+
+
+async def test_routed_stream_matching():
+    stream = RoutedStream(lambda value: value[0])
+    received = {pattern: [] for pattern in ("a.b", "a.*", "a.b*", "*", "b.*")}
+    for pattern, values in received.items():
+        observe(stream.route(pattern), AnonymousObserver(values.append))
+
+    direct = []
+    observe(stream, AnonymousObserver(direct.append))
+
+    events = [("a.b", 1), ("a.c", 2), ("b", 3), ("a.bc", 4), ("b.a", 5)]
+    await stream.asend(events[0])
+    await stream.asend_batch(events[1:])
+    await stream.aclose()
+
+    assert received["a.b"] == [("a.b", 1)]
+    assert received["a.*"] == [("a.b", 1), ("a.c", 2), ("a.bc", 4)]
+    assert received["a.b*"] == [("a.b", 1), ("a.bc", 4)]
+    assert received["*"] == direct == events
+    assert received["b.*"] == [("b.a", 5)]
+
+
+try:
+    get_event_loop().run_until_complete(test_routed_stream_matching())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_routed_stream_unsubscribe():
+    stream = RoutedStream(lambda value: value)
+    exact, prefix = [], []
+    exact_disposable = observe(stream.route("ab"), AnonymousObserver(exact.append))
+    prefix_observer = AnonymousObserver(prefix.append)
+    observe(stream.route("a*"), prefix_observer)
+
+    await stream.asend("ab")
+    await adispose(exact_disposable)
+    await prefix_observer.aclose()
+    await stream.asend("ab")
+
+    # Unsubscribed observers leave no trace in the indexes
+    assert exact == prefix == ["ab"]
+    assert not stream._exact
+    assert not stream._trie.children
+
+    try:
+        stream.route("a*b")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Wildcard accepted in the middle of a pattern")
+
+    await stream.aclose()
+
+
+try:
+    get_event_loop().run_until_complete(test_routed_stream_unsubscribe())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
@@ -0,0 +1,79 @@
+import os
+from asyncio import wait_for, get_event_loop
+
+from aRx import operator as op
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, observe
+
+
+def tag(source):
+    def mapper(value, _):
+        if value == 13:
+            raise ValueError(value)
+
+        return os.getpid(), value
+
+    return source | op.map_op(mapper)
+
+
+def crash(source):
+    def mapper(value, _):
+        if value == 50:
+            os._exit(1)
+
+        return value
+
+    return source | op.map_op(mapper)
+
+
+def record(events):
+    return AnonymousObserver(events.append, lambda exc: events.append(type(exc).__name__))
+
+
+async def test_shard_key_affinity():
+    events = []
+    observer = record(events)
+    observe(FromIterable(range(200)) | op.shard_op(3, lambda value: value % 7, tag), observer)
+    await wait_for(observer, 30)
+
+    # Errors are delivered in place, among the results of their worker
+    assert events.count("ValueError") == 1
+    results = [event for event in events if event != "ValueError"]
+    assert sorted(value for _, value in results) == [value for value in range(200) if value != 13]
+
+    # Each key is handled by a single worker, in order
+    for key in range(7):
+        of_key = [(pid, value) for pid, value in results if value % 7 == key]
+        assert len({pid for pid, _ in of_key}) == 1
+        assert [value for _, value in of_key] == sorted(value for _, value in of_key)
+
+    assert len({pid for pid, _ in results}) == 3
+
+
+try:
+    get_event_loop().run_until_complete(test_shard_key_affinity())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_shard_worker_error():
+    events = []
+    observer = record(events)
+    observe(FromIterable(range(200)) | op.shard_op(2, lambda value: value, crash), observer)
+
+    await wait_for(observer, 30)
+
+    # Data already routed to the dead worker is lost, the others go on
+    assert "ShardWorkerError" in events
+    assert 50 not in events
+    assert all(value in events for value in range(1, 200, 2))
+
+
+try:
+    get_event_loop().run_until_complete(test_shard_worker_error())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
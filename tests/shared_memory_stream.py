@@ -0,0 +1,69 @@
+from asyncio import wait_for, new_event_loop, get_event_loop
+from multiprocessing import get_context
+
+from aRx.stream import SharedMemoryStream
+from aRx.observer import AnonymousObserver
+from aRx.observable import FromIterable, observe
+
+# Payloads of varied sizes, so records keep crossing the end of the small ring
+PAYLOADS = [bytes([index % 256]) * (index * 97 % 1500) for index in range(300)]
+
+
+def produce(stream):
+    async def send():
+        sender = stream.sender()
+        observe(FromIterable(PAYLOADS, batch_size=5), sender)
+        await sender
+
+    new_event_loop().run_until_complete(send())
+
+
+async def shared_memory_run(zero_copy):
+    stream = SharedMemoryStream(4096)
+    process = get_context("fork").Process(target=produce, args=(stream,))
+    process.start()
+
+    received = []
+    types = set()
+
+    def collect(data):
+        types.add(type(data))
+        received.append(bytes(data))
+
+    observer = AnonymousObserver(collect)
+    observe(stream.receiver(zero_copy=zero_copy), observer)
+    await wait_for(observer, 30)
+    process.join()
+
+    return received, types
+
+
+async def test_shared_memory_wrap_around():
+    received, types = await shared_memory_run(False)
+
+    # Data survives wrapping around the ring, and is copied out of it
+    assert received == PAYLOADS
+    assert types == {bytes}
+
+
+try:
+    get_event_loop().run_until_complete(test_shared_memory_wrap_around())
+except Exception:
+    print("Failed")
+else:
+    print("Success")
+
+
+async def test_shared_memory_zero_copy():
+    received, types = await shared_memory_run(True)
+
+    assert received == PAYLOADS
+    assert types == {memoryview}
+
+
+try:
+    get_event_loop().run_until_complete(test_shared_memory_zero_copy())
+except Exception:
+    print("Failed")
+else:
+    print("Success")